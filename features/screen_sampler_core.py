@@ -79,11 +79,12 @@ class ScreenSamplerCore:
     @staticmethod
     def capture_and_grid_sample_colors(
         sct_instance, monitor_capture_id: int, overall_region_percentage: dict,
-        adjustments: dict | None = None
+        adjustments: dict | None = None, grid_cols: int = NUM_GRID_COLS
     ) -> tuple[list[tuple[int, int, int]] | None, Image.Image | None]:
         """
         Captures a screen region, immediately downsamples it for massive performance
         gains, applies color enhancements to the small image, and then samples it.
+        grid_cols > 16 samples a wider canvas (e.g. 32/48 for several Fires side by side).
         """
         if not sct_instance:
             return None, None
@@ -103,8 +104,8 @@ class ScreenSamplerCore:
             # --- STEP 1: Capture the (potentially large) region ---
             sct_overall_img = sct_instance.grab(overall_pixel_bbox)
             # --- This check remains important ---
-            if sct_overall_img.width < ScreenSamplerCore.NUM_GRID_COLS or sct_overall_img.height < ScreenSamplerCore.NUM_GRID_ROWS:
-                return [(0, 0, 0)] * 64, None
+            if sct_overall_img.width < grid_cols or sct_overall_img.height < ScreenSamplerCore.NUM_GRID_ROWS:
+                return [(0, 0, 0)] * (ScreenSamplerCore.NUM_GRID_ROWS * grid_cols), None
             # --- STEP 2: Convert to PIL and IMMEDIATELY downsample ---
             # The BGR -> RGB swap must be done before resizing to maintain color integrity.
             pil_img_raw = Image.frombytes(
@@ -134,15 +135,15 @@ class ScreenSamplerCore:
             # --- STEP 4: Grid sample from the small, enhanced image ---
             img_np = np.array(pil_preview_adjusted)
             cell_height = img_np.shape[0] // ScreenSamplerCore.NUM_GRID_ROWS
-            cell_width = img_np.shape[1] // ScreenSamplerCore.NUM_GRID_COLS
+            cell_width = img_np.shape[1] // grid_cols
             # This logic should now be safe since we control the intermediate size
             if cell_height == 0 or cell_width == 0:
-                return [(0, 0, 0)] * 64, pil_preview_adjusted
+                return [(0, 0, 0)] * (ScreenSamplerCore.NUM_GRID_ROWS * grid_cols), pil_preview_adjusted
             cropped_height = cell_height * ScreenSamplerCore.NUM_GRID_ROWS
-            cropped_width = cell_width * ScreenSamplerCore.NUM_GRID_COLS
+            cropped_width = cell_width * grid_cols
             img_cropped = img_np[:cropped_height, :cropped_width]
             reshaped = img_cropped.reshape(ScreenSamplerCore.NUM_GRID_ROWS, cell_height,
-                                            ScreenSamplerCore.NUM_GRID_COLS, cell_width, 3)
+                                            grid_cols, cell_width, 3)
             grid_cells = reshaped.swapaxes(
                 1, 2).reshape(-1, cell_height * cell_width, 3)
             avg_colors_np = np.mean(grid_cells, axis=1).astype(int)
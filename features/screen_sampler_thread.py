@@ -24,6 +24,8 @@ class ScreenSamplerThread(QThread):
         self.adjustments = ScreenSamplerCore.DEFAULT_ADJUSTMENTS.copy()
         self.fullscreen_downscale_dimensions = ScreenSamplerCore.DEFAULT_FULLSCREEN_DOWNSCALE_DIMENSIONS
         self.sampling_mode = "grid"  # Add this line
+        self.grid_columns = ScreenSamplerCore.NUM_GRID_COLS # Wider than 16 when driving several Fires
+        self.rate_scale = 1.0 # < 1.0 while the MIDI link is congested; stretches the sampling interval
 
     def run(self):
         print("ScreenSamplerThread: Thread started.")
@@ -37,9 +39,10 @@ class ScreenSamplerThread(QThread):
                         # Copy all parameters for this loop iteration
                         current_monitor_id = self.monitor_capture_id_to_sample
                         current_region_rect_perc = self.region_rect_percentage.copy()
-                        current_frequency_ms = self.sampling_frequency_ms
+                        current_frequency_ms = self.sampling_frequency_ms / self.rate_scale
                         current_adjustments = self.adjustments.copy()
                         current_mode = self.sampling_mode
+                        current_grid_columns = self.grid_columns
                     start_time = time.perf_counter()
                     try:
                         # --- MODIFIED BLOCK ---
@@ -58,7 +61,8 @@ class ScreenSamplerThread(QThread):
                                     packed_oled_data, oled_preview_image)
                         elif current_mode == "grid":
                             pad_colors, preview_image = ScreenSamplerCore.capture_and_grid_sample_colors(
-                                sct_instance, current_monitor_id, current_region_rect_perc, current_adjustments
+                                sct_instance, current_monitor_id, current_region_rect_perc, current_adjustments,
+                                grid_cols=current_grid_columns
                             )
                             if pad_colors:
                                 self.pad_colors_sampled.emit(pad_colors)
@@ -111,6 +115,15 @@ class ScreenSamplerThread(QThread):
         if not self.isRunning():
             self.start()
 
+    def set_grid_columns(self, columns: int):
+        """Number of pad columns sampled in grid mode (16 per Fire in the device group)."""
+        with QMutexLocker(self._parameters_mutex):
+            self.grid_columns = max(ScreenSamplerCore.NUM_GRID_COLS, int(columns))
+
+    def set_rate_scale(self, scale: float):
+        with QMutexLocker(self._parameters_mutex):
+            self.rate_scale = max(0.1, min(1.0, float(scale)))
+
     def stop_sampling(self, emit_status_on_finish: bool = True):
         # print(f"DEBUG Thread: stop_sampling() called. Setting self._is_running = False. Was: {self._is_running}") # Quieter
         with QMutexLocker(self._parameters_mutex):
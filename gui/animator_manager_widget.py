@@ -104,6 +104,7 @@ class AnimatorManagerWidget(QWidget):
         self.prefab_sequences_base_path = prefab_sequences_base_path
         self.active_sequence_model: SequenceModel | None = None
         self._playback_timer = QTimer(self)
+        self._output_rate_scale = 1.0 # < 1.0 while the MIDI link is congested (see set_output_rate_scale)
         self._clipboard: list[AnimationFrame] = []
         self.is_playing_override_for_ui = False
         self._last_emitted_is_modified = None
@@ -247,7 +248,7 @@ class AnimatorManagerWidget(QWidget):
             self.active_sequence_model.set_frame_delay_ms(delay_ms)
             # If playback is active, update the timer's interval immediately
             if self.active_sequence_model.get_is_playing():
-                self._playback_timer.setInterval(delay_ms)
+                self._playback_timer.setInterval(self._rate_scaled_delay_ms(delay_ms))
 
     def _on_playback_timer_tick(self):
         """
@@ -412,8 +413,8 @@ class AnimatorManagerWidget(QWidget):
         actual_delay_ms = max(min_delay_ms, new_delay_ms)
         # print(f"AMW DEBUG: set_playback_fps: target_fps={fps}, clamped_fps={clamped_fps}, new_delay_ms={actual_delay_ms}") # Optional
         self.active_sequence_model.set_frame_delay_ms(actual_delay_ms)
-        if self.playback_timer.isActive():
-            self.playback_timer.start(actual_delay_ms) # Restart timer with new interval
+        if self._playback_timer.isActive():
+            self._playback_timer.start(self._rate_scaled_delay_ms(actual_delay_ms)) # Restart timer with new interval
         if hasattr(self, 'sequence_controls_widget') and self.sequence_controls_widget:
             self.sequence_controls_widget.set_frame_delay_ui(actual_delay_ms)
         # Notify MainWindow that properties (including potentially unsaved speed) changed
@@ -883,7 +884,7 @@ class AnimatorManagerWidget(QWidget):
             self.playback_status_update.emit("Sequence playing...", 0)
             if self.active_sequence_model and self.active_sequence_model.frame_delay_ms > 0:
                 self._playback_timer.start(
-                    self.active_sequence_model.frame_delay_ms)
+                    self._rate_scaled_delay_ms(self.active_sequence_model.frame_delay_ms))
         else:
             self._playback_timer.stop()
             is_stopped = self.active_sequence_model.get_current_playback_frame_index(
@@ -893,6 +894,18 @@ class AnimatorManagerWidget(QWidget):
         # Notify MainWindow so it can update EXTERNAL components (like the knob label).
         self.animator_playback_active_status_changed.emit(is_playing)
 
+    def set_output_rate_scale(self, scale: float):
+        """
+        Follows AkaiFireController.output_rate_scale_changed: playback slows down while the
+        MIDI link is congested and returns to the sequence's own speed once it clears.
+        """
+        self._output_rate_scale = max(0.1, min(1.0, float(scale)))
+        if self._playback_timer.isActive() and self.active_sequence_model:
+            self._playback_timer.setInterval(self._rate_scaled_delay_ms(self.active_sequence_model.frame_delay_ms))
+
+    def _rate_scaled_delay_ms(self, delay_ms: int) -> int:
+        return int(delay_ms / self._output_rate_scale)
+
     def stop_current_animation_playback(self):
         if self._playback_timer.isActive(): self._playback_timer.stop()
         if self.active_sequence_model.get_is_playing(): self.active_sequence_model.stop_playback()
@@ -1002,7 +1015,7 @@ class AnimatorManagerWidget(QWidget):
 
     def on_controls_frame_delay_changed(self, delay_ms: int):
         self.active_sequence_model.set_frame_delay_ms(delay_ms)
-        if self._playback_timer.isActive(): self._playback_timer.start(delay_ms)
+        if self._playback_timer.isActive(): self._playback_timer.start(self._rate_scaled_delay_ms(delay_ms))
         self.playback_status_update.emit(f"Frame delay set to {delay_ms} ms.", 1500)
 
     def advance_and_play_next_frame(self):
@@ -1387,7 +1400,7 @@ class AnimatorManagerWidget(QWidget):
         self.is_playing_override_for_ui = is_playing
         self.sequence_controls_widget.update_playback_button_state(is_playing)
         if is_playing and self.active_sequence_model:
-            self._playback_timer.start(self.active_sequence_model.frame_delay_ms)
+            self._playback_timer.start(self._rate_scaled_delay_ms(self.active_sequence_model.frame_delay_ms))
             self.playback_status_update.emit("Playback Started...", 2000)
         else:
             self._playback_timer.stop()
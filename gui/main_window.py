@@ -14,12 +14,14 @@ import os
 import re
 import time
 import colorsys
+import itertools
+import numpy as np
 import webbrowser
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QGroupBox, QLabel, QPushButton, QComboBox, QSizePolicy, QSpacerItem,
     QStatusBar, QMenu, QMessageBox, QDial, QFrame, QDialog, QScrollArea,
-    QCheckBox, QSlider, QFileDialog
+    QCheckBox, QSlider, QFileDialog, QInputDialog
 )
 USER_PRESETS_APP_FOLDER_NAME = "Akai Fire RGB Controller User Presets"
 from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal, QPoint, QEvent, QPointF, QRectF
@@ -160,14 +162,20 @@ from .oled_gif_export_dialog import OLEDGifExportDialog
 from .oled_customizer_dialog import OLEDCustomizerDialog
 from .app_guide_dialog import AppGuideDialog
 from .doom_instructions_dialog import DoomInstructionsDialog
+from .midi_diagnostics_dialog import MidiDiagnosticsDialog
 class oled_renderer_placeholder_mw:
         OLED_WIDTH = 128
         OLED_HEIGHT = 64
         @staticmethod
-        def generate_fire_startup_animation(width=128, height=64): return []
+        def generate_fire_startup_animation(width=128, height=64, asset_path=None): return []
+        @staticmethod
+        def iter_fire_startup_animation(width=128, height=64, asset_path=None): return iter([])
+        STARTUP_ANIMATION_ASSET_FILENAME = "fire_startup_animation.bin"
         @staticmethod
         def _unpack_fire_7bit_stream_to_logical_image(
             packed_stream, width, height): return None
+        @staticmethod
+        def unpack_7bit_stream_to_logical_bitmap(packed_stream): return None
 
 if 'oled_renderer' not in globals() or globals().get('oled_renderer') is None:
     oled_renderer = oled_renderer_placeholder_mw()
@@ -179,7 +187,10 @@ from .screen_sampler_manager import ScreenSamplerManager
 from .animator_manager_widget import AnimatorManagerWidget
 from .audio_visualizer_ui_manager import AudioVisualizerUIManager
 from managers.audio_visualizer_manager import AudioVisualizerManager
-from hardware.akai_fire_controller import AkaiFireController
+from hardware.akai_fire_controller import AkaiFireController, hex_colors_to_rgb_array, rgb_tuples_to_array
+from hardware.fire_device_group import FireDeviceGroup, SPAN_MODE_MIRROR, SPAN_MODE_STRETCH
+from hardware.pad_calibration import PAD_CALIBRATION_FILENAME, load_pad_calibration
+from oled_utils.oled_frame import unpack_item_frames
 from managers.oled_display_manager import OLEDDisplayManager
 from managers.hardware_input_manager import HardwareInputManager
 # Near other model/animator imports
@@ -468,7 +479,7 @@ class MainWindow(QMainWindow):
             try:
                 with open(full_item_path, 'r', encoding='utf-8') as f:
                     item_data = json.load(f)
-                return item_data
+                return unpack_item_frames(item_data)
             except Exception as e:
                 print(
                     f"MW Error loading OLED item from '{full_item_path}': {e}")
@@ -624,6 +635,7 @@ class MainWindow(QMainWindow):
         # Create the OLED mirror widget
         self.oled_display_mirror_widget = QLabel(objectName="OLEDMirror", toolTip="Click to open OLED Customizer")
         self.oled_display_mirror_widget.setFixedSize(QSize(int(128 * 1.2), int(64 * 1.2)))
+        self._oled_mirror_color_table = [QColor(Qt.GlobalColor.black).rgb(), QColor(Qt.GlobalColor.white).rgb()]
         self.oled_display_mirror_widget.setStyleSheet("QLabel#OLEDMirror { background-color: black; border: 1px solid #383838; }")
         self._setup_oled_mirror_clickable()
         oled_container_layout.addWidget(self.oled_display_mirror_widget)
@@ -940,8 +952,9 @@ class MainWindow(QMainWindow):
                 self.status_bar.showMessage)
         # Screen Sampler Manager signals
         if self.screen_sampler_manager:
-            self.screen_sampler_manager.sampled_colors_for_display.connect(lambda colors: self.apply_colors_to_main_pad_grid([
-                                                                            QColor(r, g, b).name() for r, g, b in colors], update_hw=True))
+            self.screen_sampler_manager.sampled_colors_for_display.connect(
+                lambda colors: self.apply_rgb_array_to_main_pad_grid(rgb_tuples_to_array(colors), update_hw=True))
+            self.screen_sampler_manager.sampled_canvas_for_display.connect(self._handle_sampler_canvas_colors)
             # --- ADD THIS NEW CONNECTION FOR THE OLED MIRROR ---
             if hasattr(self.screen_sampler_manager, 'oled_frame_for_display'):
                 self.screen_sampler_manager.oled_frame_for_display.connect(self.akai_controller.oled_send_full_bitmap)
@@ -1468,53 +1481,20 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage("Visualizer settings applied.", 2000)
         # If visualizer is active, changes in AVM should take effect.
 
-    def _update_gui_pads_from_visualizer(self, hex_colors_list: list):
+    def _update_gui_pads_from_visualizer(self, rgb_array: np.ndarray):
         if not self.is_visualizer_active or not self.pad_grid_frame:
             return  # Only update GUI if visualizer is active and grid exists
-        if len(hex_colors_list) == 64:
-            for i, hex_color_str in enumerate(hex_colors_list):
-                row, col = divmod(i, 16)
-                try:
-                    q_color = QColor(
-                        hex_color_str if hex_color_str else "#000000")
-                    if not q_color.isValid():
-                        q_color = QColor("#000000")
-                    # update_pad_gui_color expects r, g, b integers
-                    self.pad_grid_frame.update_pad_gui_color(
-                        row, col, q_color.red(), q_color.green(), q_color.blue())
-                except Exception as e:
-                    # This might happen if hex_color_str is malformed beyond QColor's tolerance
-                    # print(f"MW WARN: Error converting visualizer hex color '{hex_color_str}' for GUI pad ({row},{col}): {e}")
-                    self.pad_grid_frame.update_pad_gui_color(
-                        row, col, 0, 0, 0)  # Fallback to black
-        # else:
-            # print(f"MW WARN (_update_gui_pads_from_visualizer): Received incorrect number of colors: {len(hex_colors_list)}")
-
-    def _handle_visualizer_pad_data(self, colors_hex_list: list):
+        self.apply_rgb_array_to_main_pad_grid(rgb_array, update_hw=False)
+
+    def _handle_visualizer_pad_data(self, rgb_array: np.ndarray):
         """
         Slot for AudioVisualizerManager's pad_data_ready signal.
-        Converts hex colors to RGB tuples and sends to the Akai Fire pads.
+        Sends the (64, 3) RGB frame straight to the Akai Fire pads.
         """
         if not (self.akai_controller and self.akai_controller.is_connected() and
                 self.audio_visualizer_manager and self.audio_visualizer_manager.is_capturing):
             return
-        pad_data_for_controller = []
-        if len(colors_hex_list) == 64:
-            for i, hex_color_str in enumerate(colors_hex_list):
-                try:
-                    q_color = QColor(hex_color_str if hex_color_str else "#000000")
-                    if not q_color.isValid():
-                        q_color = QColor("#000000")
-                    pad_data_for_controller.append(
-                        (i, q_color.red(), q_color.green(), q_color.blue())
-                    )
-                except Exception:
-                    pad_data_for_controller.append((i, 0, 0, 0))
-        else:
-            return
-        if not pad_data_for_controller:
-            return
-        self.akai_controller.set_multiple_pads_color(pad_data_for_controller, bypass_global_brightness=True)
+        self.fire_device_group.set_pads_from_array(rgb_array, bypass_global_brightness=True)
 
     def _on_picker_eyedropper_button_toggled(self, checked: bool):
         """
@@ -2166,6 +2146,7 @@ class MainWindow(QMainWindow):
         self._oled_nav_debounce_timer.setInterval(300);
         self.connect_button_animation_timer = QTimer(self)
         self.connect_button_hue_counter = 0
+        self.midi_diagnostics_dialog: MidiDiagnosticsDialog | None = None
         # --- Initialize all UI element attributes to None ---
         self.central_widget_main: QWidget | None = None; 
         self.main_app_layout: QHBoxLayout | None = None;
@@ -2213,6 +2194,10 @@ class MainWindow(QMainWindow):
         if hasattr(self, '_scan_available_oled_items'): self._scan_available_oled_items();
         # --- Instantiate Core Components and Managers ---
         self.akai_controller = AkaiFireController(auto_connect=False);
+        self.fire_device_group = FireDeviceGroup(self.akai_controller, self) # Extra Fires extend the pad canvas to the right
+        self.fire_device_group.devices_changed.connect(self._on_fire_device_group_changed)
+        self.akai_controller.device_connection_changed.connect(self._on_fire_device_connection_changed)
+        self.akai_controller.output_rate_scale_changed.connect(self._on_output_rate_scale_changed)
         self._selected_midi_input_port_name = None;
         self.doom_game_controller = None;
         self.app_guide_button = QPushButton("🚀 App Guide && Hotkeys")
@@ -2345,6 +2330,7 @@ class MainWindow(QMainWindow):
         if self.animator_manager: self.animator_manager.action_stop()
         if self.screen_sampler_manager: self.screen_sampler_manager.stop_sampling_thread()
         if self.oled_display_manager: self.oled_display_manager.begin_external_oled_override()
+        self.fire_device_group.clear_extra_pads() # DOOM's pads are its controls, so it only drives the primary Fire
         try:
             if self.doom_game_controller is not None:
                 self.doom_game_controller.stop_game(); self.doom_game_controller.deleteLater(); self.doom_game_controller = None
@@ -2390,11 +2376,11 @@ class MainWindow(QMainWindow):
                         self.apply_colors_to_main_pad_grid(
                             current_frame_colors, update_hw=True, bypass_global_brightness=False)
                     else:
-                        self.akai_controller.clear_all_pads()
+                        self.fire_device_group.clear_all_pads()
                 else:
-                    self.akai_controller.clear_all_pads()
+                    self.fire_device_group.clear_all_pads()
             else:
-                self.akai_controller.clear_all_pads()
+                self.fire_device_group.clear_all_pads()
         if self.button_lazy_doom: self.button_lazy_doom.setText("👹 LazyDOOM")
         self.status_bar.showMessage("Ready.", 0)
         self._update_global_ui_interaction_states()
@@ -2870,7 +2856,7 @@ class MainWindow(QMainWindow):
         # if not self.oled_display_mirror_widget:
             # print("MW DEBUG: _update_oled_mirror - Mirror widget is None, returning.")
             # return
-        if not (MAIN_WINDOW_OLED_RENDERER_AVAILABLE and hasattr(oled_renderer, '_unpack_fire_7bit_stream_to_logical_image')):
+        if not (MAIN_WINDOW_OLED_RENDERER_AVAILABLE and hasattr(oled_renderer, 'unpack_7bit_stream_to_logical_bitmap')):
             # print("MW DEBUG: _update_oled_mirror - Renderer or unpack function not available.")
             blank_pixmap = QPixmap(self.oled_display_mirror_widget.size())
             blank_pixmap.fill(Qt.GlobalColor.darkGray)
@@ -2887,14 +2873,13 @@ class MainWindow(QMainWindow):
             return
         try:
             # print("MW DEBUG: _update_oled_mirror - Attempting to unpack stream...")
-            pil_image_logical = oled_renderer._unpack_fire_7bit_stream_to_logical_image(
-                packed_bitmap_data_7bit, OLED_MIRROR_WIDTH, OLED_MIRROR_HEIGHT
-            )
-            if pil_image_logical:
-                pil_image_rgb = pil_image_logical.convert("RGB")
-                data = pil_image_rgb.tobytes("raw", "RGB")
-                qimage = QImage(data, pil_image_rgb.width,
-                                pil_image_rgb.height, QImage.Format.Format_RGB888)
+            logical_bitmap = oled_renderer.unpack_7bit_stream_to_logical_bitmap(packed_bitmap_data_7bit)
+            if logical_bitmap is not None:
+                # 0/1 bytes indexed straight into a cached black/white palette, no PIL round trip
+                index_data = logical_bitmap.view('u1').tobytes()
+                qimage = QImage(index_data, OLED_MIRROR_WIDTH, OLED_MIRROR_HEIGHT,
+                                OLED_MIRROR_WIDTH, QImage.Format.Format_Indexed8)
+                qimage.setColorTable(self._oled_mirror_color_table)
                 if not qimage.isNull():
                     #  print("MW DEBUG: _update_oled_mirror - QImage conversion successful.")
                     q_pixmap = QPixmap.fromImage(qimage)
@@ -2914,7 +2899,7 @@ class MainWindow(QMainWindow):
                     self.oled_display_mirror_widget.setPixmap(blank_pixmap)
             else:
                 # print(
-                #     "MW WARNING: _update_oled_mirror - _unpack_fire_7bit_stream_to_logical_image returned None.")
+                #     "MW WARNING: _update_oled_mirror - unpack_7bit_stream_to_logical_bitmap returned None.")
                 blank_pixmap = QPixmap(self.oled_display_mirror_widget.size())
                 blank_pixmap.fill(Qt.GlobalColor.darkBlue)
                 self.oled_display_mirror_widget.setPixmap(blank_pixmap)
@@ -2944,6 +2929,74 @@ class MainWindow(QMainWindow):
         guide_dialog.exec()  # Show as a modal dialog
         guide_dialog.deleteLater()
 
+    def _open_midi_diagnostics_dialog(self):
+        """
+        Shows the non-modal MIDI transport diagnostics panel (created once, reused).
+        """
+        if self.midi_diagnostics_dialog is None:
+            self.midi_diagnostics_dialog = MidiDiagnosticsDialog(self.akai_controller, self)
+        self.midi_diagnostics_dialog.show()
+        self.midi_diagnostics_dialog.raise_()
+        self.midi_diagnostics_dialog.activateWindow()
+
+    def _add_fire_device_to_group(self):
+        """
+        Asks for another Fire output port and adds it to the right edge of the pad canvas.
+        """
+        if not self.akai_controller.is_connected():
+            self.status_bar.showMessage("Connect the main Fire first.", 3000)
+            return
+        used_ports = self.fire_device_group.used_output_ports()
+        candidates = [p for p in AkaiFireController.get_available_output_ports()
+                      if p not in used_ports and ('fire' in p.lower() or 'akai' in p.lower()) and 'midiin' not in p.lower()]
+        if not candidates:
+            QMessageBox.information(self, "Add Fire Device", "No other Fire output ports found.")
+            return
+        port_name, ok = QInputDialog.getItem(self, "Add Fire Device", "Output port:", candidates, 0, False)
+        if not ok or not port_name: return
+        if not self.fire_device_group.add_device(port_name):
+            QMessageBox.warning(self, "Add Fire Device", f"Could not connect MIDI output to '{port_name}'.")
+            return
+        self._apply_pad_calibration(self.fire_device_group.extra_controllers[-1])
+        self.status_bar.showMessage(f"Added '{port_name}' as Fire #{self.fire_device_group.device_count()}.", 3000)
+
+    def _apply_pad_calibration(self, controller: AkaiFireController):
+        """
+        Loads the pad color calibration for the controller's output port from the user settings (if any).
+        """
+        controller.set_pad_calibration(load_pad_calibration(
+            get_user_config_file_path(PAD_CALIBRATION_FILENAME), controller.port_name_used))
+
+    def _on_fire_device_group_changed(self, device_count: int):
+        if getattr(self, 'screen_sampler_manager', None):
+            self.screen_sampler_manager.set_canvas_columns(self.fire_device_group.canvas_columns())
+        if hasattr(self, 'remove_extra_fires_action'):
+            self.remove_extra_fires_action.setEnabled(device_count > 1)
+
+    def _on_fire_device_connection_changed(self, connected: bool):
+        # The controller already reconnected (or is waiting) on its own; this is only for the user
+        if connected:
+            self.status_bar.showMessage(f"Fire reconnected on '{self.akai_controller.port_name_used}'.", 3000)
+        else:
+            self.status_bar.showMessage("Fire unplugged - will reconnect automatically when it is back.", 0)
+
+    def _on_output_rate_scale_changed(self, scale: float):
+        """MIDI link congested (scale < 1) or clear again: producers slow down or return to normal speed."""
+        for producer in (getattr(self, 'screen_sampler_manager', None), getattr(self, 'animator_manager', None),
+                         getattr(self, 'oled_display_manager', None)):
+            if producer and hasattr(producer, 'set_output_rate_scale'): producer.set_output_rate_scale(scale)
+
+    def _on_fire_span_mode_toggled(self, stretch: bool):
+        self.fire_device_group.set_span_mode(SPAN_MODE_STRETCH if stretch else SPAN_MODE_MIRROR)
+
+    def _handle_sampler_canvas_colors(self, colors: list):
+        """
+        Wide grid-mode sample (4 x 16N): every Fire shows its own slice, the GUI grid shows the first one.
+        """
+        canvas = rgb_tuples_to_array(colors).reshape(4, -1, 3)
+        self.apply_rgb_array_to_main_pad_grid(canvas[:, :16], update_hw=False)
+        self.fire_device_group.set_canvas_from_array(canvas)
+
     def _on_animator_undo_redo_state_changed(self, can_undo: bool, can_redo: bool):
         if self.undo_action: self.undo_action.setEnabled(can_undo)
         if self.redo_action: self.redo_action.setEnabled(can_redo)
@@ -3160,12 +3213,24 @@ class MainWindow(QMainWindow):
                 self.pad_grid_frame.update_pad_gui_color(r, c, current_color.red(), current_color.green(), current_color.blue())
         # 2. Update the hardware if requested
         if update_hw and self.akai_controller and self.akai_controller.is_connected():
+            rgb_array = hex_colors_to_rgb_array(colors_to_apply)
+            if rgb_array is not None:
+                self.fire_device_group.set_pads_from_array(rgb_array, bypass_global_brightness=bypass_global_brightness)
+                return
             hw_batch = []
             for i, hex_str in enumerate(colors_to_apply):
                 current_color = QColor(hex_str)
                 hw_batch.append((i, current_color.red(), current_color.green(), current_color.blue()))
             if hw_batch:
-                self.akai_controller.set_multiple_pads_color(hw_batch, bypass_global_brightness=bypass_global_brightness)
+                self.fire_device_group.set_multiple_pads_color(hw_batch, bypass_global_brightness=bypass_global_brightness)
+
+    def apply_rgb_array_to_main_pad_grid(self, rgb_array: np.ndarray, update_hw: bool = True, bypass_global_brightness: bool = False, update_gui: bool = True):
+        """apply_colors_to_main_pad_grid for producers that already have a (64, 3) / (4, 16, 3) uint8 RGB frame."""
+        if update_gui and hasattr(self, 'pad_grid_frame') and self.pad_grid_frame:
+            for i, (r, g, b) in enumerate(np.asarray(rgb_array).reshape(-1, 3).tolist()):
+                self.pad_grid_frame.update_pad_gui_color(i // 16, i % 16, r, g, b)
+        if update_hw and self.akai_controller and self.akai_controller.is_connected():
+            self.fire_device_group.set_pads_from_array(rgb_array, bypass_global_brightness=bypass_global_brightness)
 
     def _on_animator_selection_changed(self, selected_indices: list):
         """
@@ -3185,7 +3250,7 @@ class MainWindow(QMainWindow):
             return
         # Use primary_qcolor instead of selected_qcolor
         r, g, b, _ = self.primary_qcolor.getRgb()
-        self.akai_controller.set_pad_color(row, col, r, g, b)
+        self.fire_device_group.set_pad_color(row, col, r, g, b)
         if self.pad_grid_frame:
             self.pad_grid_frame.update_pad_gui_color(row, col, r, g, b)
         if update_model and self.animator_manager and self.animator_manager.active_sequence_model:
@@ -3195,7 +3260,7 @@ class MainWindow(QMainWindow):
 
     def apply_erase_to_pad(self, row: int, col: int, update_model: bool = True):
         if not self.akai_controller.is_connected(): return
-        self.akai_controller.set_pad_color(row, col, 0, 0, 0)
+        self.fire_device_group.set_pad_color(row, col, 0, 0, 0)
         if self.pad_grid_frame: self.pad_grid_frame.update_pad_gui_color(row, col, 0, 0, 0)
         if update_model and self.animator_manager and self.animator_manager.active_sequence_model: 
             self.animator_manager.active_sequence_model.update_pad_in_current_edit_frame(
@@ -3208,7 +3273,7 @@ class MainWindow(QMainWindow):
             return
         # MODIFIED: Use secondary_qcolor instead of hardcoded black
         r, g, b, _ = self.secondary_qcolor.getRgb()
-        self.akai_controller.set_pad_color(row, col, r, g, b)
+        self.fire_device_group.set_pad_color(row, col, r, g, b)
         if self.pad_grid_frame:
             self.pad_grid_frame.update_pad_gui_color(row, col, r, g, b)
         if update_model and self.animator_manager and self.animator_manager.active_sequence_model:
@@ -3502,6 +3567,21 @@ class MainWindow(QMainWindow):
         customize_oled_action = QAction("✏️ Customize OLED...", self)
         customize_oled_action.triggered.connect(self._open_oled_customizer_dialog)
         oled_menu.addAction(customize_oled_action)
+        midi_diagnostics_action = QAction("📊 MIDI Diagnostics...", self)
+        midi_diagnostics_action.triggered.connect(self._open_midi_diagnostics_dialog)
+        tools_menu.addAction(midi_diagnostics_action)
+        multi_fire_menu = tools_menu.addMenu("🔗 Multiple Fires")
+        add_fire_action = QAction("➕ Add Fire Device...", self)
+        add_fire_action.triggered.connect(self._add_fire_device_to_group)
+        multi_fire_menu.addAction(add_fire_action)
+        stretch_action = QAction("↔️ Stretch 4x16 Content Across Devices", self)
+        stretch_action.setCheckable(True)
+        stretch_action.toggled.connect(self._on_fire_span_mode_toggled)
+        multi_fire_menu.addAction(stretch_action)
+        self.remove_extra_fires_action = QAction("✖️ Remove Extra Devices", self)
+        self.remove_extra_fires_action.triggered.connect(self.fire_device_group.remove_extra_devices)
+        self.remove_extra_fires_action.setEnabled(self.fire_device_group.has_extra_devices())
+        multi_fire_menu.addAction(self.remove_extra_fires_action)
         tools_menu.addSeparator()
         self.launch_doom_action = QAction("👹 Launch LazyDOOM", self)
         self.launch_doom_action.triggered.connect(self._toggle_doom_mode)
@@ -3914,6 +3994,7 @@ class MainWindow(QMainWindow):
             if self.oled_display_manager and self.akai_controller.is_connected():
                 self.oled_display_manager.full_reset()
                 self.oled_display_manager.clear_display_content()
+            self.fire_device_group.remove_extra_devices()
             self.akai_controller.disconnect()
         else:
             # --- CONNECT LOGIC ---
@@ -3926,6 +4007,7 @@ class MainWindow(QMainWindow):
                 self.update_connection_status()
                 return
             if self.akai_controller.connect(out_port, in_port_to_use if can_connect_in else None):
+                self._apply_pad_calibration(self.akai_controller)
                 status_msg = f"Successfully connected to Output: {self.akai_controller.port_name_used}"
                 if self.akai_controller.is_input_connected() and self.akai_controller.in_port_name_used:
                     status_msg += f" | Input: {self.akai_controller.in_port_name_used}"
@@ -3941,10 +4023,13 @@ class MainWindow(QMainWindow):
                     if not self._has_played_initial_builtin_oled_animation:
                         try:
                             if MAIN_WINDOW_OLED_RENDERER_AVAILABLE:
-                                startup_frames = oled_renderer.generate_fire_startup_animation()
-                                if startup_frames:
+                                # Cached frames (memory / user config asset) or a background build that frame 0 plays from
+                                startup_frames = oled_renderer.iter_fire_startup_animation(
+                                    asset_path=get_user_config_file_path(oled_renderer.STARTUP_ANIMATION_ASSET_FILENAME))
+                                first_frame = next(startup_frames, None)
+                                if first_frame is not None:
                                     self.oled_display_manager.play_builtin_startup_animation(
-                                        startup_frames, frame_duration_ms=60)
+                                        itertools.chain([first_frame], startup_frames), frame_duration_ms=60)
                                     self._has_played_initial_builtin_oled_animation = True
                                 else:
                                     if hasattr(self, '_on_builtin_oled_startup_animation_finished'):
@@ -3998,8 +4083,11 @@ class MainWindow(QMainWindow):
             self.oled_display_manager.stop_all_activity() 
             if self.akai_controller and self.akai_controller.is_connected():
                 self.oled_display_manager.clear_display_content() 
+        self.fire_device_group.remove_extra_devices()
+        if self.akai_controller and self.akai_controller.is_capturing(): self.akai_controller.stop_capture()
         if self.akai_controller and (self.akai_controller.is_connected() or self.akai_controller.is_input_connected()):
             self.akai_controller.disconnect()        
+        self.fire_device_group.stop_hotplug_monitor()
         print("MW INFO: Application closeEvent accepted.")
         super().closeEvent(event)
         # print("MW TRACE: closeEvent triggered.")
\ No newline at end of file
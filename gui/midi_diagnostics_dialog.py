@@ -0,0 +1,171 @@
+# AKAI_Fire_RGB_Controller/gui/midi_diagnostics_dialog.py
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
+    QTableWidgetItem, QHeaderView, QAbstractItemView, QComboBox, QFileDialog, QPlainTextEdit
+)
+from PyQt6.QtCore import Qt
+
+try:
+    from hardware.midi_transport_stats import (
+        MESSAGE_CLASS_PAD, MESSAGE_CLASS_OLED, MESSAGE_CLASS_CC, MESSAGE_CLASS_OTHER
+    )
+except ImportError:
+    MESSAGE_CLASS_PAD, MESSAGE_CLASS_OLED, MESSAGE_CLASS_CC, MESSAGE_CLASS_OTHER = "pad_sysex", "oled_sysex", "cc", "other"
+try:
+    from hardware.midi_capture import MidiCaptureReplayer, read_capture, format_summary
+    MIDI_CAPTURE_AVAILABLE = True
+except ImportError:
+    MIDI_CAPTURE_AVAILABLE = False
+
+
+class MidiDiagnosticsDialog(QDialog):
+    """Small live view of AkaiFireController transport stats. Stats are only polled while it is open."""
+    REFRESH_INTERVAL_MS = 500
+    ROWS = [
+        (MESSAGE_CLASS_PAD, "Pad SysEx"),
+        (MESSAGE_CLASS_OLED, "OLED SysEx"),
+        (MESSAGE_CLASS_CC, "CC LEDs"),
+        (MESSAGE_CLASS_OTHER, "Other"),
+    ]
+    REPLAY_SPEEDS = [1.0, 2.0, 4.0, 8.0]
+    COLUMNS = ["Msgs/s", "KB/s", "Blocked ms/s", "Send avg ms", "Send p95 ms", "Send max ms",
+               "Total msgs", "Coalesced", "Dropped"]
+
+    def __init__(self, akai_controller, parent=None):
+        super().__init__(parent)
+        self.akai_controller = akai_controller
+        self.setWindowTitle("MIDI Transport Diagnostics")
+        self.setModal(False)
+        self.setMinimumWidth(760)
+        layout = QVBoxLayout(self)
+        self.status_label = QLabel("Waiting for stats...")
+        layout.addWidget(self.status_label)
+        self.table = QTableWidget(len(self.ROWS), len(self.COLUMNS), self)
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setVerticalHeaderLabels([label for _, label in self.ROWS])
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+        capture_row = QHBoxLayout()
+        self.capture_button = QPushButton("⏺ Start Capture...")
+        self.capture_button.setToolTip("Record all MIDI traffic to and from the Fire into a capture file")
+        self.capture_button.clicked.connect(self._on_capture_clicked)
+        capture_row.addWidget(self.capture_button)
+        self.replay_button = QPushButton("▶ Replay Capture...")
+        self.replay_button.setToolTip("Feed a capture's recorded input back into the app and compare what gets sent")
+        self.replay_button.clicked.connect(self._on_replay_clicked)
+        capture_row.addWidget(self.replay_button)
+        self.replay_speed_combo = QComboBox()
+        self.replay_speed_combo.addItems([f"{speed:g}x" for speed in self.REPLAY_SPEEDS])
+        capture_row.addWidget(self.replay_speed_combo)
+        capture_row.addStretch(1)
+        layout.addLayout(capture_row)
+        self.capture_report = QPlainTextEdit()
+        self.capture_report.setReadOnly(True)
+        self.capture_report.setMaximumHeight(140)
+        self.capture_report.setVisible(False)
+        layout.addWidget(self.capture_report)
+        for button in (self.capture_button, self.replay_button, self.replay_speed_combo):
+            button.setEnabled(MIDI_CAPTURE_AVAILABLE and self.akai_controller is not None)
+        self.replayer = None
+        button_row = QHBoxLayout()
+        button_row.addStretch(1)
+        self.reset_button = QPushButton("Reset Counters")
+        self.reset_button.clicked.connect(self._on_reset_clicked)
+        button_row.addWidget(self.reset_button)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.close)
+        button_row.addWidget(close_button)
+        layout.addLayout(button_row)
+        if self.akai_controller:
+            self.akai_controller.transport_stats_updated.connect(self._on_stats_updated)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.akai_controller:
+            self.akai_controller.set_transport_stats_interval(self.REFRESH_INTERVAL_MS)
+            self._on_stats_updated(self.akai_controller.get_transport_stats())
+
+    def closeEvent(self, event):
+        if self.replayer is not None: self.replayer.cancel()
+        if self.akai_controller:
+            self.akai_controller.set_transport_stats_interval(0)
+        super().closeEvent(event)
+
+    def _on_reset_clicked(self):
+        if self.akai_controller:
+            self.akai_controller.transport_stats.reset()
+            self._on_stats_updated(self.akai_controller.get_transport_stats())
+
+    def _on_capture_clicked(self):
+        if self.akai_controller.is_capturing():
+            count = self.akai_controller.stop_capture()
+            self.capture_button.setText("⏺ Start Capture...")
+            self._show_report(f"Capture stopped, {count} messages recorded.")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Save MIDI Capture", "", "Fire MIDI Capture (*.firecap)")
+        if not path: return
+        if self.akai_controller.start_capture(path):
+            self.capture_button.setText("⏹ Stop Capture")
+            self._show_report(f"Capturing to {path}...")
+
+    def _on_replay_clicked(self):
+        if self.replayer is not None:
+            self.replayer.cancel(); return
+        path, _ = QFileDialog.getOpenFileName(self, "Replay MIDI Capture", "", "Fire MIDI Capture (*.firecap)")
+        if not path: return
+        try: records = read_capture(path)
+        except (OSError, ValueError) as e:
+            self._show_report(f"Could not read capture: {e}"); return
+        speed = self.REPLAY_SPEEDS[self.replay_speed_combo.currentIndex()]
+        self.replayer = MidiCaptureReplayer(self.akai_controller, records, speed, parent=self)
+        self.replayer.finished.connect(self._on_replay_finished)
+        if not self.replayer.start():
+            self.replayer.deleteLater(); self.replayer = None
+            self._show_report("Nothing to replay (no input in capture, or a capture is running)."); return
+        self.replay_button.setText("■ Cancel Replay")
+        self.capture_button.setEnabled(False)
+        self._show_report(f"Replaying {path} at {speed:g}x...")
+
+    def _on_replay_finished(self, comparison: dict):
+        self.replayer.deleteLater(); self.replayer = None
+        self.replay_button.setText("▶ Replay Capture...")
+        self.capture_button.setEnabled(True)
+        lines = ["Recorded:", format_summary(comparison['reference']), "Replay:", format_summary(comparison['candidate'])]
+        for message_class, m in comparison['output_match'].items():
+            if m['reference'] or m['candidate']:
+                lines.append(f"  {message_class}: identical prefix {m['identical_prefix']}/{m['reference']} (replay sent {m['candidate']})")
+        lines.append("Output streams identical." if comparison['outputs_identical'] else "Output streams differ.")
+        self._show_report("\n".join(lines))
+
+    def _show_report(self, text: str):
+        self.capture_report.setVisible(True)
+        self.capture_report.setPlainText(text)
+
+    @staticmethod
+    def _fmt_ms(value) -> str:
+        if value is None: return "-"
+        if value == float('inf'): return "> 50"
+        return f"{value:.2f}"
+
+    def _on_stats_updated(self, stats: dict):
+        if not self.isVisible(): return
+        connected = self.akai_controller.is_connected() if self.akai_controller else False
+        port = self.akai_controller.port_name_used if connected else None
+        self.status_label.setText(f"Output: {port}" if port else "Output: not connected")
+        for row, (message_class, _) in enumerate(self.ROWS):
+            s = stats.get(message_class)
+            if not s: continue
+            values = [
+                f"{s['messages_per_s']:.1f}", f"{s['bytes_per_s'] / 1024.0:.1f}", f"{s['blocked_ms_per_s']:.1f}",
+                self._fmt_ms(s['send_ms_avg']), self._fmt_ms(s['send_ms_p95']), self._fmt_ms(s['send_ms_max']),
+                str(s['messages']), str(s['coalesced']), str(s['dropped']),
+            ]
+            for col, text in enumerate(values):
+                item = self.table.item(row, col)
+                if item is None:
+                    item = QTableWidgetItem()
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                    self.table.setItem(row, col, item)
+                item.setText(text)
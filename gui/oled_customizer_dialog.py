@@ -12,6 +12,9 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSize
 from PyQt6.QtGui import QFont, QColor, QPixmap, QPainter, QFontMetrics, QImage, QIcon, QCloseEvent
+from oled_utils.oled_frame import (
+    FRAME_WIDTH, as_packed_frame, item_frame_count, unpack_item_frames, pack_item_frames_for_save
+)
 
 try:
     from oled_utils import oled_renderer
@@ -938,8 +941,7 @@ class OLEDCustomizerDialog(QDialog):
                         item_name_from_json = data.get("item_name", item_name_from_json)
                         actual_item_json_type = data.get("item_type")
                         if actual_item_json_type == "image_animation":
-                            frames = data.get("frames_logical")
-                            if isinstance(frames, list) and len(frames) == 1:
+                            if item_frame_count(data) == 1:
                                 display_label_suffix = "Image"
                             else:
                                 display_label_suffix = "Animation"
@@ -998,17 +1000,7 @@ class OLEDCustomizerDialog(QDialog):
         if self.oled_preview_label:
             try:
                 # Render this logical_frame onto self.oled_preview_label (MAIN PREVIEW)
-                q_image = QImage(NATIVE_OLED_WIDTH,
-                                NATIVE_OLED_HEIGHT, QImage.Format.Format_Mono)
-                q_image.fill(0)  # Black background
-                for y, row_str in enumerate(logical_frame_to_display):
-                    if y >= NATIVE_OLED_HEIGHT:
-                        break
-                    for x, pixel_char in enumerate(row_str):
-                        if x >= NATIVE_OLED_WIDTH:
-                            break
-                        if pixel_char == '1':
-                            q_image.setPixel(x, y, 1)  # White pixel
+                q_image = self._logical_frame_to_mono_qimage(logical_frame_to_display)
                 native_pixmap = QPixmap.fromImage(q_image)
                 scaled_pixmap = native_pixmap.scaled(
                     self.oled_preview_label.size(),
@@ -1077,7 +1069,7 @@ class OLEDCustomizerDialog(QDialog):
             return
         try:
             with open(item_full_path, 'r', encoding='utf-8') as f_json:
-                item_json_content = json.load(f_json)
+                item_json_content = unpack_item_frames(json.load(f_json))
         except Exception: # Catch JSON loading errors
             self._clear_preview_label_content()
             return
@@ -1285,17 +1277,7 @@ class OLEDCustomizerDialog(QDialog):
         logical_frame_to_display = self._processed_logical_frames[
             self._current_anim_editor_preview_frame_index]
         if self.oled_preview_label:
-            q_image = QImage(NATIVE_OLED_WIDTH,
-                            NATIVE_OLED_HEIGHT, QImage.Format.Format_Mono)
-            q_image.fill(0)
-            for y, row_str in enumerate(logical_frame_to_display):
-                if y >= NATIVE_OLED_HEIGHT:
-                    break
-                for x, pixel_char in enumerate(row_str):
-                    if x >= NATIVE_OLED_WIDTH:
-                        break
-                    if pixel_char == '1':
-                        q_image.setPixel(x, y, 1)
+            q_image = self._logical_frame_to_mono_qimage(logical_frame_to_display)
             native_pixmap = QPixmap.fromImage(q_image)
             scaled_pixmap = native_pixmap.scaled(
                 self.oled_preview_label.size(),
@@ -1331,7 +1313,7 @@ class OLEDCustomizerDialog(QDialog):
         self._is_editing_new_item = False 
         try:
             with open(item_full_path, 'r', encoding='utf-8') as f:
-                item_json_data = json.load(f)
+                item_json_data = unpack_item_frames(json.load(f))
         except Exception as e:
             QMessageBox.critical(self, "Load Error", f"Could not load item data from '{item_full_path}': {e}")
             self._update_editor_panel_visibility(None); return
@@ -1518,7 +1500,7 @@ class OLEDCustomizerDialog(QDialog):
             return
         try:
             with open(item_filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = unpack_item_frames(json.load(f))
             item_type = data.get("item_type")
             item_name_debug = data.get("item_name", "Unknown")
             self._preview_scroll_timer.stop()  # Stop any text scrolling from previous item
@@ -1576,6 +1558,18 @@ class OLEDCustomizerDialog(QDialog):
             traceback.print_exc()
             self._clear_preview_label_content()
 
+    def _logical_frame_to_mono_qimage(self, logical_frame) -> QImage:
+        """Format_Mono QImage of a frame (index 1 = lit), built from its packed bytes in one copy."""
+        packed_frame = as_packed_frame(logical_frame)
+        if packed_frame is None:
+            q_image = QImage(NATIVE_OLED_WIDTH, NATIVE_OLED_HEIGHT, QImage.Format.Format_Mono)
+            q_image.fill(0)
+            return q_image
+        q_image = QImage(packed_frame.data, NATIVE_OLED_WIDTH, NATIVE_OLED_HEIGHT,
+                        FRAME_WIDTH // 8, QImage.Format.Format_Mono)
+        q_image.setColorTable([QColor(Qt.GlobalColor.black).rgb(), QColor(Qt.GlobalColor.white).rgb()])
+        return q_image.copy()  # Detach from the frame's bytes
+
     def _render_preview_frame(self, override_text: str | None = None):
         if not self.oled_preview_label:
             return
@@ -1621,17 +1615,7 @@ class OLEDCustomizerDialog(QDialog):
             rendered_something = True
         elif self._current_preview_anim_logical_frame:  # Animation frame for main preview
             # print("Dialog DEBUG: Rendering animation frame to main preview.") 
-            q_image = QImage(NATIVE_OLED_WIDTH,
-                            NATIVE_OLED_HEIGHT, QImage.Format.Format_Mono)
-            q_image.fill(0)
-            for y, row_str in enumerate(self._current_preview_anim_logical_frame):
-                if y >= NATIVE_OLED_HEIGHT:
-                    break
-                for x, pixel_char in enumerate(row_str):
-                    if x >= NATIVE_OLED_WIDTH:
-                        break
-                    if pixel_char == '1':
-                        q_image.setPixel(x, y, 1)
+            q_image = self._logical_frame_to_mono_qimage(self._current_preview_anim_logical_frame)
             painter.drawImage(0, 0, q_image)
             rendered_something = True 
         painter.end()
@@ -1712,17 +1696,7 @@ class OLEDCustomizerDialog(QDialog):
                         text_render_x = NATIVE_OLED_WIDTH - text_width
             painter.drawText(text_render_x, text_render_y, text_for_frame)
         elif self._current_preview_anim_logical_frame:  # Animation frame for main preview
-            q_image = QImage(NATIVE_OLED_WIDTH,
-                            NATIVE_OLED_HEIGHT, QImage.Format.Format_Mono)
-            q_image.fill(0)
-            for y, row_str in enumerate(self._current_preview_anim_logical_frame):
-                if y >= NATIVE_OLED_HEIGHT:
-                    break
-                for x, pixel_char in enumerate(row_str):
-                    if x >= NATIVE_OLED_WIDTH:
-                        break
-                    if pixel_char == '1':
-                        q_image.setPixel(x, y, 1)
+            q_image = self._logical_frame_to_mono_qimage(self._current_preview_anim_logical_frame)
             painter.drawImage(0, 0, q_image)
         painter.end()
         scaled_preview = preview_pixmap_native.scaled(
@@ -2111,7 +2085,7 @@ class OLEDCustomizerDialog(QDialog):
         try:
             os.makedirs(os.path.dirname(target_filepath), exist_ok=True)
             with open(target_filepath, 'w', encoding='utf-8') as f:
-                json.dump(item_data_to_save, f, indent=4)
+                json.dump(pack_item_frames_for_save(item_data_to_save), f, indent=4)
             QMessageBox.information(self, "Item Saved", f"Animation item '{item_name}' saved successfully.")
             self._current_edited_item_path = target_filepath
             self._current_edited_item_type = 'animation'
@@ -106,6 +106,8 @@ DEFAULT_SAMPLING_FPS = 20
 
 class ScreenSamplerManager(QObject):
     sampled_colors_for_display = pyqtSignal(list)
+    # Full 4 x (16 * N) grid-mode sample when the canvas is wider than one Fire (row-major (r, g, b) list)
+    sampled_canvas_for_display = pyqtSignal(list)
     processed_image_for_preview = pyqtSignal(
         Image.Image if GUI_IMPORTS_OK and 'Image' in globals() else object)
     oled_frame_for_display = pyqtSignal(bytearray)
@@ -770,7 +772,25 @@ class ScreenSamplerManager(QObject):
             # state is correct and respects the emit_status flag.
             self._on_thread_finished()
 
+    def set_canvas_columns(self, columns: int):
+        """Grid mode samples this many pad columns (16 per connected Fire)."""
+        if FEATURES_IMPORTS_OK and hasattr(self.sampling_thread, 'set_grid_columns'):
+            self.sampling_thread.set_grid_columns(columns)
+
+    def set_output_rate_scale(self, scale: float):
+        """Follows AkaiFireController.output_rate_scale_changed: sample less often while the MIDI link is congested."""
+        if FEATURES_IMPORTS_OK and hasattr(self.sampling_thread, 'set_rate_scale'):
+            self.sampling_thread.set_rate_scale(scale)
+
     def _handle_thread_pad_colors_sampled(self, colors_list: list):
+        canvas_colors = None
+        num_pads = ScreenSamplerCore.NUM_GRID_ROWS * ScreenSamplerCore.NUM_GRID_COLS
+        if colors_list and len(colors_list) > num_pads:
+            # Wide canvas: the GUI grid and recordings get the first Fire's 4x16 slice
+            canvas_colors = colors_list
+            canvas_cols = len(colors_list) // ScreenSamplerCore.NUM_GRID_ROWS
+            colors_list = [colors_list[row * canvas_cols + col]
+                           for row in range(ScreenSamplerCore.NUM_GRID_ROWS) for col in range(ScreenSamplerCore.NUM_GRID_COLS)]
         if self.is_actively_recording:
             if self.current_recording_frame_count < self.MAX_RECORDING_FRAMES:
                 if colors_list and len(colors_list) == ScreenSamplerCore.NUM_GRID_ROWS * ScreenSamplerCore.NUM_GRID_COLS:
@@ -786,7 +806,8 @@ class ScreenSamplerManager(QObject):
                         f"Max recording frames ({self.MAX_RECORDING_FRAMES}) reached.", 3000)
                     self._stop_recording_logic()
         if self.is_sampling_thread_active:
-            self.sampled_colors_for_display.emit(colors_list)
+            if canvas_colors is not None: self.sampled_canvas_for_display.emit(canvas_colors)
+            else: self.sampled_colors_for_display.emit(colors_list)
 
     def _handle_thread_processed_image_ready(self, pil_image: Image.Image):
         self._last_processed_pil_image = pil_image
@@ -1,8 +1,18 @@
 # AKAI_Fire_RGB_Controller/hardware/akai_fire_controller.py
 import mido
 import time
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
-import math 
+from collections import deque
+from PyQt6.QtCore import QObject, pyqtSignal, QThread, QMutex, QMutexLocker, QWaitCondition, QTimer
+import numpy as np
+from oled_utils.oled_renderer import pack_page_bytes_to_7bit_stream, unpack_7bit_stream_to_page_bytes
+from .midi_output_writer import MidiOutputWriterThread
+from .midi_backends import MidoOutputBackend
+from .midi_transport_stats import MidiTransportStats, MESSAGE_CLASS_OLED
+from .output_frame_scheduler import OutputFrameScheduler
+from .midi_capture import MidiCaptureWriter
+from .port_hotplug_monitor import PortHotplugMonitor
+from .pad_calibration import PadCalibration, apply_pad_lut
+from .link_congestion import LinkCongestionDetector, DEFAULT_CONGESTION_CHECK_INTERVAL_MS
 
 FIRE_BUTTON_PLAY = 0x33
 FIRE_BUTTON_STOP = 0x34
@@ -20,6 +30,7 @@ FIRE_BUTTON_BROWSER = 0x21
 FIRE_BUTTON_GRID_LEFT = 0x22
 FIRE_BUTTON_GRID_RIGHT = 0x23
 FIRE_BUTTON_BANK = 0x1A
+FIRE_PAD_NOTE_OFFSET = 0x36 # Pad notes run 0x36..0x75, row by row from the top left
 
 LED_OFF = 0x00
 LED_SINGLE_COLOR_DULL = 0x01
@@ -33,33 +44,111 @@ LED_STOP_RED_HIGH = LED_SINGLE_COLOR_HIGH
 BANK_LED_CC = 0x1B
 BANK_LED_VALUE_ALL_OFF = 0x10
 
+SYSEX_HEADER = bytes([0xF0, 0x47, 0x7F, 0x43])
+SYSEX_END = bytes([0xF7])
+SYSEX_CMD_SET_PAD_COLORS = 0x65
+SYSEX_CMD_WRITE_OLED = 0x0E
+
+PAD_COUNT = 64
+PAD_LUT_CACHE_SIZE = 64 # Compiled calibration tables kept, one per brightness level
+DEFAULT_PAD_FULL_REFRESH_INTERVAL = 0 # Pad frames between forced full resyncs (0 = never)
+
+OLED_PAGES = 8 # 8-pixel-high bands
+OLED_COLUMNS = 128
+OLED_PACKED_BITMAP_LEN = 1176
+DEFAULT_OLED_FULL_REFRESH_INTERVAL = 0 # OLED frames between forced full-screen writes (0 = never)
+
+INPUT_REOPEN_RETRY_MIN_MS = 100 # After a lost input port, retries back off from this...
+INPUT_REOPEN_RETRY_MAX_MS = 2000 # ...to this; the hotplug monitor's reopen request cuts the wait short
+
+def hex_colors_to_rgb_array(hex_colors: list) -> np.ndarray | None:
+    """Parses '#RRGGBB' strings into an (N, 3) uint8 array. Returns None if any entry is not plain hex."""
+    try:
+        raw = bytes.fromhex("".join(h[1:] if h.startswith('#') else h for h in hex_colors))
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if len(raw) != len(hex_colors) * 3: return None
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+
+def rgb_tuples_to_array(colors: list) -> np.ndarray:
+    """(r, g, b) tuples (e.g. from the screen sampler) as an (N, 3) uint8 array, clamped to 0..255."""
+    return np.clip(np.asarray(colors, dtype=np.int64), 0, 255).astype(np.uint8)
+
 class MidiInputThread(QThread):
-    message_received = pyqtSignal(object)
+    """
+    Receives MIDI input through the backend's callback and sleeps until messages arrive.
+    Everything that arrived together is delivered as one list in a single cross-thread signal.
+    """
+    messages_received = pyqtSignal(list)
     def __init__(self, port_name, parent=None):
         super().__init__(parent)
         self.port_name = port_name
         self.in_port = None
         self._running = False
+        self._stop_requested = False
+        self._reopen_requested = False
+        self._pending_messages: deque = deque()
+        self._mutex = QMutex()
+        self._messages_available = QWaitCondition()
+        self.capture_writer: MidiCaptureWriter | None = None # Set by AkaiFireController.start_capture()
         self.setObjectName(f"MidiInputThread_{port_name.replace(' ', '_')}")
 
+    def _on_midi_callback(self, msg):
+        # Called on the MIDI backend's own thread
+        capture_writer = self.capture_writer
+        if capture_writer is not None: capture_writer.record_input(msg.bytes())
+        with QMutexLocker(self._mutex):
+            self._pending_messages.append(msg)
+            self._messages_available.wakeAll()
+
     def run(self):
-        self._running = True
+        with QMutexLocker(self._mutex):
+            if self._stop_requested: return
+            self._running = True
+        opened_once = False
+        retry_ms = 0 # 0 = port is fine; otherwise the next retry delay after losing it
         try:
-            if self.in_port and not self.in_port.closed: self.in_port.close()
-            with mido.open_input(self.port_name) as self.in_port:
-                print(f"MidiInputThread ({self.objectName()}): Successfully opened port '{self.port_name}'")
-                while self._running:
-                    for msg in self.in_port.iter_pending():
-                        # print(f"MIDI INPUT THREAD ({self.objectName()}) RAW MSG: {msg}")  # Debug print
-                        self.message_received.emit(msg)
-                    self.msleep(10)
-        except Exception as e: print(f"MidiInputThread: Error for '{self.port_name}': {e}")
+            while True:
+                with QMutexLocker(self._mutex):
+                    if not self._running: break
+                    self._reopen_requested = False
+                try:
+                    if self.in_port and not self.in_port.closed: self.in_port.close()
+                    with mido.open_input(self.port_name, callback=self._on_midi_callback) as self.in_port:
+                        print(f"MidiInputThread ({self.objectName()}): Successfully opened port '{self.port_name}'")
+                        opened_once = True; retry_ms = 0
+                        while True:
+                            with QMutexLocker(self._mutex):
+                                while self._running and not self._pending_messages and not self._reopen_requested:
+                                    self._messages_available.wait(self._mutex)
+                                if not self._running: break
+                                if not self._pending_messages: break # Reopen requested (device was replugged)
+                                batch = list(self._pending_messages); self._pending_messages.clear()
+                            # print(f"MIDI INPUT THREAD ({self.objectName()}) RAW BATCH: {batch}")  # Debug print
+                            self.messages_received.emit(batch)
+                except Exception as e:
+                    if not opened_once or retry_ms == 0: print(f"MidiInputThread: Error for '{self.port_name}': {e}")
+                    if not opened_once: break
+                    if retry_ms == 0: print(f"MidiInputThread: Retrying '{self.port_name}' until the device is back...")
+                    retry_ms = min(max(retry_ms * 2, INPUT_REOPEN_RETRY_MIN_MS), INPUT_REOPEN_RETRY_MAX_MS)
+                    with QMutexLocker(self._mutex): # Port may still be coming back after a replug
+                        if self._running and not self._reopen_requested: self._messages_available.wait(self._mutex, retry_ms)
         finally:
             if self.in_port and not self.in_port.closed: self.in_port.close()
             self._running = False
             print(f"MidiInputThread: Stopped for port '{self.port_name}'")
 
-    def stop(self): self._running = False
+    def request_reopen(self, port_name: str | None = None):
+        """Closes and reopens the input port (optionally under a new name), e.g. after the Fire was replugged."""
+        with QMutexLocker(self._mutex):
+            if port_name: self.port_name = port_name
+            self._reopen_requested = True
+            self._messages_available.wakeAll()
+
+    def stop(self):
+        with QMutexLocker(self._mutex):
+            self._stop_requested = True; self._running = False
+            self._messages_available.wakeAll()
 
 class AkaiFireController(QObject):
     fire_button_event = pyqtSignal(int, bool)
@@ -77,14 +166,69 @@ class AkaiFireController(QObject):
     pattern_up_button_pressed = pyqtSignal()
     pattern_down_button_pressed = pyqtSignal()
     control_change_event = pyqtSignal(int, int) # control_cc, value
+    transport_stats_updated = pyqtSignal(dict) # MidiTransportStats.snapshot(), only while an interval is set
+    link_congestion_changed = pyqtSignal(bool)
+    output_rate_scale_changed = pyqtSignal(float) # 1.0 = full rate; producers stretch their intervals by 1 / scale
+    device_connection_changed = pyqtSignal(bool) # False = unplugged, True = restored by the hotplug monitor
+    # Hotplug monitor thread -> GUI thread (queued): the monitor only watches ports and opens the new one
+    _hotplug_output_lost = pyqtSignal()
+    _hotplug_output_reopened = pyqtSignal(object, str) # (opened output backend, port name)
+    _hotplug_input_restored = pyqtSignal(str)
 
     def __init__(self, default_port_name_to_try: str | None = None, auto_connect: bool = True):
         super().__init__()
-        self.out_port = None
+        self.out_port = None # Output backend (MidoOutputBackend for real ports, or e.g. VirtualFireDevice)
+        self.output_backend_factory = MidoOutputBackend.open # Callable(port_name) -> output backend
+        self._backend_input_source = None # Backend providing input alongside output (virtual devices)
+        self.output_writer: MidiOutputWriterThread | None = None
+        self.transport_stats = MidiTransportStats()
+        self.output_scheduler = OutputFrameScheduler() # Survives reconnects so settings stick
+        self._transport_stats_timer: QTimer | None = None
+        self.capture_writer: MidiCaptureWriter | None = None # Records all traffic while a capture runs
+        self.congestion_detector = LinkCongestionDetector()
+        self._congestion_timer: QTimer | None = None
+        self.hotplug_monitor_enabled = True # Watch ports opened by name and reconnect after a replug
+        self.hotplug_monitor: PortHotplugMonitor | None = None
+        self.shared_hotplug_monitor: PortHotplugMonitor | None = None # Set by FireDeviceGroup; otherwise each connect starts its own
+        self._hotplug_output_lost.connect(self._on_output_lost)
+        self._hotplug_output_reopened.connect(self._on_output_reopened)
+        self._hotplug_input_restored.connect(self._on_input_restored)
+        self._output_suspended = False # Device unplugged: the writer keeps draining but nothing is written
+        self._oled_resync_requested = False # Next OLED frame goes out full-screen (set after a reconnect)
         self.port_name_used = None
         self.in_port_name_used = None
         self.midi_input_thread: MidiInputThread | None = None
         self.current_brightness_factor: float = 1.0 # 0.0 to 1.0
+        # Calibration + brightness compiled into flattened (3, 256) 7-bit tables, cached per brightness level
+        self.pad_calibration = PadCalibration()
+        self._pad_lut_cache: dict[float, np.ndarray] = {}
+        self._brightness_lut = self._get_pad_lut(self.current_brightness_factor)
+        self._unity_brightness_lut = self._get_pad_lut(1.0)
+        # Shadow copy of the 7-bit (r, g, b) last sent per pad; -1 means unknown device state
+        self._last_sent_pad_rgb7 = np.full((PAD_COUNT, 3), -1, dtype=np.int16)
+        # Preallocated full-frame pad SysEx; the writer fills the RGB columns in place
+        self._pad_sysex_template = bytearray(SYSEX_HEADER + bytes([SYSEX_CMD_SET_PAD_COLORS, ((PAD_COUNT * 4) >> 7) & 0x7F, (PAD_COUNT * 4) & 0x7F])
+                                             + bytes(PAD_COUNT * 4) + SYSEX_END)
+        pad_entries = np.frombuffer(self._pad_sysex_template, dtype=np.uint8)[7:7 + PAD_COUNT * 4].reshape(PAD_COUNT, 4)
+        pad_entries[:, 0] = np.arange(PAD_COUNT)
+        self._pad_template_rgb = pad_entries[:, 1:]
+        self.pad_full_refresh_interval: int = DEFAULT_PAD_FULL_REFRESH_INTERVAL
+        # Preallocated OLED SysEx buffers, filled in place on the writer thread: the full-screen message
+        # (fixed header and window, packed bitmap copied in through a memoryview) and a scratch buffer for partial windows
+        full_oled_payload_len = 4 + OLED_PACKED_BITMAP_LEN
+        self._oled_sysex_full = bytearray(SYSEX_HEADER + bytes([SYSEX_CMD_WRITE_OLED, (full_oled_payload_len >> 7) & 0x7F, full_oled_payload_len & 0x7F,
+                                                                 0, OLED_PAGES - 1, 0, OLED_COLUMNS - 1])
+                                          + bytes(OLED_PACKED_BITMAP_LEN) + SYSEX_END)
+        self._oled_sysex_full_bitmap = memoryview(self._oled_sysex_full)[11:11 + OLED_PACKED_BITMAP_LEN]
+        self._oled_sysex_window = bytearray(len(self._oled_sysex_full))
+        # Column bytes (pages x columns) of the last OLED frame sent; only touched on the writer thread
+        self._last_sent_oled_pages: np.ndarray | None = None
+        self.oled_full_refresh_interval: int = DEFAULT_OLED_FULL_REFRESH_INTERVAL
+        self._oled_frames_since_full_refresh: int = 0
+        self._last_submitted_oled_frame: bytes | None = None # Copy of the last frame handed to the writer
+        self.oled_frames_skipped: int = 0 # Exact duplicates dropped at oled_send_full_bitmap
+        self._pad_frames_since_full_refresh: int = 0
+        self._led_cache: dict[tuple[int, int], int] = {} # (status byte, cc) -> last value handed to the writer
         self.NON_GRID_BUTTON_CCS = [
             FIRE_BUTTON_STEP, FIRE_BUTTON_NOTE, FIRE_BUTTON_DRUM, FIRE_BUTTON_PERFORM,
             FIRE_BUTTON_SHIFT, FIRE_BUTTON_ALT, FIRE_BUTTON_PATTERN_SONG,
@@ -104,13 +248,13 @@ class AkaiFireController(QObject):
                 else: print("AkaiFireController: Auto-connect: No 'Fire' output found.")
             if port_to_connect:
                 try:
-                    self.out_port = mido.open_output(port_to_connect)
-                    self.port_name_used = port_to_connect
+                    self._open_output(port_to_connect)
                     print(f"AkaiFireController: Auto-connected OUTPUT to: {self.port_name_used}")
                     self._initialize_device_leds()
+                    if self.hotplug_monitor_enabled: self._start_hotplug_monitor()
                 except Exception as e:
                     print(f"AkaiFireController: Error auto-connecting OUTPUT '{port_to_connect}': {e}")
-                    self.out_port = None; self.port_name_used = None
+                    self._close_output()
         else: print("AkaiFireController: Initialized (auto-connect=False).")
 
     @staticmethod
@@ -126,16 +270,117 @@ class AkaiFireController(QObject):
     def connect(self, out_port_name: str, in_port_name: str | None = None) -> bool:
         if self.is_connected(): print(f"Output already on {self.port_name_used}. Disconnect first."); return False
         try:
-            self.out_port = mido.open_output(out_port_name)
-            self.port_name_used = out_port_name
+            self._open_output(out_port_name)
             print(f"AkaiFireController: Connected OUTPUT to: {out_port_name}")
             self._initialize_device_leds()
             if in_port_name and in_port_name not in ["No MIDI input ports found", "Select MIDI Input", ""]:
                 self.connect_input(in_port_name)
+            if self.hotplug_monitor_enabled: self._start_hotplug_monitor()
             return True
         except Exception as e:
             print(f"AkaiFireController: Error connecting OUTPUT '{out_port_name}': {e}")
-            self.out_port = None; self.port_name_used = None; return False
+            self._close_output(); return False
+
+    def connect_backend(self, backend, name: str | None = None) -> bool:
+        """
+        Connects to an already-open output backend instead of a MIDI port by name.
+        If the backend also produces input (an `input_messages` signal), it is used as the input side too.
+        """
+        if self.is_connected(): print(f"Output already on {self.port_name_used}. Disconnect first."); return False
+        self._attach_output_backend(backend, name or getattr(backend, 'name', None) or type(backend).__name__)
+        print(f"AkaiFireController: Connected OUTPUT to backend: {self.port_name_used}")
+        self._initialize_device_leds()
+        if hasattr(backend, 'input_messages'):
+            self.disconnect_input()
+            backend.input_messages.connect(self._on_backend_input_messages)
+            self._backend_input_source = backend; self.in_port_name_used = self.port_name_used
+        return True
+
+    def _open_output(self, out_port_name: str):
+        self._attach_output_backend(self.output_backend_factory(out_port_name), out_port_name)
+
+    def _attach_output_backend(self, backend, name: str):
+        self.out_port = backend
+        self.port_name_used = name
+        self._last_sent_oled_pages = None; self._last_submitted_oled_frame = None
+        self.invalidate_led_cache()
+        self.transport_stats.reset()
+        self.output_writer = MidiOutputWriterThread(self._write_to_port, self._build_pad_sysex, self._build_oled_sysex,
+                                                    parent=self, stats=self.transport_stats, scheduler=self.output_scheduler)
+        self.output_writer.start()
+        self._start_congestion_monitor()
+
+    def _close_output(self):
+        self._stop_hotplug_monitor()
+        self._stop_congestion_monitor()
+        self._output_suspended = False
+        if self.output_writer:
+            self.output_writer.stop()
+            if not self.output_writer.wait(1000):
+                self.output_writer.terminate(); self.output_writer.wait()
+            self.output_writer.deleteLater()
+            self.output_writer = None
+        if self.out_port:
+            try: self.out_port.close()
+            except Exception as e: print(f"AkaiFireController: Error closing output port: {e}")
+        self.out_port = None; self.port_name_used = None
+        self.invalidate_pad_cache(); self.invalidate_led_cache()
+        self._last_sent_oled_pages = None; self._last_submitted_oled_frame = None
+
+    def _start_congestion_monitor(self):
+        self.congestion_detector.reset()
+        if self._congestion_timer is None:
+            self._congestion_timer = QTimer(self)
+            self._congestion_timer.timeout.connect(self._check_link_congestion)
+        self._congestion_timer.start(DEFAULT_CONGESTION_CHECK_INTERVAL_MS)
+
+    def _stop_congestion_monitor(self):
+        if self._congestion_timer is not None: self._congestion_timer.stop()
+        was_congested, old_scale = self.congestion_detector.congested, self.congestion_detector.rate_scale
+        self.congestion_detector.reset()
+        if was_congested: self.link_congestion_changed.emit(False)
+        if old_scale != 1.0: self.output_rate_scale_changed.emit(1.0)
+
+    def _check_link_congestion(self):
+        if not self.output_writer: return
+        was_congested, old_scale = self.congestion_detector.congested, self.congestion_detector.rate_scale
+        if not self.congestion_detector.update(self.transport_stats.total_send_time_s(), self.output_writer.queue_depth()):
+            return
+        detector = self.congestion_detector
+        if detector.congested != was_congested:
+            print(f"AkaiFireController: MIDI link {'congested' if detector.congested else 'clear'} "
+                  f"(send busy {detector.last_busy_fraction * 100:.0f}%), output rate x{detector.rate_scale:.2f}")
+            self.link_congestion_changed.emit(detector.congested)
+        if detector.rate_scale != old_scale: self.output_rate_scale_changed.emit(detector.rate_scale)
+
+    def is_link_congested(self) -> bool: return self.congestion_detector.congested
+
+    def get_output_rate_scale(self) -> float: return self.congestion_detector.rate_scale
+
+    def configure_output_scheduler(self, pad_max_fps: float | None = None, oled_max_fps: float | None = None,
+                                   max_bytes_per_s: float | None = None):
+        """Per-channel fps caps and the total bytes/s budget for everything sent to the device (0 = unlimited)."""
+        if self.output_writer: self.output_writer.configure_scheduler(pad_max_fps, oled_max_fps, max_bytes_per_s)
+        else: self.output_scheduler.configure(pad_max_fps, oled_max_fps, max_bytes_per_s)
+
+    def get_transport_stats(self) -> dict:
+        """Per message class counters, rates and send-latency histogram (see MidiTransportStats.snapshot)."""
+        return self.transport_stats.snapshot()
+
+    def set_transport_stats_interval(self, interval_ms: int):
+        """Emits transport_stats_updated every interval_ms; 0 stops the timer so nothing is computed."""
+        if interval_ms <= 0:
+            if self._transport_stats_timer: self._transport_stats_timer.stop()
+            return
+        if self._transport_stats_timer is None:
+            self._transport_stats_timer = QTimer(self)
+            self._transport_stats_timer.timeout.connect(lambda: self.transport_stats_updated.emit(self.transport_stats.snapshot()))
+        self._transport_stats_timer.start(int(interval_ms))
+
+    def flush_output(self, timeout_ms: int = 1000) -> bool:
+        """Blocks until the writer thread has sent everything queued so far."""
+        if not self.output_writer: return True
+        return self.output_writer.flush(timeout_ms)
 
     def connect_input(self, port_name: str) -> bool:
         if self.midi_input_thread and self.midi_input_thread.isRunning():
@@ -143,109 +388,297 @@ class AkaiFireController(QObject):
             else: self.disconnect_input()
         self.in_port_name_used = port_name
         self.midi_input_thread = MidiInputThread(port_name, parent=self)
-        self.midi_input_thread.message_received.connect(self._parse_midi_message)
+        self.midi_input_thread.capture_writer = self.capture_writer
+        self.midi_input_thread.messages_received.connect(self._parse_midi_messages)
         self.midi_input_thread.start()
+        if self.hotplug_monitor: self.hotplug_monitor.set_input_port_name(self, port_name)
         return self.midi_input_thread.isRunning()
 
     def disconnect(self):
         if self.out_port:
             print(f"AkaiFireController: Disconnecting OUTPUT from {self.port_name_used}...")
-            self._initialize_device_leds(); time.sleep(0.05) 
-            try: self.out_port.close()
-            except Exception as e: print(f"AkaiFireController: Error closing output port: {e}")
-            self.out_port = None; self.port_name_used = None
+            self._initialize_device_leds()
+            if not self.flush_output(1000): print("AkaiFireController: Timed out flushing output before disconnect.")
+            self._close_output()
             print("AkaiFireController: AKAI Fire OUTPUT closed.")
         self.disconnect_input()
 
     def disconnect_input(self):
+        if self._backend_input_source is not None:
+            try: self._backend_input_source.input_messages.disconnect(self._on_backend_input_messages)
+            except (TypeError, RuntimeError): pass
+            self._backend_input_source = None; self.in_port_name_used = None
         if self.midi_input_thread:
             if self.midi_input_thread.isRunning():
                 self.midi_input_thread.stop()
                 if not self.midi_input_thread.wait(1000):
                     self.midi_input_thread.terminate(); self.midi_input_thread.wait()
-            try: self.midi_input_thread.message_received.disconnect(self._parse_midi_message)
+            try: self.midi_input_thread.messages_received.disconnect(self._parse_midi_messages)
             except (TypeError, RuntimeError): pass
             self.midi_input_thread.deleteLater()
             self.midi_input_thread = None; self.in_port_name_used = None
+            if self.hotplug_monitor: self.hotplug_monitor.set_input_port_name(self, None)
             print("AkaiFireController: MIDI Input stopped.")
 
-    def is_connected(self): return self.out_port is not None and not self.out_port.closed
+    # --- Hotplug ---
+    def _start_hotplug_monitor(self):
+        self._stop_hotplug_monitor()
+        input_port = self.in_port_name_used if self.midi_input_thread else None
+        monitor = self.shared_hotplug_monitor if self.shared_hotplug_monitor is not None else PortHotplugMonitor(parent=self)
+        monitor.watch(self, self.port_name_used, input_port, self._hotplug_output_lost.emit,
+                      self._reopen_output_on_monitor_thread, on_input_restored=self._forward_input_restored)
+        self.hotplug_monitor = monitor
+
+    def _stop_hotplug_monitor(self):
+        monitor, self.hotplug_monitor = self.hotplug_monitor, None
+        if monitor is None: return
+        monitor.unwatch(self)
+        if monitor is self.shared_hotplug_monitor: return # Owned by the group
+        monitor.stop()
+        if not monitor.wait(1000):
+            monitor.terminate(); monitor.wait()
+        monitor.deleteLater()
 
-    def is_input_connected(self): return self.midi_input_thread is not None and self.midi_input_thread.isRunning()
+    def is_output_suspended(self) -> bool: return self._output_suspended
+
+    def _reopen_output_on_monitor_thread(self, port_name: str) -> bool:
+        # Monitor thread: opening the port is the slow part; no controller state is touched here
+        try: backend = self.output_backend_factory(port_name)
+        except Exception as e:
+            print(f"AkaiFireController: Reopening output '{port_name}' failed, will retry: {e}"); return False
+        self._hotplug_output_reopened.emit(backend, port_name)
+        return True
+
+    def _forward_input_restored(self, port_name: str) -> bool:
+        self._hotplug_input_restored.emit(port_name)
+        return True
+
+    def _on_output_lost(self):
+        # Stop writing to the dead port right away; producers and the writer carry on, frames are just dropped
+        if self.output_writer is None: return
+        self._output_suspended = True
+        print(f"AkaiFireController: Output '{self.port_name_used}' lost, waiting for the device to come back...")
+        self.device_connection_changed.emit(False)
+
+    def _on_output_reopened(self, backend, port_name: str):
+        if self.output_writer is None: # Disconnected while the monitor was reopening
+            try: backend.close()
+            except Exception: pass
+            return
+        self.port_name_used = port_name
+        # The writer swaps ports between two sends, so _write_to_port never sees a closed port
+        self.output_writer.submit_call(lambda: self._swap_output_backend(backend))
+        self._resync_device_after_reconnect()
+        print(f"AkaiFireController: Output restored on '{port_name}'.")
+        self.device_connection_changed.emit(True)
+
+    def _swap_output_backend(self, backend):
+        # Runs on the output writer thread
+        old_backend, self.out_port = self.out_port, backend
+        self._oled_resync_requested = True
+        self._output_suspended = False
+        if old_backend is not None and old_backend is not backend:
+            try: old_backend.close()
+            except Exception: pass # Port died with the device
+
+    def _on_input_restored(self, port_name: str):
+        if self.midi_input_thread is None: return
+        self.midi_input_thread.request_reopen(port_name)
+        self.in_port_name_used = port_name
+
+    def _resync_device_after_reconnect(self):
+        """A replugged Fire starts blank: resend LED states, the last pad frame and the last OLED frame in full."""
+        writer = self.output_writer
+        if writer is None: return
+        led_states = self._led_cache.copy()
+        if led_states: writer.submit_messages([bytes([status, cc, value]) for (status, cc), value in led_states.items()])
+        shadow = self._last_sent_pad_rgb7.copy()
+        known_pads = shadow[:, 0] >= 0
+        if known_pads.any(): writer.submit_pad_updates(shadow.astype(np.uint8), known_pads)
+        last_oled_frame = self._last_submitted_oled_frame
+        if last_oled_frame is not None: writer.submit_oled_frame(last_oled_frame)
+
+    def start_capture(self, path: str) -> bool:
+        """Records every outgoing and incoming MIDI message to a capture file (see hardware.midi_capture)."""
+        if self.capture_writer is not None: print("AkaiFireController: A capture is already running."); return False
+        try: self.capture_writer = MidiCaptureWriter(path)
+        except OSError as e: print(f"AkaiFireController: Could not start capture '{path}': {e}"); return False
+        if self.midi_input_thread: self.midi_input_thread.capture_writer = self.capture_writer
+        return True
+
+    def stop_capture(self) -> int:
+        """Stops the running capture and returns how many messages it recorded."""
+        capture_writer = self.capture_writer
+        if capture_writer is None: return 0
+        self.capture_writer = None
+        if self.midi_input_thread: self.midi_input_thread.capture_writer = None
+        capture_writer.close()
+        return capture_writer.messages_recorded
+
+    def is_capturing(self) -> bool: return self.capture_writer is not None
+
+    def is_connected(self): return self.out_port is not None and not self.out_port.closed and self.output_writer is not None
+
+    def is_input_connected(self):
+        if self._backend_input_source is not None: return True
+        return self.midi_input_thread is not None and self.midi_input_thread.isRunning()
+
+    def _write_to_port(self, message_bytes: bytes):
+        # Runs on the output writer thread only
+        if self._output_suspended: return
+        port = self.out_port
+        if port is None or port.closed: return
+        port.send_bytes(message_bytes)
+        capture_writer = self.capture_writer
+        if capture_writer is not None: capture_writer.record_output(message_bytes)
 
     def _send_cc(self, control, value, channel=0):
-        if not self.is_connected(): return
-        try: self.out_port.send(mido.Message('control_change', channel=channel, control=control, value=value))
-        except Exception as e: print(f"AkaiFireController: Error sending CC: {e}")
+        self.set_leds(((control, value),), channel)
+
+    def set_leds(self, led_values, channel: int = 0) -> int:
+        """
+        Batch of CC LED writes, as {cc: value} or [(cc, value), ...]. LEDs already showing the value
+        are skipped; the rest reach the writer in one call. Returns how many CCs were queued.
+        """
+        if not self.is_connected() or not self.output_writer: return 0
+        status = 0xB0 | (channel & 0x0F)
+        messages = []
+        for control, value in (led_values.items() if isinstance(led_values, dict) else led_values):
+            key = (status, control & 0x7F); value &= 0x7F
+            if self._led_cache.get(key) == value: continue
+            self._led_cache[key] = value
+            messages.append(bytes([status, key[1], value]))
+        if messages: self.output_writer.submit_messages(messages)
+        return len(messages)
+
+    def invalidate_led_cache(self):
+        """Forget the LED states so the next write to every CC LED really goes out."""
+        self._led_cache.clear()
 
     def _initialize_device_leds(self):
         if not self.is_connected(): return
-        self.clear_all_pads(); time.sleep(0.02)
-        for cc_num in self.NON_GRID_BUTTON_CCS: self._send_cc(control=cc_num, value=LED_OFF)
-        self._send_cc(control=self.BANK_LED_CC, value=self.BANK_LED_OFF_VALUE)
+        self.invalidate_pad_cache() # Device state is unknown, make sure the clear really goes out
+        self.clear_all_pads()
+        led_values = {cc_num: LED_OFF for cc_num in self.NON_GRID_BUTTON_CCS}
+        led_values[self.BANK_LED_CC] = self.BANK_LED_OFF_VALUE
+        self.set_leds(led_values)
 
     def _send_sysex(self, data_bytes):
-        if not self.is_connected(): return
-        sysex_header = [0xF0, 0x47, 0x7F, 0x43]; sysex_ender = [0xF7]
-        try: self.out_port.send(mido.Message.from_bytes(sysex_header + data_bytes + sysex_ender)); time.sleep(0.002) 
-        except Exception as e: print(f"AkaiFireController: Error sending SysEx: {e}")
+        if not self.is_connected() or not self.output_writer: return
+        self.output_writer.submit_message(SYSEX_HEADER + bytes(data_bytes) + SYSEX_END)
+
+    def _build_pad_sysex(self, rgb7: np.ndarray, send_mask: np.ndarray) -> bytes | bytearray:
+        # Runs on the writer thread. Full frames are written into the preallocated template in place.
+        if send_mask.all():
+            self._pad_template_rgb[:] = rgb7
+            return self._pad_sysex_template
+        pad_indices = np.flatnonzero(send_mask)
+        entries = np.empty((len(pad_indices), 4), dtype=np.uint8)
+        entries[:, 0] = pad_indices; entries[:, 1:] = rgb7[pad_indices]
+        length = entries.size # Each pad entry is 4 bytes (idx, r, g, b) in the SysEx payload
+        return SYSEX_HEADER + bytes([SYSEX_CMD_SET_PAD_COLORS, (length >> 7) & 0x7F, length & 0x7F]) + entries.tobytes() + SYSEX_END
+
+    def _get_pad_lut(self, brightness: float) -> np.ndarray:
+        """Flattened (3, 256) table for the current calibration at this brightness; compiled once per level."""
+        key = round(brightness, 4)
+        lut = self._pad_lut_cache.get(key)
+        if lut is None:
+            if len(self._pad_lut_cache) >= PAD_LUT_CACHE_SIZE: self._pad_lut_cache.pop(next(iter(self._pad_lut_cache)))
+            lut = self._pad_lut_cache[key] = self.pad_calibration.compile_lut(key).ravel()
+        return lut
+
+    def set_pad_calibration(self, calibration: PadCalibration):
+        """Per-device gamma/white balance/brightness curve; applies from the next pad update on."""
+        self.pad_calibration = calibration
+        self._pad_lut_cache.clear()
+        self._brightness_lut = self._get_pad_lut(self.current_brightness_factor)
+        self._unity_brightness_lut = self._get_pad_lut(1.0)
 
     def set_global_brightness_factor(self, factor: float):
         self.current_brightness_factor = max(0.0, min(float(factor), 1.0)) # Ensure it's a float and clamped
+        self._brightness_lut = self._get_pad_lut(self.current_brightness_factor) # Only swaps tables
         # print(f"AkaiCtrl TRACE: Brightness factor set to {self.current_brightness_factor}") # Optional
 
+    def set_pad_full_refresh_interval(self, frames: int):
+        """Every `frames` pad updates, resend all known pads regardless of the shadow copy (0 disables)."""
+        self.pad_full_refresh_interval = max(0, int(frames))
+        self._pad_frames_since_full_refresh = 0
+
+    def invalidate_pad_cache(self):
+        """Forget what the device is showing so the next pad update is sent in full."""
+        self._last_sent_pad_rgb7.fill(-1)
+        self._pad_frames_since_full_refresh = 0
+
+    def _submit_pad_rgb7(self, rgb7: np.ndarray, requested_mask: np.ndarray | None = None):
+        """Diffs 7-bit (64, 3) colors against the shadow copy and hands only changed pads to the writer."""
+        shadow = self._last_sent_pad_rgb7
+        changed = (shadow != rgb7).any(axis=1)
+        if requested_mask is None:
+            send_mask = changed; shadow[:] = rgb7
+        else:
+            send_mask = changed & requested_mask; shadow[requested_mask] = rgb7[requested_mask]
+        if self.pad_full_refresh_interval > 0:
+            self._pad_frames_since_full_refresh += 1
+            if self._pad_frames_since_full_refresh >= self.pad_full_refresh_interval:
+                # Resync every pad we know about, not only the ones in this update
+                send_mask = shadow[:, 0] >= 0; self._pad_frames_since_full_refresh = 0
+        if not send_mask.any(): return
+        # The writer merges these with any unsent pad update, so a busy link only ever sends the newest colors
+        self.output_writer.submit_pad_updates(shadow.astype(np.uint8), send_mask)
+
+    def set_pads_from_array(self, rgb_array: np.ndarray, bypass_global_brightness: bool = False):
+        """
+        Fast path for whole pad frames. Takes a (64, 3) (or (4, 16, 3)) uint8 RGB array in pad order.
+        """
+        if not self.is_connected(): return
+        colors = np.asarray(rgb_array)
+        if colors.size != PAD_COUNT * 3:
+            print(f"AkaiFireController: set_pads_from_array expects 64x3 colors, got shape {colors.shape}"); return
+        colors = colors.reshape(PAD_COUNT, 3)
+        if colors.dtype != np.uint8: colors = np.clip(colors, 0, 255).astype(np.uint8)
+        lut = self._unity_brightness_lut if bypass_global_brightness else self._brightness_lut
+        self._submit_pad_rgb7(apply_pad_lut(lut, colors))
+
     def set_pad_color(self, row, col, r8, g8, b8):
         if not self.is_connected() or not (0 <= row <= 3 and 0 <= col <= 15): return
-        # Apply global brightness factor
-        r_adj = int(r8 * self.current_brightness_factor)
-        g_adj = int(g8 * self.current_brightness_factor)
-        b_adj = int(b8 * self.current_brightness_factor)
         pad_idx = (row * 16) + col
-        # Ensure values are clamped after scaling before 7-bit conversion
-        r7 = max(0, min(r_adj, 255)) >> 1
-        g7 = max(0, min(g_adj, 255)) >> 1
-        b7 = max(0, min(b_adj, 255)) >> 1
-        self._send_sysex([0x65, 0x00, 0x04, pad_idx, r7, g7, b7])
+        rgb7 = self._last_sent_pad_rgb7.copy()
+        rgb7[pad_idx] = apply_pad_lut(self._brightness_lut, np.array([max(0, min(int(v), 255)) for v in (r8, g8, b8)]))
+        requested_mask = np.zeros(PAD_COUNT, dtype=bool); requested_mask[pad_idx] = True
+        self._submit_pad_rgb7(rgb7, requested_mask)
 
     def set_multiple_pads_color(self, pad_data_list, bypass_global_brightness: bool = False):
+        """Adapter for (idx, r, g, b) / (row, col, r, g, b) tuples; later entries for the same pad win."""
         if not self.is_connected() or not pad_data_list: return
-        payload = []
-        count = 0
-        brightness_to_apply = 1.0 if bypass_global_brightness else self.current_brightness_factor
-        # print(f"AkaiCtrl TRACE: set_multiple_pads_color using brightness_to_apply: {brightness_to_apply}, bypass_flag: {bypass_global_brightness}")
+        colors = np.zeros((PAD_COUNT, 3), dtype=np.int64)
+        requested_mask = np.zeros(PAD_COUNT, dtype=bool)
         for item in pad_data_list:
-            idx, r8, g8, b8 = -1, 0, 0, 0 # Default values
             if len(item) == 4: # Assuming (idx, r, g, b)
                 idx, r8, g8, b8 = item
             elif len(item) == 5: # Assuming (row, col, r, g, b)
-                ro, co, r_val, g_val, b_val = item
-                if 0 <= ro <= 3 and 0 <= co <= 15:
-                    idx = (ro * 16) + co
-                    r8, g8, b8 = r_val, g_val, b_val
-                else:
-                    continue # Skip invalid row/col
+                ro, co, r8, g8, b8 = item
+                if not (0 <= ro <= 3 and 0 <= co <= 15): continue # Skip invalid row/col
+                idx = (ro * 16) + co
             else:
                 continue # Skip malformed item
-            if idx == -1: continue
-            # Apply brightness
-            r_adj = int(r8 * brightness_to_apply)
-            g_adj = int(g8 * brightness_to_apply)
-            b_adj = int(b8 * brightness_to_apply)
-            # Ensure values are clamped after scaling before 7-bit conversion
-            r7 = max(0, min(r_adj, 255)) >> 1
-            g7 = max(0, min(g_adj, 255)) >> 1
-            b7 = max(0, min(b_adj, 255)) >> 1
-            payload.extend([idx, r7, g7, b7])
-            count += 1
-        if not payload: return
-        length = count * 4 # Each pad entry is 4 bytes (idx, r, g, b) in the SysEx payload
-        # print(
-        #     f"AFC DEBUG Sysex Payload: Count={count}, Length={length}, Payload Sample (first 20 bytes): {payload[:20]}")
-        self._send_sysex([0x65, (length >> 7) & 0x7F, length & 0x7F] + payload)
+            if not (0 <= idx < PAD_COUNT): continue
+            colors[idx] = (int(r8), int(g8), int(b8)); requested_mask[idx] = True
+        if not requested_mask.any(): return
+        lut = self._unity_brightness_lut if bypass_global_brightness else self._brightness_lut
+        self._submit_pad_rgb7(apply_pad_lut(lut, np.clip(colors, 0, 255)), requested_mask)
 
     def clear_all_pads(self):
         if not self.is_connected(): return
-        self.set_multiple_pads_color([(r*16+c,0,0,0) for r in range(4) for c in range(16)])   
+        self.set_pads_from_array(np.zeros((PAD_COUNT, 3), dtype=np.uint8))   
+
+    def _on_backend_input_messages(self, messages: list):
+        capture_writer = self.capture_writer
+        if capture_writer is not None:
+            for msg in messages: capture_writer.record_input(msg.bytes())
+        self._parse_midi_messages(messages)
+
+    def _parse_midi_messages(self, messages: list):
+        for msg in messages: self._parse_midi_message(msg)
 
     def _parse_midi_message(self, msg: mido.Message):
         if msg.type == 'note_on':
@@ -290,7 +723,7 @@ class AkaiFireController(QObject):
         # print(f"AkaiCtrl TRACE: oled_send_full_bitmap. Connected: {self.is_connected()}, Type: {type(packed_bitmap_data_7bit)}, Len: {len(packed_bitmap_data_7bit) if packed_bitmap_data_7bit is not None else 'None'}")
         if not self.is_connected():
             return
-        PACKED_LEN = 1176  # Defined in oled_renderer as PACKED_BITMAP_SIZE_BYTES
+        PACKED_LEN = OLED_PACKED_BITMAP_LEN  # Defined in oled_renderer as PACKED_BITMAP_SIZE_BYTES
         # Check if data is valid (bytes or bytearray and correct length)
         if not isinstance(packed_bitmap_data_7bit, (bytes, bytearray)) or \
             len(packed_bitmap_data_7bit) != PACKED_LEN:
@@ -304,29 +737,65 @@ class AkaiFireController(QObject):
             print(
                 f"AkaiFireController: OLED: Invalid 7-bit packed data. Expected {PACKED_LEN} B, got {data_len_str}B. Type: {actual_type_str}")
             return
-        ctrl_bytes = [0x00, 0x07, 0x00, 0x7F]
-        payload_data = list(packed_bitmap_data_7bit)
-        full_payload_for_sysex = ctrl_bytes + payload_data
-        payload_length = len(full_payload_for_sysex)
+        # Static or paused content is resent on every producer tick; drop exact repeats before they cost a transfer
+        frame = bytes(packed_bitmap_data_7bit)
+        if frame == self._last_submitted_oled_frame:
+            self.oled_frames_skipped += 1; self.transport_stats.record_dropped(MESSAGE_CLASS_OLED)
+            return
+        self._last_submitted_oled_frame = frame
+        # Latest frame wins: an OLED frame still waiting on the writer is replaced, never queued behind
+        self.output_writer.submit_oled_frame(frame)
+
+    def get_oled_frames_skipped(self) -> int:
+        """Number of OLED frames dropped because they matched the last frame sent."""
+        return self.oled_frames_skipped
+
+    def invalidate_oled_cache(self):
+        """Forget what the OLED is showing so the next frame is written in full."""
+        self._last_submitted_oled_frame = None
+        self._last_sent_oled_pages = None
+
+    def set_oled_full_refresh_interval(self, frames: int):
+        """Every `frames` OLED updates, write the whole screen instead of only the changed window (0 disables)."""
+        self.oled_full_refresh_interval = max(0, int(frames))
+        self._oled_frames_since_full_refresh = 0
+
+    def _build_oled_sysex(self, packed_bitmap_data_7bit: bytes) -> bytearray | memoryview | None:
+        """
+        Runs on the writer thread. Diffs the frame against the last one sent and returns a 0x0E SysEx
+        covering only the smallest page band x column range that changed, or None if nothing did.
+        The result is a view of a preallocated buffer, valid until the next call.
+        """
+        new_pages = unpack_7bit_stream_to_page_bytes(packed_bitmap_data_7bit, OLED_PAGES, OLED_COLUMNS)
+        last_pages = self._last_sent_oled_pages
+        full_refresh = last_pages is None or self._oled_resync_requested
+        self._oled_resync_requested = False
+        if self.oled_full_refresh_interval > 0:
+            self._oled_frames_since_full_refresh += 1
+            if self._oled_frames_since_full_refresh >= self.oled_full_refresh_interval:
+                full_refresh = True; self._oled_frames_since_full_refresh = 0
+        if full_refresh:
+            page_start, page_end, col_start, col_end = 0, OLED_PAGES - 1, 0, OLED_COLUMNS - 1
+        else:
+            changed = new_pages != last_pages
+            changed_pages = np.flatnonzero(changed.any(axis=1))
+            if len(changed_pages) == 0: return None
+            changed_cols = np.flatnonzero(changed.any(axis=0))
+            page_start, page_end = int(changed_pages[0]), int(changed_pages[-1])
+            col_start, col_end = int(changed_cols[0]), int(changed_cols[-1])
+        self._last_sent_oled_pages = new_pages
+        if (page_start, page_end, col_start, col_end) == (0, OLED_PAGES - 1, 0, OLED_COLUMNS - 1):
+            self._oled_sysex_full_bitmap[:] = packed_bitmap_data_7bit # Already packed for the full screen
+            return self._oled_sysex_full
+        window_data = pack_page_bytes_to_7bit_stream(new_pages[page_start:page_end + 1, col_start:col_end + 1])
+        payload_length = 4 + len(window_data)
+        buffer = self._oled_sysex_window
+        buffer[:4] = SYSEX_HEADER
         # Length bytes for SysEx message (high byte, low byte, 7-bit each)
-        len_h = (payload_length >> 7) & 0x7F
-        len_l = payload_length & 0x7F
-        sysex_command_and_data = [0x0E, len_h, len_l] + full_payload_for_sysex
-        # _send_sysex will wrap this with F0...F7
-        self._send_sysex(sysex_command_and_data)
-
-    def _pack_8bit_to_7bit_sysex_data(self, data_8bit: bytearray) -> list[int]:
-        # This function is no longer directly used by oled_send_full_bitmap
-        # but kept for potential other uses or reference.
-        packed_7bit_data = []; num_src = len(data_8bit)
-        for i in range(0, num_src, 7):
-            chunk = data_8bit[i:i+7]; n_chunk = len(chunk)
-            out_grp = [0]*8
-            for j in range(n_chunk): out_grp[j] = chunk[j] & 0x7F
-            msbs = 0
-            for j in range(n_chunk):
-                if (chunk[j] & 0x80): msbs |= (1 << j)
-            out_grp[7] = msbs
-            packed_7bit_data.extend(out_grp)
-        # print(f"DEBUG AkaiFireController (Packer): 8b len: {num_src}, 7b len: {len(packed_7bit_data)}")
-        return packed_7bit_data
\ No newline at end of file
+        buffer[4:11] = bytes([SYSEX_CMD_WRITE_OLED, (payload_length >> 7) & 0x7F, payload_length & 0x7F,
+                              page_start, page_end, col_start, col_end])
+        end = 11 + len(window_data)
+        view = memoryview(buffer)
+        view[11:end] = window_data
+        buffer[end] = 0xF7
+        return view[:end + 1]
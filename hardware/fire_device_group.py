@@ -0,0 +1,174 @@
+# AKAI_Fire_RGB_Controller/hardware/fire_device_group.py
+import numpy as np
+from PyQt6.QtCore import QObject, pyqtSignal
+from .akai_fire_controller import AkaiFireController, hex_colors_to_rgb_array, rgb_tuples_to_array, PAD_COUNT
+from .port_hotplug_monitor import PortHotplugMonitor
+
+PAD_ROWS = 4
+PAD_COLUMNS_PER_DEVICE = 16
+SPAN_MODE_MIRROR = "mirror"   # A 4x16 frame is shown as-is on every device
+SPAN_MODE_STRETCH = "stretch" # A 4x16 frame is widened (nearest neighbour) across all devices
+
+
+class FireDeviceGroup(QObject):
+    """
+    Several Fire units side by side, driven as one 4 x (16 * N) pad canvas.
+    Device 0 is the app's main controller (it keeps OLED, buttons and input); extra devices are
+    output-only AkaiFireControllers. Every controller has its own output writer thread, so the
+    per-device slices of a canvas frame are submitted in microseconds and go out in parallel.
+    All of them share one PortHotplugMonitor, so the port lists are polled once per interval for the whole group.
+    """
+    devices_changed = pyqtSignal(int) # Number of devices in the group
+
+    def __init__(self, primary_controller: AkaiFireController, parent=None):
+        super().__init__(parent)
+        self.primary_controller = primary_controller
+        self.extra_controllers: list[AkaiFireController] = []
+        self.span_mode = SPAN_MODE_MIRROR
+        self.hotplug_monitor = PortHotplugMonitor(parent=self) # Started by the first controller that connects
+        primary_controller.shared_hotplug_monitor = self.hotplug_monitor
+
+    # --- Membership ---
+    @property
+    def controllers(self) -> list[AkaiFireController]:
+        return [self.primary_controller] + self.extra_controllers
+
+    def device_count(self) -> int:
+        return 1 + len(self.extra_controllers)
+
+    def has_extra_devices(self) -> bool:
+        return bool(self.extra_controllers)
+
+    def canvas_columns(self) -> int:
+        return PAD_COLUMNS_PER_DEVICE * self.device_count()
+
+    def used_output_ports(self) -> list[str]:
+        return [c.port_name_used for c in self.controllers if c.port_name_used]
+
+    def add_device(self, out_port_name: str) -> bool:
+        """Opens another Fire output port and appends it to the right edge of the canvas."""
+        if out_port_name in self.used_output_ports():
+            print(f"FireDeviceGroup: '{out_port_name}' is already part of the group."); return False
+        controller = AkaiFireController(auto_connect=False)
+        controller.shared_hotplug_monitor = self.hotplug_monitor
+        controller.output_scheduler.configure(**self.primary_controller.output_scheduler.get_settings())
+        if not controller.connect(out_port_name):
+            controller.deleteLater(); return False
+        return self.add_controller(controller)
+
+    def add_controller(self, controller: AkaiFireController) -> bool:
+        """Adds an already-connected controller (e.g. one attached to a VirtualFireDevice)."""
+        if controller is self.primary_controller or controller in self.extra_controllers: return False
+        controller.set_global_brightness_factor(self.primary_controller.current_brightness_factor)
+        self.extra_controllers.append(controller)
+        self.devices_changed.emit(self.device_count())
+        return True
+
+    def remove_extra_devices(self):
+        if not self.extra_controllers: return
+        for controller in self.extra_controllers:
+            controller.disconnect()
+            controller.deleteLater()
+        self.extra_controllers = []
+        self.devices_changed.emit(self.device_count())
+
+    def stop_hotplug_monitor(self):
+        """Call once on shutdown, after the controllers have disconnected."""
+        self.hotplug_monitor.stop()
+        if not self.hotplug_monitor.wait(1000):
+            self.hotplug_monitor.terminate(); self.hotplug_monitor.wait()
+
+    def set_span_mode(self, mode: str):
+        if mode not in (SPAN_MODE_MIRROR, SPAN_MODE_STRETCH):
+            print(f"FireDeviceGroup: Unknown span mode '{mode}'"); return
+        self.span_mode = mode
+
+    def _sync_brightness(self):
+        brightness = self.primary_controller.current_brightness_factor
+        for controller in self.extra_controllers:
+            if controller.current_brightness_factor != brightness:
+                controller.set_global_brightness_factor(brightness)
+
+    # --- Output ---
+    def set_canvas_from_array(self, rgb_canvas: np.ndarray, bypass_global_brightness: bool = False):
+        """
+        Takes a (4, 16 * N, 3) uint8 canvas (or the same pixels flattened row-major) and sends each
+        device its 4x16 slice. Columns beyond the connected devices are ignored, missing ones stay dark.
+        """
+        canvas = np.asarray(rgb_canvas)
+        if canvas.ndim != 3:
+            if canvas.size % (PAD_ROWS * 3) != 0:
+                print(f"FireDeviceGroup: Canvas of shape {canvas.shape} is not 4 rows of RGB"); return
+            canvas = canvas.reshape(PAD_ROWS, -1, 3)
+        self._sync_brightness()
+        for i, controller in enumerate(self.controllers):
+            if not controller.is_connected(): continue
+            device_slice = canvas[:, i * PAD_COLUMNS_PER_DEVICE:(i + 1) * PAD_COLUMNS_PER_DEVICE]
+            if device_slice.shape[1] < PAD_COLUMNS_PER_DEVICE:
+                padded = np.zeros((PAD_ROWS, PAD_COLUMNS_PER_DEVICE, 3), dtype=np.uint8)
+                padded[:, :device_slice.shape[1]] = device_slice
+                device_slice = padded
+            controller.set_pads_from_array(device_slice, bypass_global_brightness=bypass_global_brightness)
+
+    def set_canvas_colors(self, colors: list, bypass_global_brightness: bool = False):
+        """Canvas as a row-major list of (r, g, b) tuples or hex strings, 4 * 16 * N entries."""
+        if not colors: return
+        if isinstance(colors[0], str):
+            canvas = hex_colors_to_rgb_array(colors)
+            if canvas is None: return
+        else:
+            canvas = rgb_tuples_to_array(colors)
+        self.set_canvas_from_array(canvas, bypass_global_brightness)
+
+    def set_pads_from_array(self, rgb_array: np.ndarray, bypass_global_brightness: bool = False):
+        """
+        Single-device (64, 3) / (4, 16, 3) frame from a 4x16 producer (animator, visualizer...),
+        spread over the group according to span_mode.
+        """
+        if not self.extra_controllers:
+            self.primary_controller.set_pads_from_array(rgb_array, bypass_global_brightness); return
+        frame = np.asarray(rgb_array)
+        if frame.size != PAD_COUNT * 3:
+            print(f"FireDeviceGroup: set_pads_from_array expects 64x3 colors, got shape {frame.shape}"); return
+        frame = frame.reshape(PAD_ROWS, PAD_COLUMNS_PER_DEVICE, 3)
+        if self.span_mode == SPAN_MODE_STRETCH:
+            columns = self.canvas_columns()
+            source_columns = (np.arange(columns) * PAD_COLUMNS_PER_DEVICE) // columns
+            self.set_canvas_from_array(frame[:, source_columns], bypass_global_brightness); return
+        self._sync_brightness()
+        for controller in self.controllers:
+            controller.set_pads_from_array(frame, bypass_global_brightness)
+
+    def set_multiple_pads_color(self, pad_data_list, bypass_global_brightness: bool = False):
+        """
+        Single-device (idx, r, g, b) / (row, col, r, g, b) updates, spread over the group like
+        set_pads_from_array: every device in mirror mode, the widened columns in stretch mode.
+        """
+        if not self.extra_controllers or self.span_mode != SPAN_MODE_STRETCH:
+            self._sync_brightness()
+            for controller in self.controllers: controller.set_multiple_pads_color(pad_data_list, bypass_global_brightness)
+            return
+        columns = self.canvas_columns()
+        source_columns = (np.arange(columns) * PAD_COLUMNS_PER_DEVICE) // columns
+        per_device = [[] for _ in self.controllers]
+        for item in pad_data_list:
+            if len(item) == 4: (row, col), color = divmod(item[0], PAD_COLUMNS_PER_DEVICE), item[1:]
+            elif len(item) == 5: row, col, color = item[0], item[1], item[2:]
+            else: continue
+            if not (0 <= row < PAD_ROWS and 0 <= col < PAD_COLUMNS_PER_DEVICE): continue
+            for canvas_col in np.flatnonzero(source_columns == col).tolist():
+                device, device_col = divmod(canvas_col, PAD_COLUMNS_PER_DEVICE)
+                per_device[device].append((row, device_col, *color))
+        self._sync_brightness()
+        for controller, device_data in zip(self.controllers, per_device):
+            if device_data: controller.set_multiple_pads_color(device_data, bypass_global_brightness)
+
+    def set_pad_color(self, row: int, col: int, r8: int, g8: int, b8: int):
+        self.set_multiple_pads_color([(row, col, r8, g8, b8)])
+
+    def clear_all_pads(self):
+        for controller in self.controllers: controller.clear_all_pads()
+
+    def clear_extra_pads(self):
+        """Blanks every device but the primary one (e.g. while a mode only drives device 0)."""
+        for controller in self.extra_controllers: controller.clear_all_pads()
@@ -0,0 +1,50 @@
+# AKAI_Fire_RGB_Controller/hardware/link_congestion.py
+import time
+
+DEFAULT_CONGESTION_CHECK_INTERVAL_MS = 250
+CONGESTED_BUSY_FRACTION = 0.5 # Writer spent half of the window blocked in send()
+CLEAR_BUSY_FRACTION = 0.25
+CONGESTED_QUEUE_DEPTH = 32 # FIFO messages still waiting at the end of a window
+MIN_RATE_SCALE = 0.25
+RATE_DECREASE_FACTOR = 0.7
+RATE_INCREASE_STEP = 0.1
+CLEAR_WINDOWS_BEFORE_RECOVERY = 2
+
+
+class LinkCongestionDetector:
+    """
+    Turns periodic samples of the writer's total send-blocking time and queue depth into a
+    congested flag and an output rate scale (1.0 = full rate) for producers to follow.
+    While congested the scale drops multiplicatively every window; once the link has been clear
+    for a couple of windows it climbs back additively, so producers settle just under what the link carries.
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.congested = False
+        self.rate_scale = 1.0
+        self.last_busy_fraction = 0.0
+        self._last_send_time_s = None
+        self._last_sample_at = None
+        self._clear_windows = 0
+
+    def update(self, total_send_time_s: float, queue_depth: int, now: float | None = None) -> bool:
+        """Feeds one sample; returns True if congested or rate_scale changed."""
+        now = time.monotonic() if now is None else now
+        if self._last_sample_at is None or now <= self._last_sample_at:
+            self._last_send_time_s, self._last_sample_at = total_send_time_s, now
+            return False
+        busy_fraction = max(0.0, total_send_time_s - self._last_send_time_s) / (now - self._last_sample_at)
+        self._last_send_time_s, self._last_sample_at = total_send_time_s, now
+        self.last_busy_fraction = busy_fraction
+        was_congested, old_scale = self.congested, self.rate_scale
+        if busy_fraction >= CONGESTED_BUSY_FRACTION or queue_depth >= CONGESTED_QUEUE_DEPTH:
+            self.congested = True; self._clear_windows = 0
+            self.rate_scale = max(MIN_RATE_SCALE, self.rate_scale * RATE_DECREASE_FACTOR)
+        elif busy_fraction < CLEAR_BUSY_FRACTION:
+            self._clear_windows += 1
+            if self._clear_windows >= CLEAR_WINDOWS_BEFORE_RECOVERY:
+                self.congested = False
+                self.rate_scale = min(1.0, self.rate_scale + RATE_INCREASE_STEP)
+        return self.congested != was_congested or self.rate_scale != old_scale
@@ -0,0 +1,35 @@
+# AKAI_Fire_RGB_Controller/hardware/midi_backends.py
+import mido
+
+# An output backend is anything with:
+#   send_bytes(message_bytes)  - write one complete MIDI message (called on the output writer thread)
+#   close()
+#   closed                     - True once the backend can no longer send
+# Backends that can also produce input (e.g. VirtualFireDevice) expose an `input_messages` signal
+# carrying a list of mido.Message, which AkaiFireController connects like a MidiInputThread batch.
+
+
+class MidoOutputBackend:
+    """Output backend for a real MIDI port opened through mido."""
+    def __init__(self, port):
+        self.port = port
+        self.name = getattr(port, 'name', None)
+        # mido's rtmidi ports wrap a python-rtmidi MidiOut, which takes raw bytes directly; using it skips
+        # building (and validating byte by byte) a mido.Message for every pad or OLED frame
+        self._raw_send = getattr(getattr(port, '_rt', None), 'send_message', None)
+
+    @classmethod
+    def open(cls, port_name: str) -> "MidoOutputBackend":
+        return cls(mido.open_output(port_name))
+
+    @property
+    def closed(self) -> bool:
+        return self.port is None or self.port.closed
+
+    def send_bytes(self, message_bytes):
+        if self._raw_send is not None: self._raw_send(message_bytes)
+        else: self.port.send(mido.Message.from_bytes(message_bytes))
+
+    def close(self):
+        if self.port is not None and not self.port.closed:
+            self.port.close()
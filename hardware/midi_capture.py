@@ -0,0 +1,214 @@
+# AKAI_Fire_RGB_Controller/hardware/midi_capture.py
+import os
+import sys
+import time
+import struct
+import tempfile
+import threading
+import mido
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from .midi_transport_stats import classify_message, MESSAGE_CLASSES
+
+# Capture file: CAPTURE_FILE_MAGIC, then one record per message:
+#   direction (u8), microseconds since the previous record (u32), length (u16), raw MIDI bytes
+CAPTURE_FILE_MAGIC = b"FIRECAP1"
+DIRECTION_OUT = 0
+DIRECTION_IN = 1
+_RECORD_HEADER = struct.Struct('<BIH')
+_MAX_DELTA_US = 0xFFFFFFFF
+
+
+class MidiCaptureWriter:
+    """
+    Appends every message it is given to a compact timestamped capture file.
+    Output is recorded on the writer thread and input on the MIDI callback thread, so record() locks.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'wb')
+        self._file.write(CAPTURE_FILE_MAGIC)
+        self._last_time = time.perf_counter()
+        self.messages_recorded = 0
+
+    def record(self, direction: int, message_bytes):
+        now = time.perf_counter()
+        data = bytes(message_bytes)
+        with self._lock:
+            if self._file is None: return
+            delta_us = min(int((now - self._last_time) * 1_000_000), _MAX_DELTA_US)
+            self._last_time = now
+            self._file.write(_RECORD_HEADER.pack(direction, delta_us, len(data)))
+            self._file.write(data)
+            self.messages_recorded += 1
+
+    def record_output(self, message_bytes): self.record(DIRECTION_OUT, message_bytes)
+
+    def record_input(self, message_bytes): self.record(DIRECTION_IN, message_bytes)
+
+    def close(self):
+        with self._lock:
+            if self._file is None: return
+            self._file.close(); self._file = None
+
+
+def read_capture(path: str) -> list[tuple[float, int, bytes]]:
+    """Returns [(seconds_since_first_record, direction, message_bytes), ...]."""
+    with open(path, 'rb') as f: raw = f.read()
+    if not raw.startswith(CAPTURE_FILE_MAGIC): raise ValueError(f"'{path}' is not a MIDI capture file")
+    records = []
+    offset = len(CAPTURE_FILE_MAGIC); elapsed_us = 0
+    while offset + _RECORD_HEADER.size <= len(raw):
+        direction, delta_us, length = _RECORD_HEADER.unpack_from(raw, offset)
+        offset += _RECORD_HEADER.size
+        if offset + length > len(raw): break # Truncated last record (capture not closed cleanly)
+        elapsed_us += delta_us if records else 0
+        records.append((elapsed_us / 1_000_000, direction, raw[offset:offset + length]))
+        offset += length
+    return records
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float | None:
+    if not sorted_values: return None
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def summarize_capture(records: list) -> dict:
+    """
+    Per-class output counts/bytes, input count, duration and input->output response times
+    (time from each input message to the next output message, in ms).
+    """
+    summary = {'duration_s': records[-1][0] - records[0][0] if records else 0.0,
+               'input_messages': 0, 'output_messages': 0, 'output_bytes': 0,
+               'output': {c: {'messages': 0, 'bytes': 0} for c in MESSAGE_CLASSES}}
+    response_ms = []
+    waiting_inputs = []
+    for timestamp, direction, data in records:
+        if direction == DIRECTION_IN:
+            summary['input_messages'] += 1; waiting_inputs.append(timestamp); continue
+        message_class = classify_message(data) if data else MESSAGE_CLASSES[-1]
+        summary['output_messages'] += 1; summary['output_bytes'] += len(data)
+        summary['output'][message_class]['messages'] += 1
+        summary['output'][message_class]['bytes'] += len(data)
+        for input_time in waiting_inputs: response_ms.append((timestamp - input_time) * 1000.0)
+        waiting_inputs = []
+    response_ms.sort()
+    summary['responses'] = len(response_ms)
+    summary['response_ms_p50'] = _percentile(response_ms, 0.50)
+    summary['response_ms_p95'] = _percentile(response_ms, 0.95)
+    summary['response_ms_max'] = response_ms[-1] if response_ms else None
+    return summary
+
+
+def compare_captures(reference: list, candidate: list) -> dict:
+    """
+    Compares two captures of the same input session: both summaries, plus how much of the
+    output stream is identical (messages matched in order, per message class).
+    """
+    result = {'reference': summarize_capture(reference), 'candidate': summarize_capture(candidate)}
+    matched = {}
+    for message_class in MESSAGE_CLASSES:
+        ref_stream = [d for _, direction, d in reference if direction == DIRECTION_OUT and classify_message(d) == message_class]
+        new_stream = [d for _, direction, d in candidate if direction == DIRECTION_OUT and classify_message(d) == message_class]
+        same = 0
+        for a, b in zip(ref_stream, new_stream):
+            if a != b: break
+            same += 1
+        matched[message_class] = {'identical_prefix': same, 'reference': len(ref_stream), 'candidate': len(new_stream),
+                                  'identical': same == len(ref_stream) == len(new_stream)}
+    result['output_match'] = matched
+    result['outputs_identical'] = all(m['identical'] for m in matched.values())
+    return result
+
+
+def format_summary(summary: dict) -> str:
+    def ms(value): return "-" if value is None else f"{value:.2f}"
+    lines = [f"  duration {summary['duration_s']:.2f} s, {summary['input_messages']} in / "
+             f"{summary['output_messages']} out ({summary['output_bytes']} bytes)"]
+    for message_class, counts in summary['output'].items():
+        if counts['messages']: lines.append(f"  {message_class:<11} {counts['messages']:>7} msgs {counts['bytes']:>10} bytes")
+    lines.append(f"  input->output ms: p50 {ms(summary['response_ms_p50'])}, p95 {ms(summary['response_ms_p95'])}, "
+                 f"max {ms(summary['response_ms_max'])}")
+    return "\n".join(lines)
+
+
+class MidiCaptureReplayer(QObject):
+    """
+    Replays the input side of a capture into an AkaiFireController (through _parse_midi_message,
+    exactly as live input arrives) on the GUI thread, captures everything the app sends in response,
+    and emits compare_captures(reference, replay) when done. speed > 1 replays faster than recorded.
+    """
+    finished = pyqtSignal(dict)
+    TICK_MS = 1
+
+    def __init__(self, akai_controller, reference_records: list, speed: float = 1.0, parent=None):
+        super().__init__(parent)
+        self.akai_controller = akai_controller
+        self.reference_records = reference_records
+        self.speed = max(0.01, float(speed))
+        self._inputs = [(t, data) for t, direction, data in reference_records if direction == DIRECTION_IN]
+        self._next_input = 0
+        self._started_at = 0.0
+        self._capture_path = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_tick)
+
+    def start(self) -> bool:
+        if not self._inputs: print("MidiCaptureReplayer: Capture has no input messages to replay."); return False
+        if self.akai_controller.is_capturing(): print("MidiCaptureReplayer: Stop the running capture first."); return False
+        fd, self._capture_path = tempfile.mkstemp(suffix=".firecap"); os.close(fd)
+        self.akai_controller.start_capture(self._capture_path)
+        self._next_input = 0
+        self._started_at = time.perf_counter() - self._inputs[0][0] / self.speed
+        self._timer.start(0)
+        return True
+
+    def cancel(self):
+        if self._timer.isActive(): self._timer.stop()
+        self._next_input = len(self._inputs)
+        self._finish()
+
+    def _on_tick(self):
+        elapsed = (time.perf_counter() - self._started_at) * self.speed
+        capture = self.akai_controller.capture_writer
+        while self._next_input < len(self._inputs) and self._inputs[self._next_input][0] <= elapsed:
+            data = self._inputs[self._next_input][1]; self._next_input += 1
+            try: message = mido.Message.from_bytes(data)
+            except (ValueError, TypeError): continue
+            if capture: capture.record_input(data)
+            self.akai_controller._parse_midi_message(message)
+        if self._next_input < len(self._inputs):
+            wait_ms = (self._inputs[self._next_input][0] - elapsed) * 1000.0 / self.speed
+            self._timer.start(max(self.TICK_MS, int(wait_ms)))
+            return
+        # Give the app the recorded tail (time after the last input) to finish responding
+        tail_s = (self.reference_records[-1][0] - self._inputs[-1][0]) / self.speed
+        QTimer.singleShot(int(tail_s * 1000) + 100, self._finish)
+
+    def _finish(self):
+        if self._capture_path is None: return
+        self.akai_controller.flush_output(2000)
+        self.akai_controller.stop_capture()
+        try: replay_records = read_capture(self._capture_path)
+        finally:
+            try: os.remove(self._capture_path)
+            except OSError: pass
+        self._capture_path = None
+        self.finished.emit(compare_captures(self.reference_records, replay_records))
+
+
+if __name__ == '__main__':
+    # python -m hardware.midi_capture info <file>  |  python -m hardware.midi_capture compare <reference> <candidate>
+    if len(sys.argv) == 3 and sys.argv[1] == 'info':
+        print(f"{sys.argv[2]}:\n{format_summary(summarize_capture(read_capture(sys.argv[2])))}")
+    elif len(sys.argv) == 4 and sys.argv[1] == 'compare':
+        comparison = compare_captures(read_capture(sys.argv[2]), read_capture(sys.argv[3]))
+        print(f"Reference {sys.argv[2]}:\n{format_summary(comparison['reference'])}")
+        print(f"Candidate {sys.argv[3]}:\n{format_summary(comparison['candidate'])}")
+        for message_class, m in comparison['output_match'].items():
+            if m['reference'] or m['candidate']:
+                print(f"  {message_class:<11} identical prefix {m['identical_prefix']}/{m['reference']} (candidate has {m['candidate']})")
+        print("Output streams identical." if comparison['outputs_identical'] else "Output streams differ.")
+    else:
+        print("Usage: python -m hardware.midi_capture info <file> | compare <reference> <candidate>")
@@ -0,0 +1,187 @@
+# AKAI_Fire_RGB_Controller/hardware/midi_output_writer.py
+import time
+from collections import deque
+import numpy as np
+from PyQt6.QtCore import QThread, QMutex, QMutexLocker, QWaitCondition
+from .output_frame_scheduler import OutputFrameScheduler, CHANNEL_MESSAGES, CHANNEL_PADS, CHANNEL_OLED
+from .midi_transport_stats import MidiTransportStats, classify_message, MESSAGE_CLASS_PAD, MESSAGE_CLASS_OLED
+
+DEFAULT_MAX_QUEUED_MESSAGES = 256
+DEFAULT_INTER_MESSAGE_DELAY_S = 0.002 # Pacing between SysEx messages, applied on the writer thread only
+
+
+class MidiOutputWriterThread(QThread):
+    """
+    Owns every write to the MIDI output port so callers on the GUI thread never block.
+    - Pad updates are merged into one pending slot (latest color per pad wins).
+    - OLED frames go into a single slot; a newer frame replaces any unsent one.
+    - Everything else (CCs, one-off SysEx) goes through a bounded FIFO.
+    - submit_call() runs a function on this thread between sends (e.g. swapping the output port).
+    An OutputFrameScheduler decides when each slot may go out (fps caps, bytes/s budget, pads before OLED).
+    """
+    def __init__(self, send_func, pad_sysex_builder, oled_sysex_builder, parent=None,
+                 max_queued_messages: int = DEFAULT_MAX_QUEUED_MESSAGES,
+                 inter_message_delay_s: float = DEFAULT_INTER_MESSAGE_DELAY_S,
+                 stats: MidiTransportStats | None = None,
+                 scheduler: OutputFrameScheduler | None = None):
+        super().__init__(parent)
+        self.setObjectName("MidiOutputWriterThread")
+        self._send_func = send_func # Callable(bytes) that writes one complete MIDI message
+        self._pad_sysex_builder = pad_sysex_builder # Callable(rgb7 (64, 3) uint8, send_mask (64,) bool) -> bytes
+        self._oled_sysex_builder = oled_sysex_builder # Callable(packed 7-bit bitmap) -> bytes, or None if nothing changed
+        self.inter_message_delay_s = inter_message_delay_s
+        self.stats = stats if stats is not None else MidiTransportStats()
+        self.scheduler = scheduler if scheduler is not None else OutputFrameScheduler()
+        self._mutex = QMutex()
+        self._wake_condition = QWaitCondition()
+        self._idle_condition = QWaitCondition()
+        self._message_queue: deque[bytes] = deque()
+        self._max_queued_messages = max(1, int(max_queued_messages))
+        self._pending_pad_rgb7 = np.zeros((64, 3), dtype=np.uint8)
+        self._pending_pad_mask = np.zeros(64, dtype=bool)
+        self._pending_oled: bytes | None = None # Packed 7-bit bitmap; turned into SysEx when it is actually sent
+        self._pending_calls: deque = deque() # Run before any further message, never while one is being sent
+        self._is_sending = False
+        self._running = True # Cleared by stop(); set up front so flush() works before run() begins
+        self.messages_dropped = 0 # FIFO overflow
+        self.oled_frames_replaced = 0 # Unsent OLED frames superseded by a newer one
+
+    # --- Producer side (any thread) ---
+    def submit_message(self, message_bytes: bytes):
+        with QMutexLocker(self._mutex):
+            if len(self._message_queue) >= self._max_queued_messages:
+                dropped = self._message_queue.popleft(); self.messages_dropped += 1
+                self.stats.record_dropped(classify_message(dropped))
+            self._message_queue.append(bytes(message_bytes))
+            self._wake_condition.wakeAll()
+
+    def submit_messages(self, messages: list):
+        """Queues several messages (e.g. a batch of LED CCs) under one lock with a single wake-up."""
+        if not messages: return
+        with QMutexLocker(self._mutex):
+            for message_bytes in messages:
+                if len(self._message_queue) >= self._max_queued_messages:
+                    dropped = self._message_queue.popleft(); self.messages_dropped += 1
+                    self.stats.record_dropped(classify_message(dropped))
+                self._message_queue.append(bytes(message_bytes))
+            self._wake_condition.wakeAll()
+
+    def submit_pad_updates(self, rgb7: np.ndarray, send_mask: np.ndarray):
+        with QMutexLocker(self._mutex):
+            if self._pending_pad_mask.any(): self.stats.record_coalesced(MESSAGE_CLASS_PAD)
+            self._pending_pad_rgb7[send_mask] = rgb7[send_mask]
+            self._pending_pad_mask |= send_mask
+            self._wake_condition.wakeAll()
+
+    def submit_oled_frame(self, packed_bitmap: bytes):
+        with QMutexLocker(self._mutex):
+            if self._pending_oled is not None:
+                self.oled_frames_replaced += 1; self.stats.record_coalesced(MESSAGE_CLASS_OLED)
+            self._pending_oled = bytes(packed_bitmap)
+            self._wake_condition.wakeAll()
+
+    def submit_call(self, func):
+        """Runs func() on the writer thread before anything submitted after it (also if the writer is stopping)."""
+        with QMutexLocker(self._mutex):
+            self._pending_calls.append(func)
+            self._wake_condition.wakeAll()
+
+    def queue_depth(self) -> int:
+        """FIFO messages waiting to be sent."""
+        with QMutexLocker(self._mutex): return len(self._message_queue)
+
+    def has_pending(self) -> bool:
+        with QMutexLocker(self._mutex):
+            return self._has_pending_locked() or self._is_sending
+
+    def flush(self, timeout_ms: int = 1000) -> bool:
+        """Blocks until everything submitted so far has been written, or the timeout expires."""
+        deadline = time.monotonic() + timeout_ms / 1000.0
+        with QMutexLocker(self._mutex):
+            while self._running and (self._has_pending_locked() or self._is_sending):
+                remaining_ms = int((deadline - time.monotonic()) * 1000)
+                if remaining_ms <= 0: return False
+                self._idle_condition.wait(self._mutex, remaining_ms)
+            return not (self._has_pending_locked() or self._is_sending)
+
+    def stop(self):
+        with QMutexLocker(self._mutex):
+            self._running = False
+            self._wake_condition.wakeAll()
+            self._idle_condition.wakeAll()
+
+    # --- Writer side ---
+    def _has_pending_locked(self) -> bool:
+        return bool(self._pending_calls) or bool(self._message_queue) or bool(self._pending_pad_mask.any()) \
+            or self._pending_oled is not None
+
+    def configure_scheduler(self, pad_max_fps: float | None = None, oled_max_fps: float | None = None,
+                            max_bytes_per_s: float | None = None):
+        with QMutexLocker(self._mutex):
+            self.scheduler.configure(pad_max_fps, oled_max_fps, max_bytes_per_s)
+            self._wake_condition.wakeAll()
+
+    def _take_next_locked(self, channel: str):
+        """Takes what channel sends next; _build_message turns it into bytes once the lock is released."""
+        if channel == CHANNEL_MESSAGES: return self._message_queue.popleft()
+        if channel == CHANNEL_PADS:
+            send_mask = self._pending_pad_mask.copy(); self._pending_pad_mask[:] = False
+            return self._pending_pad_rgb7.copy(), send_mask
+        if channel == CHANNEL_OLED:
+            frame, self._pending_oled = self._pending_oled, None
+            return frame
+        return None
+
+    def _build_message(self, channel: str, taken) -> bytes | None:
+        if channel == CHANNEL_PADS: return self._pad_sysex_builder(*taken)
+        if channel == CHANNEL_OLED:
+            # Diffed against what the device shows at send time, so coalesced frames still update correctly
+            sysex = self._oled_sysex_builder(taken)
+            if sysex is None: self.stats.record_dropped(MESSAGE_CLASS_OLED) # Nothing changed on screen
+            return sysex
+        return taken
+
+    @staticmethod
+    def _run_call(call):
+        try: call()
+        except Exception as e: print(f"MidiOutputWriterThread: Error in queued call: {e}")
+
+    def run(self):
+        while True:
+            with QMutexLocker(self._mutex):
+                channel = call = None
+                while self._running:
+                    if self._pending_calls: call = self._pending_calls.popleft(); break
+                    channel, wait_s = self.scheduler.next_channel(
+                        bool(self._message_queue), bool(self._pending_pad_mask.any()), self._pending_oled is not None)
+                    if channel is not None: break
+                    if wait_s <= 0: # Nothing pending at all
+                        self._idle_condition.wakeAll()
+                        self._wake_condition.wait(self._mutex)
+                    else: # Something is pending but capped; newer frames keep replacing it meanwhile
+                        self._wake_condition.wait(self._mutex, max(1, int(wait_s * 1000)))
+                if not self._running: break
+                taken = self._take_next_locked(channel) if call is None else None
+                self._is_sending = taken is not None or call is not None
+            if call is not None: self._run_call(call)
+            message = self._build_message(channel, taken) if taken is not None else None
+            if message is None:
+                with QMutexLocker(self._mutex):
+                    self._is_sending = False
+                    if not self._has_pending_locked(): self._idle_condition.wakeAll()
+                continue
+            send_start = time.perf_counter()
+            try: self._send_func(message)
+            except Exception as e: print(f"MidiOutputWriterThread: Error sending MIDI message: {e}")
+            self.stats.record_send(classify_message(message), len(message), time.perf_counter() - send_start)
+            with QMutexLocker(self._mutex): self.scheduler.on_sent(channel, len(message))
+            if self.inter_message_delay_s > 0 and message[0] == 0xF0: time.sleep(self.inter_message_delay_s)
+            with QMutexLocker(self._mutex):
+                self._is_sending = False
+                if not self._has_pending_locked(): self._idle_condition.wakeAll()
+        with QMutexLocker(self._mutex):
+            calls = list(self._pending_calls); self._pending_calls.clear()
+        for call in calls: self._run_call(call) # E.g. a port swap still has to hand over (and later close) its port
+        with QMutexLocker(self._mutex):
+            self._idle_condition.wakeAll()
+        # print("MidiOutputWriterThread: Stopped.")
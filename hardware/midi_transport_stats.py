@@ -0,0 +1,116 @@
+# AKAI_Fire_RGB_Controller/hardware/midi_transport_stats.py
+import time
+import threading
+
+MESSAGE_CLASS_PAD = "pad_sysex"
+MESSAGE_CLASS_OLED = "oled_sysex"
+MESSAGE_CLASS_CC = "cc"
+MESSAGE_CLASS_OTHER = "other"
+MESSAGE_CLASSES = (MESSAGE_CLASS_PAD, MESSAGE_CLASS_OLED, MESSAGE_CLASS_CC, MESSAGE_CLASS_OTHER)
+# Upper edges (ms) of the send-latency histogram buckets; the last bucket catches everything slower
+SEND_LATENCY_BUCKET_EDGES_MS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0)
+MIN_RATE_WINDOW_S = 1.0
+
+
+def classify_message(message_bytes) -> str:
+    first = message_bytes[0]
+    if first == 0xF0 and len(message_bytes) > 4:
+        if message_bytes[4] == 0x65: return MESSAGE_CLASS_PAD
+        if message_bytes[4] == 0x0E: return MESSAGE_CLASS_OLED
+        return MESSAGE_CLASS_OTHER
+    if (first & 0xF0) == 0xB0: return MESSAGE_CLASS_CC
+    return MESSAGE_CLASS_OTHER
+
+
+class MidiTransportStats:
+    """
+    Running counters for everything the output writer sends, per message class.
+    Recording is a handful of integer adds under a lock; rates and percentiles are only
+    computed when someone calls snapshot().
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._messages = dict.fromkeys(MESSAGE_CLASSES, 0)
+            self._bytes = dict.fromkeys(MESSAGE_CLASSES, 0)
+            self._send_time_s = dict.fromkeys(MESSAGE_CLASSES, 0.0)
+            self._max_send_time_s = dict.fromkeys(MESSAGE_CLASSES, 0.0)
+            self._latency_histogram = {c: [0] * (len(SEND_LATENCY_BUCKET_EDGES_MS) + 1) for c in MESSAGE_CLASSES}
+            self._coalesced = dict.fromkeys(MESSAGE_CLASSES, 0)
+            self._dropped = dict.fromkeys(MESSAGE_CLASSES, 0)
+            self._rate_reference = (time.monotonic(), dict(self._messages), dict(self._bytes), dict(self._send_time_s))
+            self._last_rates = {c: (0.0, 0.0, 0.0) for c in MESSAGE_CLASSES}
+
+    def record_send(self, message_class: str, num_bytes: int, send_time_s: float):
+        send_time_ms = send_time_s * 1000.0
+        bucket = 0
+        for edge in SEND_LATENCY_BUCKET_EDGES_MS:
+            if send_time_ms <= edge: break
+            bucket += 1
+        with self._lock:
+            self._messages[message_class] += 1
+            self._bytes[message_class] += num_bytes
+            self._send_time_s[message_class] += send_time_s
+            if send_time_s > self._max_send_time_s[message_class]: self._max_send_time_s[message_class] = send_time_s
+            self._latency_histogram[message_class][bucket] += 1
+
+    def record_coalesced(self, message_class: str, count: int = 1):
+        """A frame that was merged into or replaced by a newer one before it was sent."""
+        with self._lock: self._coalesced[message_class] += count
+
+    def record_dropped(self, message_class: str, count: int = 1):
+        """A frame or message that was never sent (queue overflow, duplicate frame)."""
+        with self._lock: self._dropped[message_class] += count
+
+    def total_send_time_s(self) -> float:
+        """Cumulative time spent blocked in send() across all classes; cheap enough to poll."""
+        with self._lock: return sum(self._send_time_s.values())
+
+    @staticmethod
+    def _percentile_ms(histogram: list[int], fraction: float) -> float | None:
+        total = sum(histogram)
+        if total == 0: return None
+        target = total * fraction; running = 0
+        for i, count in enumerate(histogram):
+            running += count
+            if running >= target:
+                return SEND_LATENCY_BUCKET_EDGES_MS[i] if i < len(SEND_LATENCY_BUCKET_EDGES_MS) else float('inf')
+        return float('inf')
+
+    def snapshot(self) -> dict:
+        """
+        Returns {message_class: {...}, 'uptime_s': float}. Per-class keys: messages, bytes,
+        messages_per_s, bytes_per_s, blocked_ms_per_s, send_ms_avg, send_ms_max, send_ms_p50/p95
+        (histogram bucket edges), latency_histogram, coalesced, dropped.
+        Rates cover the time since the rate window was last rolled (at least MIN_RATE_WINDOW_S).
+        """
+        now = time.monotonic()
+        with self._lock:
+            ref_time, ref_messages, ref_bytes, ref_send_time = self._rate_reference
+            elapsed = now - ref_time
+            if elapsed >= MIN_RATE_WINDOW_S:
+                for c in MESSAGE_CLASSES:
+                    self._last_rates[c] = ((self._messages[c] - ref_messages[c]) / elapsed,
+                                           (self._bytes[c] - ref_bytes[c]) / elapsed,
+                                           (self._send_time_s[c] - ref_send_time[c]) * 1000.0 / elapsed)
+                self._rate_reference = (now, dict(self._messages), dict(self._bytes), dict(self._send_time_s))
+            result = {'uptime_s': now - self._started_at}
+            for c in MESSAGE_CLASSES:
+                count = self._messages[c]
+                histogram = list(self._latency_histogram[c])
+                messages_per_s, bytes_per_s, blocked_ms_per_s = self._last_rates[c]
+                result[c] = {
+                    'messages': count, 'bytes': self._bytes[c],
+                    'messages_per_s': messages_per_s, 'bytes_per_s': bytes_per_s, 'blocked_ms_per_s': blocked_ms_per_s,
+                    'send_ms_avg': (self._send_time_s[c] * 1000.0 / count) if count else 0.0,
+                    'send_ms_max': self._max_send_time_s[c] * 1000.0,
+                    'send_ms_p50': self._percentile_ms(histogram, 0.50),
+                    'send_ms_p95': self._percentile_ms(histogram, 0.95),
+                    'latency_histogram': histogram,
+                    'coalesced': self._coalesced[c], 'dropped': self._dropped[c],
+                }
+        return result
@@ -0,0 +1,83 @@
+# AKAI_Fire_RGB_Controller/hardware/output_frame_scheduler.py
+import time
+
+CHANNEL_MESSAGES = "messages" # CCs and one-off SysEx from the FIFO; never frame-rate capped
+CHANNEL_PADS = "pads"
+CHANNEL_OLED = "oled"
+
+# All limits are off (0 = unlimited) unless set with AkaiFireController.configure_output_scheduler
+DEFAULT_PAD_MAX_FPS = 0.0
+DEFAULT_OLED_MAX_FPS = 0.0
+DEFAULT_MAX_BYTES_PER_S = 0
+BUDGET_BURST_S = 0.05 # How much unused budget may be saved up for a burst
+
+
+class OutputFrameScheduler:
+    """
+    Decides what the output writer may send next, on a steady monotonic clock.
+    - Each frame channel (pads, OLED) has an fps cap; a frame arriving early simply waits in its
+      latest-frame-wins slot, so anything that goes stale in the meantime is replaced, not queued.
+    - A token bucket enforces the total bytes/s budget across all channels.
+    - When several channels are ready, FIFO messages go first, then pads, then OLED.
+    Not thread-safe on its own; the writer only touches it while holding its mutex.
+    """
+    def __init__(self, pad_max_fps: float = DEFAULT_PAD_MAX_FPS, oled_max_fps: float = DEFAULT_OLED_MAX_FPS,
+                 max_bytes_per_s: float = DEFAULT_MAX_BYTES_PER_S):
+        self._next_due = {CHANNEL_PADS: 0.0, CHANNEL_OLED: 0.0}
+        self._budget_tokens = 0.0
+        self._budget_updated_at = time.monotonic()
+        self.configure(pad_max_fps, oled_max_fps, max_bytes_per_s)
+
+    def configure(self, pad_max_fps: float | None = None, oled_max_fps: float | None = None,
+                  max_bytes_per_s: float | None = None):
+        """None leaves a setting unchanged; 0 disables that limit."""
+        if pad_max_fps is not None: self.pad_max_fps = max(0.0, float(pad_max_fps))
+        if oled_max_fps is not None: self.oled_max_fps = max(0.0, float(oled_max_fps))
+        if max_bytes_per_s is not None:
+            self.max_bytes_per_s = max(0.0, float(max_bytes_per_s))
+            self._budget_tokens = self._burst_capacity()
+
+    def get_settings(self) -> dict:
+        return {'pad_max_fps': self.pad_max_fps, 'oled_max_fps': self.oled_max_fps, 'max_bytes_per_s': self.max_bytes_per_s}
+
+    def _burst_capacity(self) -> float:
+        # Always allow at least one full-screen OLED write to go through in one piece
+        return max(self.max_bytes_per_s * BUDGET_BURST_S, 1200.0)
+
+    def _refill(self, now: float):
+        if self.max_bytes_per_s <= 0: return
+        elapsed = now - self._budget_updated_at
+        self._budget_updated_at = now
+        self._budget_tokens = min(self._burst_capacity(), self._budget_tokens + elapsed * self.max_bytes_per_s)
+
+    def _budget_wait_s(self) -> float:
+        if self.max_bytes_per_s <= 0 or self._budget_tokens > 0: return 0.0
+        return -self._budget_tokens / self.max_bytes_per_s + 1e-4
+
+    def next_channel(self, has_messages: bool, has_pads: bool, has_oled: bool, now: float | None = None) -> tuple[str | None, float]:
+        """
+        Returns (channel, 0.0) if something may be sent now, else (None, seconds_to_wait).
+        seconds_to_wait is 0.0 with channel None when nothing is pending at all.
+        """
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        if not (has_messages or has_pads or has_oled): return None, 0.0
+        budget_wait = self._budget_wait_s()
+        if budget_wait > 0: return None, budget_wait
+        if has_messages: return CHANNEL_MESSAGES, 0.0
+        waits = []
+        for channel, pending in ((CHANNEL_PADS, has_pads), (CHANNEL_OLED, has_oled)):
+            if not pending: continue
+            wait = self._next_due[channel] - now
+            if wait <= 0: return channel, 0.0
+            waits.append(wait)
+        return None, min(waits)
+
+    def on_sent(self, channel: str, num_bytes: int, now: float | None = None):
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        if self.max_bytes_per_s > 0: self._budget_tokens -= num_bytes
+        max_fps = self.pad_max_fps if channel == CHANNEL_PADS else self.oled_max_fps if channel == CHANNEL_OLED else 0.0
+        if max_fps > 0:
+            # Keep a steady cadence; after a late send, catch up at no more than twice the cap
+            self._next_due[channel] = max(self._next_due[channel] + 1.0 / max_fps, now + 0.5 / max_fps)
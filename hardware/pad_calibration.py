@@ -0,0 +1,63 @@
+# AKAI_Fire_RGB_Controller/hardware/pad_calibration.py
+import os
+import json
+import numpy as np
+
+PAD_CALIBRATION_FILENAME = "pad_calibration.json"
+CHANNEL_OFFSETS = np.array([0, 256, 512], dtype=np.int16) # Row offsets into a flattened (3, 256) table
+
+
+class PadCalibration:
+    """
+    Color response of one Fire's pads, per channel (r, g, b):
+    - gamma: applied to the normalized 8-bit input (1.0 = linear)
+    - white_balance: channel gain after gamma (e.g. (1.0, 0.85, 0.7) to tame a blue-ish white)
+    - brightness_gamma: shapes the global brightness factor (1.0 = linear, > 1 gives finer control near the bottom)
+    compile_lut() bakes all of it plus a brightness level into one (3, 256) table of 7-bit values.
+    """
+    def __init__(self, gamma=(1.0, 1.0, 1.0), white_balance=(1.0, 1.0, 1.0), brightness_gamma: float = 1.0):
+        self.gamma = tuple(max(0.05, float(g)) for g in gamma)
+        self.white_balance = tuple(max(0.0, min(float(w), 1.0)) for w in white_balance)
+        self.brightness_gamma = max(0.05, float(brightness_gamma))
+
+    def is_identity(self) -> bool:
+        return self.gamma == (1.0, 1.0, 1.0) and self.white_balance == (1.0, 1.0, 1.0) and self.brightness_gamma == 1.0
+
+    def compile_lut(self, brightness: float) -> np.ndarray:
+        """(3, 256) uint8 table mapping each 8-bit channel value to the 7-bit value sent to the pad."""
+        brightness = max(0.0, min(float(brightness), 1.0)) ** self.brightness_gamma
+        levels = np.arange(256, dtype=np.float64)
+        lut = np.empty((3, 256), dtype=np.uint8)
+        for channel in range(3):
+            curve = levels if self.gamma[channel] == 1.0 else 255.0 * (levels / 255.0) ** self.gamma[channel]
+            scaled = (curve * self.white_balance[channel] * brightness).astype(np.int64)
+            lut[channel] = np.clip(scaled, 0, 255) >> 1
+        return lut
+
+    def to_dict(self) -> dict:
+        return {'gamma': list(self.gamma), 'white_balance': list(self.white_balance), 'brightness_gamma': self.brightness_gamma}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PadCalibration":
+        return cls(data.get('gamma', (1.0, 1.0, 1.0)), data.get('white_balance', (1.0, 1.0, 1.0)),
+                   data.get('brightness_gamma', 1.0))
+
+
+def apply_pad_lut(lut_flat: np.ndarray, colors: np.ndarray) -> np.ndarray:
+    """Maps (N, 3) uint8 colors through a flattened (3, 256) table in one take."""
+    return np.take(lut_flat, colors + CHANNEL_OFFSETS)
+
+
+def load_pad_calibration(path: str, port_name: str | None) -> PadCalibration:
+    """
+    Reads {"default": {...}, "<output port name>": {...}} and returns the entry for port_name,
+    else "default", else an identity calibration.
+    """
+    if not os.path.exists(path): return PadCalibration()
+    try:
+        with open(path, 'r') as f: entries = json.load(f)
+        data = entries.get(port_name) if port_name else None
+        return PadCalibration.from_dict(data or entries.get('default') or {})
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        print(f"PadCalibration: Could not read '{path}': {e}")
+        return PadCalibration()
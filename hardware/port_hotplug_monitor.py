@@ -0,0 +1,117 @@
+# AKAI_Fire_RGB_Controller/hardware/port_hotplug_monitor.py
+import re
+import mido
+from PyQt6.QtCore import QThread, QMutex, QMutexLocker, QWaitCondition
+
+DEFAULT_HOTPLUG_POLL_INTERVAL_MS = 300 # Listing ports walks the OS MIDI API; a replug is noticed within a third of a second
+
+
+def match_port_name(wanted: str, available: list[str], owned=()) -> str | None:
+    """
+    Exact name if present. Otherwise the same device under a new index suffix (Windows renumbers
+    e.g. 'FL STUDIO FIRE 1' to 'FL STUDIO FIRE 2' after a replug), but only among ports nobody
+    else owns, so two identical Fires never pick up each other's port.
+    """
+    if wanted in available: return wanted
+    base = re.sub(r"[\s\d:]+$", "", wanted)
+    for name in available:
+        if name not in owned and re.sub(r"[\s\d:]+$", "", name) == base: return name
+    return None
+
+
+class _PortWatch:
+    """One owner's output (and optional input) port as seen by the monitor."""
+    def __init__(self, output_port_name, input_port_name, on_output_lost, on_output_restored,
+                 on_input_lost, on_input_restored):
+        self.output_port_name, self.input_port_name = output_port_name, input_port_name
+        self.on_output_lost, self.on_output_restored = on_output_lost, on_output_restored
+        self.on_input_lost, self.on_input_restored = on_input_lost, on_input_restored
+        self.output_present = self.input_present = True
+
+
+class PortHotplugMonitor(QThread):
+    """
+    Polls the MIDI port lists once per interval for every registered owner (one monitor can serve
+    a whole FireDeviceGroup) and reports when a watched output/input port disappears or comes back.
+    Callbacks run on this thread, so they should only do the blocking part (e.g. reopening a port)
+    and hand state changes to their owner's thread:
+      on_output_lost(), on_output_restored(port_name) -> bool, on_input_lost(), on_input_restored(port_name) -> bool
+    A restore callback returning False is retried on the next poll.
+    """
+    def __init__(self, poll_interval_ms: int = DEFAULT_HOTPLUG_POLL_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.poll_interval_ms = max(10, int(poll_interval_ms))
+        self._watches: dict[object, _PortWatch] = {}
+        self._running = True
+        self._mutex = QMutex()
+        self._stop_condition = QWaitCondition()
+        self.setObjectName("PortHotplugMonitor")
+
+    def watch(self, owner, output_port_name: str, input_port_name: str | None,
+              on_output_lost, on_output_restored, on_input_lost=None, on_input_restored=None):
+        """Starts (or replaces) owner's watch; the thread is started on first use."""
+        with QMutexLocker(self._mutex):
+            self._watches[owner] = _PortWatch(output_port_name, input_port_name, on_output_lost, on_output_restored,
+                                              on_input_lost, on_input_restored)
+            start = self._running and not self.isRunning()
+        if start: self.start()
+
+    def unwatch(self, owner):
+        with QMutexLocker(self._mutex): self._watches.pop(owner, None)
+
+    def watch_count(self) -> int:
+        with QMutexLocker(self._mutex): return len(self._watches)
+
+    def set_input_port_name(self, owner, port_name: str | None):
+        with QMutexLocker(self._mutex):
+            watch = self._watches.get(owner)
+            if watch is not None: watch.input_port_name, watch.input_present = port_name, True
+
+    def stop(self):
+        with QMutexLocker(self._mutex):
+            self._running = False
+            self._stop_condition.wakeAll()
+
+    @staticmethod
+    def _port_names(getter) -> list[str] | None:
+        try: return getter()
+        except Exception as e:
+            print(f"PortHotplugMonitor: Error listing MIDI ports: {e}"); return None
+
+    def run(self):
+        while True:
+            with QMutexLocker(self._mutex):
+                if self._running: self._stop_condition.wait(self._mutex, self.poll_interval_ms)
+                if not self._running: break
+                watches = list(self._watches.values())
+            if not watches: continue
+            outputs = self._port_names(mido.get_output_names)
+            if outputs is not None: self._poll_outputs(watches, outputs)
+            if not any(w.input_port_name and w.on_input_restored for w in watches): continue
+            inputs = self._port_names(mido.get_input_names)
+            if inputs is not None: self._poll_inputs(watches, inputs)
+
+    def _poll_outputs(self, watches: list, outputs: list[str]):
+        for watch in watches:
+            owned = {w.output_port_name for w in watches if w is not watch}
+            match = match_port_name(watch.output_port_name, outputs, owned)
+            if watch.output_present and match is None:
+                watch.output_present = False
+                print(f"PortHotplugMonitor: Output '{watch.output_port_name}' disappeared.")
+                watch.on_output_lost()
+            elif not watch.output_present and match is not None and watch.on_output_restored(match):
+                watch.output_present = True; watch.output_port_name = match
+                print(f"PortHotplugMonitor: Output restored on '{match}'.")
+
+    def _poll_inputs(self, watches: list, inputs: list[str]):
+        for watch in watches:
+            with QMutexLocker(self._mutex): input_port_name = watch.input_port_name
+            if not input_port_name or watch.on_input_restored is None: continue
+            owned = {w.input_port_name for w in watches if w is not watch and w.input_port_name}
+            match = match_port_name(input_port_name, inputs, owned)
+            if watch.input_present and match is None:
+                watch.input_present = False
+                if watch.on_input_lost: watch.on_input_lost()
+            elif not watch.input_present and match is not None and watch.on_input_restored(match):
+                with QMutexLocker(self._mutex):
+                    if watch.input_port_name == input_port_name: watch.input_port_name, watch.input_present = match, True
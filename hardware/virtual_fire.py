@@ -0,0 +1,152 @@
+# AKAI_Fire_RGB_Controller/hardware/virtual_fire.py
+import time
+import threading
+from collections import deque
+import mido
+import numpy as np
+from PyQt6.QtCore import QObject, pyqtSignal
+from oled_utils.oled_renderer import unpack_7bit_stream_to_page_bytes
+from .akai_fire_controller import (
+    SYSEX_HEADER, SYSEX_CMD_SET_PAD_COLORS, SYSEX_CMD_WRITE_OLED,
+    FIRE_PAD_NOTE_OFFSET, OLED_PAGES, OLED_COLUMNS, PAD_COUNT
+)
+
+MESSAGE_KIND_PAD_SYSEX = "pad_sysex"
+MESSAGE_KIND_OLED_SYSEX = "oled_sysex"
+MESSAGE_KIND_CC = "cc"
+MESSAGE_KIND_OTHER = "other"
+DEFAULT_MESSAGE_LOG_SIZE = 10000
+
+
+class VirtualFireDevice(QObject):
+    """
+    In-process stand-in for an Akai Fire, usable as an AkaiFireController output backend
+    (controller.connect_backend(VirtualFireDevice())). Decodes what the controller sends back
+    into pad colors and an OLED bitmap, and can inject pad/button/encoder input.
+    - bandwidth_bytes_per_s: if set, send_bytes() blocks as long as a USB-MIDI link of that speed would.
+    """
+    input_messages = pyqtSignal(list) # Same shape as MidiInputThread.messages_received
+    pads_updated = pyqtSignal()
+    oled_updated = pyqtSignal()
+
+    def __init__(self, name: str = "Virtual FL STUDIO FIRE", bandwidth_bytes_per_s: float | None = None,
+                 message_log_size: int = DEFAULT_MESSAGE_LOG_SIZE, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.bandwidth_bytes_per_s = bandwidth_bytes_per_s
+        self.closed = False
+        self._lock = threading.Lock() # send_bytes() runs on the controller's writer thread
+        self._pad_rgb7 = np.zeros((PAD_COUNT, 3), dtype=np.uint8)
+        self._oled_pages = np.zeros((OLED_PAGES, OLED_COLUMNS), dtype=np.uint8)
+        self.led_states: dict[int, int] = {} # CC number -> last value
+        # (timestamp, kind, size_in_bytes) for every message received, newest last
+        self.message_log: deque = deque(maxlen=message_log_size)
+        self.message_counts = {MESSAGE_KIND_PAD_SYSEX: 0, MESSAGE_KIND_OLED_SYSEX: 0, MESSAGE_KIND_CC: 0, MESSAGE_KIND_OTHER: 0}
+        self.bytes_received = 0
+
+    # --- Output backend interface ---
+    def send_bytes(self, message_bytes):
+        data = bytes(message_bytes)
+        if self.bandwidth_bytes_per_s:
+            # USB-MIDI carries at most 3 MIDI bytes per 4-byte packet
+            time.sleep((-(-len(data) // 3) * 4) / self.bandwidth_bytes_per_s)
+        timestamp = time.perf_counter()
+        with self._lock:
+            kind = self._decode_locked(data)
+            self.message_log.append((timestamp, kind, len(data)))
+            self.message_counts[kind] += 1
+            self.bytes_received += len(data)
+        if kind == MESSAGE_KIND_PAD_SYSEX: self.pads_updated.emit()
+        elif kind == MESSAGE_KIND_OLED_SYSEX: self.oled_updated.emit()
+
+    def close(self):
+        self.closed = True
+
+    def _decode_locked(self, data: bytes) -> str:
+        if data[:4] == SYSEX_HEADER and data[-1] == 0xF7 and len(data) >= 8:
+            command = data[4]
+            length = (data[5] << 7) | data[6]
+            payload = data[7:7 + length]
+            if command == SYSEX_CMD_SET_PAD_COLORS:
+                entries = np.frombuffer(payload[:len(payload) // 4 * 4], dtype=np.uint8).reshape(-1, 4)
+                valid = entries[:, 0] < PAD_COUNT
+                self._pad_rgb7[entries[valid, 0]] = entries[valid, 1:]
+                return MESSAGE_KIND_PAD_SYSEX
+            if command == SYSEX_CMD_WRITE_OLED and len(payload) >= 4:
+                page_start, page_end, col_start, col_end = payload[:4]
+                num_pages, num_cols = page_end - page_start + 1, col_end - col_start + 1
+                region = unpack_7bit_stream_to_page_bytes(payload[4:], num_pages, num_cols)
+                self._oled_pages[page_start:page_end + 1, col_start:col_end + 1] = region
+                return MESSAGE_KIND_OLED_SYSEX
+            return MESSAGE_KIND_OTHER
+        if len(data) == 3 and (data[0] & 0xF0) == 0xB0:
+            self.led_states[data[1]] = data[2]
+            return MESSAGE_KIND_CC
+        return MESSAGE_KIND_OTHER
+
+    # --- Decoded device state ---
+    def get_pad_colors_7bit(self) -> np.ndarray:
+        """(4, 16, 3) uint8 array of the 7-bit colors the pads are showing."""
+        with self._lock: return self._pad_rgb7.reshape(4, 16, 3).copy()
+
+    def get_pad_colors_rgb(self) -> np.ndarray:
+        """(4, 16, 3) uint8 array of pad colors expanded back to 8-bit."""
+        return self.get_pad_colors_7bit() << 1
+
+    def get_oled_bitmap(self) -> np.ndarray:
+        """(64, 128) bool array of the OLED contents, True = lit."""
+        with self._lock: pages = self._oled_pages.copy()
+        bits = np.unpackbits(pages[:, :, np.newaxis], axis=2, bitorder='little') # (pages, cols, 8 rows)
+        return bits.transpose(0, 2, 1).reshape(OLED_PAGES * 8, OLED_COLUMNS).astype(bool)
+
+    def clear_message_log(self):
+        with self._lock:
+            self.message_log.clear()
+            for kind in self.message_counts: self.message_counts[kind] = 0
+            self.bytes_received = 0
+
+    # --- Input injection ---
+    def inject_messages(self, messages: list):
+        """Delivers messages to the connected controller exactly like a MidiInputThread batch."""
+        if messages: self.input_messages.emit(list(messages))
+
+    def press_pad(self, row: int, col: int, velocity: int = 100):
+        self.inject_messages([mido.Message('note_on', note=FIRE_PAD_NOTE_OFFSET + row * 16 + col, velocity=velocity)])
+
+    def release_pad(self, row: int, col: int):
+        self.inject_messages([mido.Message('note_off', note=FIRE_PAD_NOTE_OFFSET + row * 16 + col, velocity=0)])
+
+    def press_button(self, note: int):
+        self.inject_messages([mido.Message('note_on', note=note, velocity=127)])
+
+    def release_button(self, note: int):
+        self.inject_messages([mido.Message('note_off', note=note, velocity=0)])
+
+    def turn_encoder(self, control_cc: int, delta: int):
+        """Relative encoder turn; one CC per tick (1 = clockwise, 127 = counter-clockwise) like the hardware."""
+        value = 1 if delta > 0 else 127
+        self.inject_messages([mido.Message('control_change', control=control_cc, value=value) for _ in range(abs(delta))])
+
+
+if __name__ == '__main__':
+    # Headless throughput check: python -m hardware.virtual_fire
+    from PyQt6.QtCore import QCoreApplication
+    from .akai_fire_controller import AkaiFireController
+    from oled_utils.oled_renderer import pack_page_bytes_to_7bit_stream
+    app = QCoreApplication([])
+    device = VirtualFireDevice(bandwidth_bytes_per_s=None)
+    controller = AkaiFireController(auto_connect=False)
+    controller.connect_backend(device)
+    controller.flush_output(); device.clear_message_log()
+    rng = np.random.default_rng(0)
+    num_frames = 300
+    start = time.perf_counter()
+    for i in range(num_frames):
+        controller.set_pads_from_array(rng.integers(0, 256, (PAD_COUNT, 3), dtype=np.uint8))
+        controller.oled_send_full_bitmap(pack_page_bytes_to_7bit_stream(rng.integers(0, 256, (OLED_PAGES, OLED_COLUMNS), dtype=np.uint8)))
+    submit_s = time.perf_counter() - start
+    controller.flush_output(10000)
+    total_s = time.perf_counter() - start
+    print(f"Submitted {num_frames} pad+OLED frames in {submit_s * 1000:.1f} ms, drained in {total_s * 1000:.1f} ms")
+    print(f"Device received: {device.message_counts}, {device.bytes_received} bytes")
+    controller.disconnect()
@@ -25,6 +25,10 @@ APP_NAME_FOR_CONFIG = "Akai Fire RGB Controller"
 APP_AUTHOR_FOR_CONFIG = "Reg0lino"
 
 
+def _hsv_to_rgb(h: float, s: float, v: float, a: float = 1.0) -> tuple[int, int, int]:
+    return QColor.fromHsvF(h, s, v, a).getRgb()[:3]
+
+
 class AudioProcessingThread(QThread):
     fft_data_ready = pyqtSignal(np.ndarray, int, int)
     error_occurred = pyqtSignal(str)
@@ -142,7 +146,7 @@ class AudioProcessingThread(QThread):
         self._is_running = False
 
 class AudioVisualizerManager(QObject):
-    pad_data_ready = pyqtSignal(list)
+    pad_data_ready = pyqtSignal(np.ndarray) # (64, 3) uint8 RGB frame in pad order
     available_devices_updated = pyqtSignal(list)
     capture_error = pyqtSignal(str)
     capture_started_signal = pyqtSignal()
@@ -752,12 +756,12 @@ class AudioVisualizerManager(QObject):
         normalized_powers *= (active_sensitivity_factor * 2.0)
         return np.clip(normalized_powers, 0.0, 1.0)
 
-    def _map_spectrum_bars_to_pads(self, band_powers: np.ndarray) -> list[str]:
-        pad_colors_hex = ["#000000"] * 64
+    def _map_spectrum_bars_to_pads(self, band_powers: np.ndarray) -> np.ndarray:
+        pad_colors = np.zeros((64, 3), dtype=np.uint8)
         num_bands_from_data = len(band_powers)
         bands_to_render = min(num_bands_from_data, NUMBER_OF_BANDS, 16)
         if bands_to_render == 0:
-            return pad_colors_hex
+            return pad_colors
         if not self.band_colors:
             operational_band_colors = DEFAULT_MANAGER_BAND_COLORS_QCOLOR
         else:
@@ -802,10 +806,9 @@ class AudioVisualizerManager(QObject):
                         final_val = min(1.0, max(0.0, val_comp))
                         if final_val < 0.25 and power > 0.01:
                             final_val = 0.25
-                        pad_colors_hex[pad_1d_index] = QColor.fromHsvF(
-                            h, s, final_val, a).name() if final_val > 0 else "#000000"
+                        pad_colors[pad_1d_index] = _hsv_to_rgb(h, s, final_val, a) if final_val > 0 else 0
                     else:
-                        pad_colors_hex[pad_1d_index] = "#000000"
+                        pad_colors[pad_1d_index] = 0
             current_col_start_on_grid += current_band_width_on_grid
         # --- TEMPORARY DEBUG for 4th row issue ---
         # (You can re-enable this if the issue persists after the change)
@@ -816,12 +819,12 @@ class AudioVisualizerManager(QObject):
         #     print(f"DEBUG AVM (PostFix): High power for band 0: {debug_power_band0:.4f}. rows_to_light_count (for band 0): {debug_rows_calc}")
         #     first_band_first_col_idx_top = 0
         #     first_band_first_col_idx_bottom = 3*16 + 0
-        #     print(f"  Pad 0 (top): {pad_colors_hex[first_band_first_col_idx_top]}, Pad 48 (bottom): {pad_colors_hex[first_band_first_col_idx_bottom]}")
+        #     print(f"  Pad 0 (top): {pad_colors[first_band_first_col_idx_top]}, Pad 48 (bottom): {pad_colors[first_band_first_col_idx_bottom]}")
         # --- END TEMPORARY DEBUG ---
-        return pad_colors_hex
+        return pad_colors
 
-    def _map_pulse_wave_to_pads(self, loudness_norm: float) -> list[str]:
-        pad_colors_hex = ["#000000"] * 64  # Start with all pads black
+    def _map_pulse_wave_to_pads(self, loudness_norm: float) -> np.ndarray:
+        pad_colors = np.zeros((64, 3), dtype=np.uint8)  # Start with all pads black
         # --- Speed Control ---
         min_update_delay_s = 0.02
         max_update_delay_s = 0.5
@@ -846,8 +849,8 @@ class AudioVisualizerManager(QObject):
         if effective_brightness > 0.01 and main_pulse_v < min_pulse_v_if_active:
             main_pulse_v = min_pulse_v_if_active
         main_pulse_v = min(1.0, max(0.0, main_pulse_v))
-        main_pulse_final_color_hex = QColor.fromHsvF(
-            base_h, base_s, main_pulse_v, base_a).name() if main_pulse_v > 0.001 else "#000000"
+        main_pulse_final_color = _hsv_to_rgb(
+            base_h, base_s, main_pulse_v, base_a) if main_pulse_v > 0.001 else 0
         # --- Fading Edges Parameters ---
         num_fade_columns_each_side = 1 # How many columns to fade on each side
         fade_brightness_multiplier = 0.4 # Brightness of adjacent columns relative to main pulse
@@ -855,33 +858,33 @@ class AudioVisualizerManager(QObject):
         target_col = self.pulse_current_column_index
         for r in range(4):
             pad_1d_index = r * 16 + target_col
-            pad_colors_hex[pad_1d_index] = main_pulse_final_color_hex
+            pad_colors[pad_1d_index] = main_pulse_final_color
         # Light up faded adjacent columns
         if main_pulse_v > 0.001: # Only show fade if main pulse is visible
             faded_pulse_v = main_pulse_v * fade_brightness_multiplier
             faded_pulse_v = min(1.0, max(0.0, faded_pulse_v)) # Clamp
             if faded_pulse_v > 0.001: # Only draw if fade is visible enough
-                faded_pulse_color_hex = QColor.fromHsvF(
-                    base_h, base_s, faded_pulse_v, base_a).name()
+                faded_pulse_color = _hsv_to_rgb(
+                    base_h, base_s, faded_pulse_v, base_a)
                 for i in range(1, num_fade_columns_each_side + 1):
                     # Left neighbor(s)
                     left_fade_col = (target_col - i + 16) % 16 # Handle wrap-around
                     for r_fade in range(4):
                         pad_1d_index_left = r_fade * 16 + left_fade_col
                         # Only set if not already set by a stronger pulse (though unlikely with current logic)
-                        if pad_colors_hex[pad_1d_index_left] == "#000000":
-                            pad_colors_hex[pad_1d_index_left] = faded_pulse_color_hex
+                        if not pad_colors[pad_1d_index_left].any():
+                            pad_colors[pad_1d_index_left] = faded_pulse_color
                     
                     # Right neighbor(s)
                     right_fade_col = (target_col + i) % 16 # Handle wrap-around
                     for r_fade in range(4):
                         pad_1d_index_right = r_fade * 16 + right_fade_col
-                        if pad_colors_hex[pad_1d_index_right] == "#000000":
-                            pad_colors_hex[pad_1d_index_right] = faded_pulse_color_hex
-        return pad_colors_hex
+                        if not pad_colors[pad_1d_index_right].any():
+                            pad_colors[pad_1d_index_right] = faded_pulse_color
+        return pad_colors
 
-    def _map_dual_vu_to_pads(self, vu_level_input: float, spectrum_band_powers: np.ndarray) -> list[str]:
-        pad_colors_hex = ["#000000"] * 64
+    def _map_dual_vu_to_pads(self, vu_level_input: float, spectrum_band_powers: np.ndarray) -> np.ndarray:
+        pad_colors = np.zeros((64, 3), dtype=np.uint8)
         # --- VU Meter Logic ---
         falloff_rate = (self.dvu_falloff_speed_factor * 0.2) + 0.01
         if vu_level_input > self.dvu_current_level:
@@ -914,7 +917,7 @@ class AudioVisualizerManager(QObject):
             h_vu, s_vu, _, a_vu = chosen_color.getHsvF()
             v_vu_mod = min(1.0, max(0.0, self.dvu_current_level * chosen_color.valueF()))
             if v_vu_mod > 0.01 and v_vu_mod < 0.2: v_vu_mod = 0.2
-            pad_colors_hex[pad_1d_index] = QColor.fromHsvF(h_vu, s_vu, v_vu_mod, a_vu).name() if v_vu_mod > 0.001 else "#000000"
+            pad_colors[pad_1d_index] = _hsv_to_rgb(h_vu, s_vu, v_vu_mod, a_vu) if v_vu_mod > 0.001 else 0
         # --- Central Spectrum Logic (Implemented) ---
         if spectrum_band_powers.any():
             num_spec_bands_to_draw = len(spectrum_band_powers) # Should be 5
@@ -945,8 +948,8 @@ class AudioVisualizerManager(QObject):
                             val_comp = 0.25 + (power * 0.75) if power > 0.01 else 0.0
                             final_val = min(1.0, max(0.0, val_comp))
                             if final_val < 0.25 and power > 0.01: final_val = 0.25
-                            pad_colors_hex[pad_1d_index] = QColor.fromHsvF(h, s, final_val, a).name() if final_val > 0 else "#000000"
-        return pad_colors_hex
+                            pad_colors[pad_1d_index] = _hsv_to_rgb(h, s, final_val, a) if final_val > 0 else 0
+        return pad_colors
 
     def update_visualization_mode(self, mode_name: str):
         if self.current_visualization_mode == mode_name:
@@ -1,4 +1,4 @@
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
 # Define relevant Note and CC numbers
 FIRE_BUTTON_PLAY = 0x33
@@ -26,6 +26,12 @@ FIRE_ENCODER_2_CC = 0x11 # Physical Knob 2 (Pan/Saturation)
 FIRE_ENCODER_3_CC = 0x12 # Physical Knob 3 (Filter/Contrast)
 FIRE_ENCODER_4_CC = 0x13 # Physical Knob 4 (Resonance/Hue)
 
+# Encoder ticks are summed and delivered at most once per display frame
+ENCODER_COALESCE_INTERVAL_MS = 16
+ENCODER_ACCELERATION_TICKS = 4 # With acceleration on, every 4 ticks in one frame add another x1 multiplier
+ENCODER_ACCELERATION_MAX = 4
+SELECT_ENCODER_ID = 5 # Key for the SELECT encoder in the pending-delta map (never accelerated)
+
 
 class HardwareInputManager(QObject):
     # Signals for animator/navigation
@@ -55,6 +61,11 @@ class HardwareInputManager(QObject):
     def __init__(self, akai_fire_controller_ref, parent=None):
         super().__init__(parent)
         self.akai_fire_controller = akai_fire_controller_ref
+        self.encoder_acceleration_enabled = False
+        self._pending_encoder_deltas: dict[int, int] = {}
+        self._encoder_flush_timer = QTimer(self)
+        self._encoder_flush_timer.setInterval(ENCODER_COALESCE_INTERVAL_MS)
+        self._encoder_flush_timer.timeout.connect(self._flush_encoder_deltas)
         if self.akai_fire_controller:
             self.akai_fire_controller.play_button_pressed.connect(self._on_fire_play_pressed)
             self.akai_fire_controller.stop_button_pressed.connect(self._on_fire_stop_pressed)
@@ -104,6 +115,35 @@ class HardwareInputManager(QObject):
         elif note_number == FIRE_BUTTON_BROWSER:
             self.oled_browser_activate_pressed.emit()
 
+    def set_encoder_acceleration(self, enabled: bool):
+        """Fast spins of knobs 1-4 move further per tick (the SELECT encoder is never accelerated)."""
+        self.encoder_acceleration_enabled = bool(enabled)
+
+    def _queue_encoder_delta(self, encoder_id: int, delta: int):
+        """
+        The first tick after a quiet period goes out at once; ticks arriving within the next frame
+        are summed per encoder and delivered as one delta when the frame timer fires.
+        """
+        if not self._encoder_flush_timer.isActive():
+            self._emit_encoder_delta(encoder_id, delta)
+            self._encoder_flush_timer.start()
+            return
+        self._pending_encoder_deltas[encoder_id] = self._pending_encoder_deltas.get(encoder_id, 0) + delta
+
+    def _flush_encoder_deltas(self):
+        pending, self._pending_encoder_deltas = self._pending_encoder_deltas, {}
+        if not pending:
+            self._encoder_flush_timer.stop(); return # Quiet for a whole frame: next tick goes out immediately
+        for encoder_id, delta in pending.items():
+            if delta != 0: self._emit_encoder_delta(encoder_id, delta)
+
+    def _emit_encoder_delta(self, encoder_id: int, delta: int):
+        if encoder_id == SELECT_ENCODER_ID:
+            self.select_encoder_turned.emit(delta); return
+        if self.encoder_acceleration_enabled:
+            delta *= min(ENCODER_ACCELERATION_MAX, 1 + abs(delta) // ENCODER_ACCELERATION_TICKS)
+        self.physical_encoder_rotated.emit(encoder_id, delta)
+
     def _handle_control_change_event(self, control_cc: int, value: int):
         delta = 0
         # Determine delta for standard encoders (value 1 for increment, 127 for decrement)
@@ -118,15 +158,15 @@ class HardwareInputManager(QObject):
             elif value == 2: select_delta = 2 
             elif value == 126: select_delta = -2
             if select_delta != 0:
-                self.select_encoder_turned.emit(select_delta)
+                self._queue_encoder_delta(SELECT_ENCODER_ID, select_delta)
         # --- ADD Logic for Physical Encoders 1-4 ---
         elif control_cc == FIRE_ENCODER_1_CC:
-            if delta != 0: self.physical_encoder_rotated.emit(1, delta)
+            if delta != 0: self._queue_encoder_delta(1, delta)
         elif control_cc == FIRE_ENCODER_2_CC:
-            if delta != 0: self.physical_encoder_rotated.emit(2, delta)
+            if delta != 0: self._queue_encoder_delta(2, delta)
         elif control_cc == FIRE_ENCODER_3_CC:
-            if delta != 0: self.physical_encoder_rotated.emit(3, delta)
+            if delta != 0: self._queue_encoder_delta(3, delta)
         elif control_cc == FIRE_ENCODER_4_CC:
-            if delta != 0: self.physical_encoder_rotated.emit(4, delta)
+            if delta != 0: self._queue_encoder_delta(4, delta)
         # if delta != 0 and control_cc in [FIRE_ENCODER_1_CC, FIRE_ENCODER_2_CC, FIRE_ENCODER_3_CC, FIRE_ENCODER_4_CC]:
         #     print(f"HIM TRACE: Physical Encoder CC {hex(control_cc)} rotated, delta: {delta}")
\ No newline at end of file
@@ -1,11 +1,13 @@
 # AKAI_Fire_RGB_Controller/managers/oled_display_manager.py
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer, Qt, QBuffer, QIODevice
+from PyQt6.QtCore import QObject, pyqtSignal, QTimer, Qt
 # Keep QFont for fallback text items
 from PyQt6.QtGui import QImage, QPainter, QColor, QFont, QFontMetrics, QFontDatabase, QFontInfo
 from PIL import Image, ImageFont, ImageDraw  # Crucial for PIL font objects
 import os
 import sys
-import io
+import numpy as np
+from oled_utils.oled_frame import PackedOLEDFrame
+from oled_utils.glyph_cache import get_glyph_cache
 from utils import get_resource_path
 # For get_resource_path (ensure this works for your project structure)
 try:
@@ -39,6 +41,14 @@ except ImportError as e:
         @staticmethod
         def pack_pil_image_to_7bit_stream(pil_image): return None
         @staticmethod
+        def pack_logical_bitmap_to_7bit_stream(bitmap): return None
+        @staticmethod
+        def bitmap_to_page_bytes(pixels): return None
+        @staticmethod
+        def logical_frame_to_bitmap(logical_frame): return None
+        @staticmethod
+        def pack_page_bytes_to_7bit_stream(page_bytes): return bytearray(1176)
+        @staticmethod
         def get_text_actual_width(text, font): return len(text) * 6
         @staticmethod
         def get_blank_packed_bitmap(): return bytearray(1176)  # Placeholder size
@@ -60,6 +70,9 @@ class OLEDDisplayManager(QObject):
     PERSISTENT_OVERRIDE_FONT_SIZE_PX = 10
     APP_DEFAULT_OLED_MESSAGE_TEXT = "AKAI  Fire  PixelForge  by  Reg0lino  =^.^= "
     TOMTHUMB_FAMILY_NAME = "Tom Thumb"
+    PACKED_ANIMATION_CACHE_SIZE = 8  # Active Graphic animations whose packed frames are kept (LRU)
+    TEXT_SCROLL_STRIP_MARGIN_PX = 8  # Extra blank columns past the screen-wide padding, for glyph overhang
+    TEXT_ITEM_FONT_CACHE_SIZE = 16  # Text item QFonts kept (LRU), as many as the glyph cache holds fonts for
 
     def __init__(self, akai_fire_controller_ref, available_app_fonts: list[str], parent: QObject | None = None):
         super().__init__(parent)
@@ -78,6 +91,15 @@ class OLEDDisplayManager(QObject):
         self._temporary_message_revert_timer = QTimer(self)
         self._temporary_message_revert_timer.setSingleShot(True)
         self._startup_anim_timer = QTimer(self)
+        self._output_rate_scale = 1.0 # < 1.0 while the MIDI link is congested (see set_output_rate_scale)
+        self._packed_animation_cache: dict[tuple, list] = {}  # See _get_packed_animation_frames
+        self._text_item_font_cache: dict[tuple, QFont] = {}  # (family, pixel size) -> QFont, LRU
+        # Reused by every _render_text_frame; _text_canvas_pixels is a zero-copy view of its bytes
+        self._text_canvas = QImage(self.OLED_WIDTH, self.OLED_HEIGHT, QImage.Format.Format_Grayscale8)
+        canvas_bits = self._text_canvas.bits()
+        canvas_bits.setsize(self._text_canvas.sizeInBytes())
+        self._text_canvas_pixels = np.frombuffer(canvas_bits, dtype=np.uint8).reshape(
+            self.OLED_HEIGHT, -1)[:, :self.OLED_WIDTH]
         # --- Initialize All State Attributes ---
         self.full_reset()
         # --- Connect Signals to Consolidated Handlers ---
@@ -89,8 +111,26 @@ class OLEDDisplayManager(QObject):
         self._load_feedback_font()
         self._load_persistent_override_font()
 
+    def set_output_rate_scale(self, scale: float):
+        """
+        Follows AkaiFireController.output_rate_scale_changed: while the MIDI link is congested the
+        scroll and animation steps are stretched by 1 / scale, then return to normal.
+        """
+        self._output_rate_scale = max(0.1, min(1.0, float(scale)))
+        if self._animation_timer.isActive():
+            self._animation_timer.setInterval(self._rate_scaled_ms(self._animation_frame_delay_ms))
+        # The scroll timer picks the new step delay up on its next tick
+
+    def _rate_scaled_ms(self, interval_ms: int) -> int:
+        return int(interval_ms / self._output_rate_scale)
+
     def _play_next_startup_frame(self):
         """Displays the next frame of the built-in startup animation."""
+        if self.is_startup_animation_playing and self._startup_anim_frame_index >= len(self._startup_anim_frames) \
+                and self._startup_anim_source is not None:
+            packed_bitmap = next(self._startup_anim_source, None) # Frames still being generated are produced per tick
+            if packed_bitmap is None: self._startup_anim_source = None
+            else: self._startup_anim_frames.append(packed_bitmap)
         if not self.is_startup_animation_playing or self._startup_anim_frame_index >= len(self._startup_anim_frames):
             self._startup_anim_timer.stop()
             self.is_startup_animation_playing = False
@@ -117,8 +157,7 @@ class OLEDDisplayManager(QObject):
         """Calculates the pixel width of a string for a given QFont."""
         if not font or not text:
             return 0
-        fm = QFontMetrics(font)
-        return fm.horizontalAdvance(text)
+        return get_glyph_cache(font).text_width(text)
 
     def _render_and_send_text_frame(self, font, alignment="center", text_override=None):
         """Renders and sends a single text frame."""
@@ -164,30 +203,7 @@ class OLEDDisplayManager(QObject):
         """Packs a 1-bit PIL image into the Fire's 7-bit SysEx format."""
         if pil_image.mode != '1' or pil_image.size != (self.OLED_WIDTH, self.OLED_HEIGHT):
             return None
-            
-        pixels = pil_image.load()
-        def pixel_accessor(x, y):
-            return pixels[x, y] != 0
-        packed_stream = bytearray(1176)
-        a_bit_mutate = [
-            [13, 19, 25, 31, 37, 43, 49], [0, 20, 26, 32, 38, 44, 50],
-            [1, 7, 27, 33, 39, 45, 51], [2, 8, 14, 34, 40, 46, 52],
-            [3, 9, 15, 21, 41, 47, 53], [4, 10, 16, 22, 28, 48, 54],
-            [5, 11, 17, 23, 29, 35, 55], [6, 12, 18, 24, 30, 36, 42]
-        ]
-        for y_coord in range(self.OLED_HEIGHT):
-            for x_coord in range(self.OLED_WIDTH):
-                if pixel_accessor(x_coord, y_coord):
-                    fire_col = x_coord + self.OLED_WIDTH * (y_coord // 8)
-                    fire_y = y_coord % 8
-                    k = a_bit_mutate[fire_y][fire_col % 7]
-                    group_offset = (fire_col // 7) * 8
-                    byte_offset = k // 7
-                    bit_in_byte = k % 7
-                    packed_idx = group_offset + byte_offset
-                    if 0 <= packed_idx < len(packed_stream):
-                        packed_stream[packed_idx] |= (1 << bit_in_byte)
-        return packed_stream
+        return oled_renderer.pack_logical_bitmap_to_7bit_stream(pil_image) if OLED_RENDERER_AVAILABLE else None
 
     def _load_feedback_font(self):
         """Loads the TomThumb.ttf as a QFont for system feedback messages."""
@@ -218,10 +234,16 @@ class OLEDDisplayManager(QObject):
         Creates a QFont object for the given parameters. This is now the primary
         method for preparing a font for rendering, leveraging Qt's robust font engine.
         """
-        font = QFont(font_family)
-        font.setPixelSize(int(font_size_px))
-        # Optional: For very crisp, non-aliased rendering of pixel fonts
-        # font.setStyleStrategy(QFont.StyleStrategy.NoAntialias)
+        key = (font_family, int(font_size_px))
+        font = self._text_item_font_cache.pop(key, None)
+        if font is None:
+            font = QFont(font_family)
+            font.setPixelSize(int(font_size_px))
+            # Optional: For very crisp, non-aliased rendering of pixel fonts
+            # font.setStyleStrategy(QFont.StyleStrategy.NoAntialias)
+            if len(self._text_item_font_cache) >= self.TEXT_ITEM_FONT_CACHE_SIZE:
+                self._text_item_font_cache.pop(next(iter(self._text_item_font_cache)))
+        self._text_item_font_cache[key] = font  # Most recently used last
         return font
 
     def update_global_text_item_scroll_delay(self, new_delay_ms: int):
@@ -277,9 +299,11 @@ class OLEDDisplayManager(QObject):
         # called_by_revert ensures it bypasses temp msg check
         self._apply_current_oled_state(called_by_revert=True)
 
-    def play_builtin_startup_animation(self, frames: list[bytearray], frame_duration_ms: int):
+    def play_builtin_startup_animation(self, frames, frame_duration_ms: int):
+        """frames: a list of packed frames, or any iterable of them (e.g. a generator), which is consumed one frame per tick."""
         self.stop_all_activity()
-        self._startup_anim_frames = frames
+        if isinstance(frames, list): self._startup_anim_frames, self._startup_anim_source = frames, None
+        else: self._startup_anim_frames, self._startup_anim_source = [], iter(frames)
         self._startup_anim_frame_index = 0
         self.is_startup_animation_playing = True
         self._startup_anim_timer.start(frame_duration_ms)
@@ -426,22 +450,12 @@ class OLEDDisplayManager(QObject):
             self._apply_current_oled_state() 
             return
         # print(f"ODM DEBUG: Attempting to display frame {self._custom_animation_current_frame_index}/{len(self._custom_animation_logical_frames) -1}") # <<< ADD
-        logical_frame = self._custom_animation_logical_frames[self._custom_animation_current_frame_index]
-        # print(f"ODM DEBUG: Logical frame data (first row sample): {logical_frame[0][:20] if logical_frame and logical_frame[0] else 'N/A'}") # <<< ADD (optional, can be noisy)
-        pil_image = self._logical_frame_to_pil_image(logical_frame)
-        # print(f"ODM DEBUG: _logical_frame_to_pil_image returned: {'PIL.Image object' if pil_image else 'None'}") # <<< ADD
-        if pil_image and OLED_RENDERER_AVAILABLE:
-            packed_data = oled_renderer.pack_pil_image_to_7bit_stream(pil_image)
-            # print(f"ODM DEBUG: pack_pil_image_to_7bit_stream returned: Data with length {len(packed_data) if packed_data else 0} bytes") # <<< ADD
-            if packed_data:
-                # print(f"ODM DEBUG: Emitting request_send_bitmap_to_fire for frame {self._custom_animation_current_frame_index}") # <<< ADD
-                self.request_send_bitmap_to_fire.emit(packed_data)
-            # else:
-                # print(f"ODM ERROR: Failed to pack PIL image for custom animation frame {self._custom_animation_current_frame_index}.") # <<< ADD
-        # elif not pil_image:
-            # print(f"ODM ERROR: pil_image is None for frame {self._custom_animation_current_frame_index}.") # <<< ADD
-        # elif not OLED_RENDERER_AVAILABLE:
-            # print("ODM WARNING: OLED_RENDERER_AVAILABLE is False, cannot pack/send frame.") # <<< ADD
+        packed_data = self._custom_animation_packed_frames[self._custom_animation_current_frame_index]
+        if packed_data:
+            # print(f"ODM DEBUG: Emitting request_send_bitmap_to_fire for frame {self._custom_animation_current_frame_index}") # <<< ADD
+            self.request_send_bitmap_to_fire.emit(packed_data)
+        # else:
+            # print(f"ODM ERROR: Failed to pack custom animation frame {self._custom_animation_current_frame_index}.") # <<< ADD
         self._custom_animation_current_frame_index += 1
 
     def _scroll_active_graphic_text_step(self):
@@ -658,10 +672,10 @@ class OLEDDisplayManager(QObject):
         # --- Restart the appropriate timer based on the active graphic's type and state ---
         # Check if an animation was playing
         if self._animation_is_playing:
-            self._animation_timer.start(self._animation_frame_delay_ms)
+            self._animation_timer.start(self._rate_scaled_ms(self._animation_frame_delay_ms))
         # Check if text was scrolling
         elif self._text_is_scrolling:
-            self._text_scroll_timer.start(self._text_step_delay_ms)
+            self._text_scroll_timer.start(self._rate_scaled_ms(self._text_step_delay_ms))
         # Notify the UI that the state has changed.
         self.active_graphic_pause_state_changed.emit(False)
 
@@ -684,6 +698,7 @@ class OLEDDisplayManager(QObject):
         # print(f"OLED Mgr INFO: Starting Active Graphic Animation '{item_name}' (or resuming if timer starts)")
         # This indicates it's the active *type*
         self._is_custom_animation_playing = True
+        self._custom_animation_packed_frames = self._get_packed_animation_frames(self._custom_animation_logical_frames)
         self._custom_animation_current_frame_index = 0
         timer_interval_ms = int(
             1000.0 / self._custom_animation_playback_fps) if self._custom_animation_playback_fps > 0 else 100
@@ -748,7 +763,8 @@ class OLEDDisplayManager(QObject):
             self._text_restart_delay_ms = anim_params.get(
                 "pause_at_ends_ms") or self.DEFAULT_TEXT_ITEM_SCROLL_RESTART_DELAY_MS
             self._text_current_scroll_offset = self.OLED_WIDTH
-            self._text_scroll_timer.start(self._text_step_delay_ms)
+            self._prepare_text_scroll_strip(self._text_content, self._text_pil_font)
+            self._text_scroll_timer.start(self._rate_scaled_ms(self._text_step_delay_ms))
             self._scroll_text_step()  # Render first frame immediately
         else:
             self._text_is_scrolling = False
@@ -768,9 +784,10 @@ class OLEDDisplayManager(QObject):
             1000.0 / playback_fps) if playback_fps > 0 else 100
         self._animation_loop_behavior = import_options.get(
             "loop_behavior", "Loop Infinitely")
+        self._animation_packed_frames = self._get_packed_animation_frames(self._animation_logical_frames)
         self._animation_current_frame_index = 0
         self._animation_is_playing = True
-        self._animation_timer.start(self._animation_frame_delay_ms)
+        self._animation_timer.start(self._rate_scaled_ms(self._animation_frame_delay_ms))
         self._play_next_animation_frame()  # Render first frame immediately
 
     def _play_next_animation_frame(self):
@@ -786,10 +803,36 @@ class OLEDDisplayManager(QObject):
                 self._animation_timer.stop()
                 self._animation_is_playing = False
                 return
-        logical_frame = self._animation_logical_frames[self._animation_current_frame_index]
-        self._render_logical_frame(logical_frame)
+        packed_bitmap = self._animation_packed_frames[self._animation_current_frame_index]
+        if packed_bitmap:
+            self.request_send_bitmap_to_fire.emit(packed_bitmap)
+        else:
+            self.clear_display_content()
         self._animation_current_frame_index += 1
 
+    def _get_packed_animation_frames(self, logical_frames: list) -> list:
+        """
+        Packed buffers for every frame of an animation (None where a frame can't be packed), made once
+        when the graphic starts (~20 us per frame) and shared across set_active_graphic calls through a
+        small LRU keyed by the frame content itself, so playback only ever picks a ready buffer.
+        """
+        try:
+            key = tuple(f if isinstance(f, PackedOLEDFrame) else tuple(f) for f in logical_frames)
+            packed_frames = self._packed_animation_cache.pop(key, None)
+        except TypeError:  # Unhashable frame data: pack without caching
+            return [self._pack_logical_frame(frame) for frame in logical_frames]
+        if packed_frames is None:
+            packed_frames = [self._pack_logical_frame(frame) for frame in logical_frames]
+            if len(self._packed_animation_cache) >= self.PACKED_ANIMATION_CACHE_SIZE:
+                self._packed_animation_cache.pop(next(iter(self._packed_animation_cache)))
+        self._packed_animation_cache[key] = packed_frames  # Most recently used last
+        return packed_frames
+
+    def _pack_logical_frame(self, logical_frame: list[str]) -> bytearray | None:
+        if not OLED_RENDERER_AVAILABLE: return None
+        bitmap = oled_renderer.logical_frame_to_bitmap(logical_frame)
+        return oled_renderer.pack_logical_bitmap_to_7bit_stream(bitmap) if bitmap is not None else None
+
     def _scroll_text_step(self):
         """Worker method for the text scroll timer."""
         if not self._text_is_scrolling:
@@ -800,9 +843,52 @@ class OLEDDisplayManager(QObject):
             self._text_current_scroll_offset = self.OLED_WIDTH
             self._text_scroll_timer.setInterval(self._text_restart_delay_ms)
         else:
-            self._text_scroll_timer.setInterval(self._text_step_delay_ms)
-        self._render_text_frame(self._text_content, self._text_pil_font,
-                                self._text_alignment, self._text_current_scroll_offset)
+            self._text_scroll_timer.setInterval(self._rate_scaled_ms(self._text_step_delay_ms))
+        if self._text_scroll_strip is not None:
+            self._send_text_scroll_window(self._text_current_scroll_offset)
+        else:
+            self._render_text_frame(self._text_content, self._text_pil_font,
+                                    self._text_alignment, self._text_current_scroll_offset)
+
+    def _prepare_text_scroll_strip(self, text: str, font: QFont):
+        """
+        Renders scrolling text once into a wide strip of OLED column bytes, so each scroll step is
+        only a 128-column slice plus the table-driven pack. Kept until the text or font changes.
+        """
+        key = (text, font.key() if font else None)
+        if self._text_scroll_strip is not None and self._text_scroll_strip_key == key:
+            return
+        self._text_scroll_strip = None
+        self._text_scroll_strip_key = None
+        if not text or not font or not OLED_RENDERER_AVAILABLE:
+            return
+        fm = QFontMetrics(font)
+        # Text starts one screen width in, so every window from offset OLED_WIDTH down to -text_width fits
+        strip_width = fm.horizontalAdvance(text) + 2 * self.OLED_WIDTH + self.TEXT_SCROLL_STRIP_MARGIN_PX
+        q_image = QImage(strip_width, self.OLED_HEIGHT, QImage.Format.Format_Mono)
+        q_image.fill(0)
+        painter = QPainter(q_image)
+        painter.setFont(font)
+        painter.setPen(QColor(Qt.GlobalColor.white))
+        y_pos = (self.OLED_HEIGHT - fm.boundingRect(text).height()) // 2 + fm.ascent()
+        painter.drawText(self.OLED_WIDTH, int(y_pos), text)
+        painter.end()
+        gray = q_image.convertToFormat(QImage.Format.Format_Grayscale8)
+        rows = np.frombuffer(gray.constBits().asarray(gray.sizeInBytes()), dtype=np.uint8).reshape(self.OLED_HEIGHT, -1)
+        self._text_scroll_strip = oled_renderer.bitmap_to_page_bytes(rows[:, :strip_width] > 127)
+        self._text_scroll_strip_key = key
+
+    def _send_text_scroll_window(self, offset_x: int):
+        """Sends the 128 columns of the scroll strip that are on screen with the text drawn at offset_x."""
+        strip = self._text_scroll_strip
+        start = self.OLED_WIDTH - int(offset_x)
+        window = strip[:, max(0, start):max(0, start + self.OLED_WIDTH)]
+        if window.shape[1] != self.OLED_WIDTH:  # Past either end of the strip: pad with blank columns
+            padded = np.zeros((strip.shape[0], self.OLED_WIDTH), dtype=np.uint8)
+            left = max(0, -start)
+            padded[:, left:left + window.shape[1]] = window[:, :self.OLED_WIDTH - left]
+            window = padded
+        self.request_send_bitmap_to_fire.emit(oled_renderer.pack_page_bytes_to_7bit_stream(window))
 
     def _render_text_frame(self, text: str, font: QFont, alignment: str, offset_x: int):
         """
@@ -812,57 +898,43 @@ class OLEDDisplayManager(QObject):
         if not text or not font or not OLED_RENDERER_AVAILABLE:
             self.clear_display_content()
             return
-        # 1. Render text to a QImage using QPainter
-        q_image = QImage(self.OLED_WIDTH, self.OLED_HEIGHT, QImage.Format.Format_Mono)
-        q_image.fill(0)  # 0 = Black background
-        painter = QPainter(q_image)
-        painter.setFont(font)
-        painter.setPen(QColor(Qt.GlobalColor.white)) # 1 = White text
+        if not self._text_is_scrolling:
+            # Short static text (knob feedback, system messages): compose from cached glyphs when exact
+            pixels = get_glyph_cache(font).compose(text)
+            if pixels is not None:
+                self.request_send_bitmap_to_fire.emit(oled_renderer.pack_logical_bitmap_to_7bit_stream(pixels))
+                return
+        # 1. Paint the text onto the persistent canvas. Grayscale8 with antialiasing off gives the same
+        #    pixels as a Format_Mono image but can be read back directly as bytes.
+        canvas = self._text_canvas
+        canvas.fill(0)  # 0 = Black background
+        raster_font = QFont(font)
+        raster_font.setStyleStrategy(QFont.StyleStrategy.NoAntialias)
+        painter = QPainter(canvas)
+        painter.setFont(raster_font)
+        painter.setPen(QColor(Qt.GlobalColor.white))
         fm = QFontMetrics(font)
-        text_width = fm.horizontalAdvance(text)
-        # Use bounding rect for more accurate vertical centering
-        # Let Qt handle the vertical alignment calculations.
-        # Create the full rectangle of the OLED screen.
-        display_rect = q_image.rect()
-        # For horizontal alignment, we still need to calculate the x position for scrolling.
-        # For static text, Qt's alignment flags will handle it.
-        x_pos = offset_x
         if not self._text_is_scrolling:
-            # If not scrolling, create the rect where text should be drawn.
-            # Qt will center it within this rect.
-            painter.drawText(display_rect, int(Qt.AlignmentFlag.AlignVCenter), text)
+            # Static text: Qt does the vertical centering within the screen rect
+            painter.drawText(canvas.rect(), int(Qt.AlignmentFlag.AlignVCenter), text)
         else:
             # If scrolling, we can't use Qt's alignment flags as they override the x_pos.
-            # We must calculate y manually but can use a simpler formula.
             bounding_rect = fm.boundingRect(text)
             y_pos = (self.OLED_HEIGHT - bounding_rect.height()) // 2 + fm.ascent()
-            painter.drawText(int(x_pos), int(y_pos), text)
+            painter.drawText(int(offset_x), int(y_pos), text)
         painter.end()
-        # 2. Convert the QImage to a PIL Image
-        buffer = QBuffer()
-        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-        q_image.save(buffer, "BMP")
-        pil_image = Image.open(io.BytesIO(buffer.data()))
-        pil_image = pil_image.convert('1') # Ensure it's 1-bit mode
-        # 3. Pack the PIL Image and send to the hardware
-        if pil_image:
-            packed_bitmap = self._pack_pil_image_to_7bit_stream(pil_image)
-            if packed_bitmap:
-                self.request_send_bitmap_to_fire.emit(packed_bitmap)
+        # 2. Threshold the canvas bytes (a live NumPy view) and pack them for the hardware
+        self.request_send_bitmap_to_fire.emit(
+            oled_renderer.pack_logical_bitmap_to_7bit_stream(self._text_canvas_pixels > 127))
 
     def _render_logical_frame(self, logical_frame: list[str]):
         """Renders a single logical frame (list of '1's and '0's) and sends it to the hardware."""
         if not OLED_RENDERER_AVAILABLE or not logical_frame:
             self.clear_display_content()
             return
-        pil_image = self._logical_frame_to_pil_image(logical_frame)
-        if pil_image:
-            packed_bitmap = self._pack_pil_image_to_7bit_stream(pil_image)
-            if packed_bitmap:
-                self.request_send_bitmap_to_fire.emit(packed_bitmap)
-            else:
-                # This case is unlikely if logical_frame_to_pil_image succeeds, but for safety:
-                self.clear_display_content()
+        packed_bitmap = self._pack_logical_frame(logical_frame)
+        if packed_bitmap:
+            self.request_send_bitmap_to_fire.emit(packed_bitmap)
         else:
             self.clear_display_content()
 
@@ -884,6 +956,8 @@ class OLEDDisplayManager(QObject):
         # --- Animation State ---
         self._animation_is_playing: bool = False
         self._animation_logical_frames: list[list[str]] | None = None
+        self._animation_packed_frames: list = []  # From _get_packed_animation_frames
+        self._custom_animation_packed_frames: list = []  # Same, for an active graphic animation
         self._animation_current_frame_index: int = 0
         self._animation_frame_delay_ms: int = 100
         self._animation_loop_behavior: str = "Loop Infinitely"
@@ -896,10 +970,13 @@ class OLEDDisplayManager(QObject):
         self._text_pixel_width: int = 0
         self._text_step_delay_ms: int = 50
         self._text_restart_delay_ms: int = 2000
+        self._text_scroll_strip: np.ndarray | None = None  # (pages, columns) bytes, see _prepare_text_scroll_strip
+        self._text_scroll_strip_key: tuple | None = None
         # --- Temporary Message State ---
         self._temp_message_text: str | None = None
         # --- Built-in Startup Animation State ---
         self._startup_anim_frames: list = []
+        self._startup_anim_source = None # Iterator still producing startup frames, if any
         self._startup_anim_frame_index: int = 0
         # After a full reset, explicitly tell the UI that the state is not paused.
         self.active_graphic_pause_state_changed.emit(False)
@@ -910,16 +987,8 @@ class OLEDDisplayManager(QObject):
             # print(f"OLED Mgr ERROR (_logical_frame_to_pil_image): Invalid logical frame format or height. Expected {self.OLED_HEIGHT} rows.")
             return None
         try:
-            pil_image = Image.new('1', (self.OLED_WIDTH, self.OLED_HEIGHT), 0)
-            pixels = pil_image.load()
-            for y, row_str in enumerate(logical_frame):
-                if not isinstance(row_str, str) or len(row_str) != self.OLED_WIDTH:
-                    # print(f"OLED Mgr ERROR (_logical_frame_to_pil_image): Invalid row in logical frame at y={y}.")
-                    continue
-                for x, pixel_char in enumerate(row_str):
-                    if pixel_char == '1':
-                        pixels[x, y] = 1
-            return pil_image
+            bitmap = oled_renderer.logical_frame_to_bitmap(logical_frame) if OLED_RENDERER_AVAILABLE else None
+            return Image.fromarray(bitmap) if bitmap is not None else None
         except Exception as e:
             # print(f"OLED Mgr ERROR (_logical_frame_to_pil_image): Exception during conversion: {e}")
             return None
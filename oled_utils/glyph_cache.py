@@ -0,0 +1,98 @@
+# AKAI_Fire_RGB_Controller/oled_utils/glyph_cache.py
+import math
+import numpy as np
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QImage, QPainter, QColor, QFont, QFontMetrics, QFontMetricsF
+
+CANVAS_WIDTH = 128
+CANVAS_HEIGHT = 64
+GLYPH_CACHE_FONTS = 16 # Fonts whose glyphs are kept; the oldest is dropped first
+SUBPIXEL_STEPS = 64    # Glyph positions are kept per 1/64 px, the resolution of font advances
+
+
+def qimage_to_lit_pixels(q_image: QImage) -> np.ndarray:
+    """(height, width) bool array of a painted QImage, True where the pixel is light."""
+    gray = q_image.convertToFormat(QImage.Format.Format_Grayscale8)
+    rows = np.frombuffer(gray.constBits().asarray(gray.sizeInBytes()), dtype=np.uint8).reshape(gray.height(), -1)
+    return rows[:, :gray.width()] > 127
+
+
+class GlyphCache:
+    """
+    1-bit glyphs and advances of one QFont, drawn exactly as OLEDDisplayManager draws static text
+    (QPainter.drawText into a 64 px high rect, AlignVCenter, Format_Mono). Short strings are composed
+    by OR-ing cached glyph columns into a frame instead of running a full Qt text raster.
+    Advances are usually fractional, so a glyph is cached per sub-pixel pen position it has been seen at.
+    Only used when that gives the same pixels: every character is in the font itself (no fallback
+    font changing the line metrics) and the string has no kerning or shaping.
+    """
+    def __init__(self, font: QFont):
+        self.font = QFont(font)
+        self.metrics = QFontMetrics(self.font)
+        self._metrics_f = QFontMetricsF(self.font)
+        self._margin = max(8, self.metrics.height())
+        # (char, sub-pixel step) -> (x offset from the whole-pixel pen position, (64, w) bool columns) or None if blank
+        self._glyphs: dict[tuple[str, int], tuple[int, np.ndarray] | None] = {}
+        self._advances: dict[str, float | None] = {}
+
+    def text_width(self, text: str) -> int:
+        return self.metrics.horizontalAdvance(text)
+
+    def _advance(self, char: str) -> float | None:
+        if char not in self._advances:
+            in_font = self.metrics.inFontUcs4(ord(char))
+            self._advances[char] = self._metrics_f.horizontalAdvance(char) if in_font else None
+        return self._advances[char]
+
+    def _glyph(self, char: str, step: int) -> tuple[int, np.ndarray] | None:
+        key = (char, step)
+        if key not in self._glyphs:
+            width = 2 * self._margin + max(int(self._advances[char]) + 1, self.metrics.boundingRect(char).right() + 1)
+            q_image = QImage(width, CANVAS_HEIGHT, QImage.Format.Format_Mono)
+            q_image.fill(0)
+            painter = QPainter(q_image)
+            painter.setFont(self.font)
+            painter.setPen(QColor(Qt.GlobalColor.white))
+            left = self._margin + step / SUBPIXEL_STEPS
+            painter.drawText(QRectF(left, 0, width - left, CANVAS_HEIGHT), int(Qt.AlignmentFlag.AlignVCenter), char)
+            painter.end()
+            pixels = qimage_to_lit_pixels(q_image)
+            columns = np.flatnonzero(pixels.any(axis=0))
+            self._glyphs[key] = None if columns.size == 0 else \
+                (int(columns[0]) - self._margin, pixels[:, columns[0]:columns[-1] + 1].copy())
+        return self._glyphs[key]
+
+    def can_compose(self, text: str) -> bool:
+        advances = [self._advance(char) for char in text]
+        if not text or None in advances: return False
+        return abs(self._metrics_f.horizontalAdvance(text) - sum(advances)) < 1.0 / SUBPIXEL_STEPS
+
+    def compose(self, text: str, x: int = 0) -> np.ndarray | None:
+        """(64, 128) bool frame with text drawn from pen position x, or None if it can't be composed exactly."""
+        if not self.can_compose(text): return None
+        frame = np.zeros((CANVAS_HEIGHT, CANVAS_WIDTH), dtype=bool)
+        pen_x = float(x)
+        for char in text:
+            whole = math.floor(pen_x)
+            glyph = self._glyph(char, int(round((pen_x - whole) * SUBPIXEL_STEPS)) % SUBPIXEL_STEPS)
+            if glyph is not None:
+                offset, columns = glyph
+                left = whole + offset
+                start, end = max(0, left), min(CANVAS_WIDTH, left + columns.shape[1])
+                if start < end: frame[:, start:end] |= columns[:, start - left:end - left]
+            pen_x += self._advances[char]
+            if pen_x >= CANVAS_WIDTH + self._margin: break
+        return frame
+
+
+_GLYPH_CACHES: dict[str, GlyphCache] = {}
+
+
+def get_glyph_cache(font: QFont) -> GlyphCache:
+    """Shared GlyphCache for a font (keyed by QFont.key(), i.e. family, size and style)."""
+    key = font.key()
+    cache = _GLYPH_CACHES.get(key)
+    if cache is None:
+        if len(_GLYPH_CACHES) >= GLYPH_CACHE_FONTS: _GLYPH_CACHES.pop(next(iter(_GLYPH_CACHES)))
+        cache = _GLYPH_CACHES[key] = GlyphCache(font)
+    return cache
@@ -2,6 +2,7 @@
 import os
 from PIL import Image, ImageOps, ImageSequence, ImageFont, ImageDraw, ImageEnhance, ImageFilter
 import numpy as np # For Bayer matrix and efficient operations
+from oled_utils.oled_frame import PackedOLEDFrame
 
 TARGET_SIZE = (128, 64) # OLED dimensions
 
@@ -42,19 +43,13 @@ NORMALIZED_BAYER_MATRIX_8X8 = BAYER_MATRIX_8X8 / 64.0
 
 def logical_frame_to_string_list(pil_image_1bit: Image.Image) -> list[str]:
     """Converts a 128x64 1-bit PIL Image to a list of 64 strings, each 128 chars ('0' or '1')."""
+    return logical_frame_to_packed_frame(pil_image_1bit).to_string_rows()
+
+def logical_frame_to_packed_frame(pil_image_1bit: Image.Image) -> PackedOLEDFrame:
+    """Converts a 128x64 1-bit PIL Image to a PackedOLEDFrame (its raw 1024 bytes, no per-pixel work)."""
     if pil_image_1bit.mode != '1' or pil_image_1bit.size != TARGET_SIZE:
         raise ValueError(f"Image must be 1-bit and {TARGET_SIZE[0]}x{TARGET_SIZE[1]} pixels.")
-    
-    string_list_frame = []
-    pixels = pil_image_1bit.load()
-    for y in range(TARGET_SIZE[1]):
-        row_string = ""
-        for x in range(TARGET_SIZE[0]):
-            # In '1' mode, Pillow pixels are 0 (black) or 255 (white).
-            # We want '1' for white (on) and '0' for black (off).
-            row_string += '1' if pixels[x, y] != 0 else '0'
-        string_list_frame.append(row_string)
-    return string_list_frame
+    return PackedOLEDFrame.from_pil_image(pil_image_1bit)
 
 def _apply_atkinson_dither(grayscale_image: Image.Image, dither_strength: float = 1.0) -> Image.Image:
     """
@@ -295,7 +290,7 @@ def process_image_to_oled_data(filepath: str,
                                 noise_type: str,
                                 dither_strength: float,
                                 max_frames_to_import: int = 0
-                                ) -> tuple[list[list[str]] | None, float | None, int | None]:
+                                ) -> tuple[list[PackedOLEDFrame] | None, float | None, int | None]:
     if not os.path.exists(filepath):
         print(f"IPROC Error: File not found at {filepath}")
         return None, None, None
@@ -350,7 +345,7 @@ def process_image_to_oled_data(filepath: str,
 
             if monochrome_pil_frame:
                 logical_frames_output.append(
-                    logical_frame_to_string_list(monochrome_pil_frame))
+                    logical_frame_to_packed_frame(monochrome_pil_frame))
             else:
                 print(
                     f"IPROC Warning: Skipping frame {i} for '{filepath}' due to processing error.")
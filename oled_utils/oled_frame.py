@@ -0,0 +1,164 @@
+# AKAI_Fire_RGB_Controller/oled_utils/oled_frame.py
+import base64
+import numpy as np
+from PIL import Image
+
+FRAME_WIDTH = 128
+FRAME_HEIGHT = 64
+FRAME_BYTES = FRAME_WIDTH * FRAME_HEIGHT // 8 # 1024
+ITEM_FRAMES_LOGICAL_KEY = "frames_logical"    # In memory: list of frames. Legacy files: 64 '0'/'1' strings per frame
+ITEM_FRAMES_PACKED_KEY = "frames_packed_b64"  # Item files: one base64 string of FRAME_BYTES per frame
+ITEM_FORMAT_VERSION_KEY = "item_format_version" # Missing in legacy files (version 1, string rows)
+ITEM_FORMAT_VERSION = 2 # 2 = frames under ITEM_FRAMES_PACKED_KEY
+_BYTE_ROW_CHARS = [format(value, '08b') for value in range(256)] # Packed byte -> its 8 '0'/'1' pixels
+
+
+class PackedOLEDFrame:
+    """
+    One 128x64 monochrome frame in 1024 bytes: rows top to bottom, 16 bytes per row, MSB = leftmost
+    pixel. That is np.packbits order and also the raw layout of PIL mode '1' and QImage Format_Mono.
+    len() / indexing / iteration still give the 64 '0'/'1' row strings of the old frames_logical format.
+    """
+    __slots__ = ('data',)
+
+    def __init__(self, data: bytes):
+        if len(data) != FRAME_BYTES:
+            raise ValueError(f"PackedOLEDFrame needs {FRAME_BYTES} bytes, got {len(data)}")
+        self.data = bytes(data)
+
+    @classmethod
+    def from_bitmap(cls, bitmap) -> "PackedOLEDFrame":
+        pixels = np.asarray(bitmap) != 0
+        if pixels.shape != (FRAME_HEIGHT, FRAME_WIDTH):
+            raise ValueError(f"Bitmap must be {FRAME_HEIGHT}x{FRAME_WIDTH}, got {pixels.shape}")
+        return cls(np.packbits(pixels).tobytes())
+
+    @classmethod
+    def from_pil_image(cls, pil_image: Image.Image) -> "PackedOLEDFrame":
+        if pil_image.size != (FRAME_WIDTH, FRAME_HEIGHT):
+            raise ValueError(f"Image must be {FRAME_WIDTH}x{FRAME_HEIGHT} pixels.")
+        if pil_image.mode != '1': pil_image = pil_image.convert('1')
+        return cls(pil_image.tobytes())
+
+    @classmethod
+    def from_string_rows(cls, rows: list[str]) -> "PackedOLEDFrame":
+        pixels = string_rows_to_bitmap(rows)
+        if pixels is None: raise ValueError(f"Logical frame must have {FRAME_HEIGHT} rows.")
+        return cls.from_bitmap(pixels)
+
+    @classmethod
+    def from_b64(cls, text: str) -> "PackedOLEDFrame":
+        return cls(base64.b64decode(text))
+
+    def to_b64(self) -> str:
+        return base64.b64encode(self.data).decode('ascii')
+
+    def to_bitmap(self) -> np.ndarray:
+        """(64, 128) bool array, True = lit."""
+        return np.unpackbits(np.frombuffer(self.data, dtype=np.uint8)).reshape(FRAME_HEIGHT, FRAME_WIDTH).astype(bool)
+
+    def to_pil_image(self) -> Image.Image:
+        return Image.frombytes('1', (FRAME_WIDTH, FRAME_HEIGHT), self.data)
+
+    def to_string_rows(self) -> list[str]:
+        chars = np.where(self.to_bitmap(), ord('1'), ord('0')).astype(np.uint8).tobytes().decode('ascii')
+        return [chars[y * FRAME_WIDTH:(y + 1) * FRAME_WIDTH] for y in range(FRAME_HEIGHT)]
+
+    def row_string(self, y: int) -> str:
+        """One '0'/'1' row, unpacked on its own (frame[y] in code written for the string-row format)."""
+        if y < 0: y += FRAME_HEIGHT
+        if not 0 <= y < FRAME_HEIGHT: raise IndexError("PackedOLEDFrame row index out of range")
+        row_bytes = FRAME_WIDTH // 8
+        return ''.join([_BYTE_ROW_CHARS[b] for b in self.data[y * row_bytes:(y + 1) * row_bytes]])
+
+    def __len__(self): return FRAME_HEIGHT
+
+    def __getitem__(self, row):
+        if isinstance(row, slice): return self.to_string_rows()[row]
+        return self.row_string(row)
+
+    def __iter__(self): return iter(self.to_string_rows())
+
+    def __eq__(self, other):
+        return isinstance(other, PackedOLEDFrame) and other.data == self.data
+
+    def __hash__(self): return hash(self.data)
+
+
+def string_rows_to_bitmap(rows) -> np.ndarray | None:
+    """
+    (64, 128) bool array from a legacy frame (64 strings of '0'/'1').
+    Rows that are not 128-character strings stay blank; None if the row count is wrong.
+    """
+    if not isinstance(rows, list) or len(rows) != FRAME_HEIGHT: return None
+    if all(isinstance(row, str) and len(row) == FRAME_WIDTH for row in rows):
+        chars = np.frombuffer(''.join(rows).encode('ascii', 'replace'), dtype=np.uint8)
+        return chars.reshape(FRAME_HEIGHT, FRAME_WIDTH) == ord('1')
+    pixels = np.zeros((FRAME_HEIGHT, FRAME_WIDTH), dtype=bool)
+    for y, row in enumerate(rows):
+        if isinstance(row, str) and len(row) == FRAME_WIDTH:
+            pixels[y] = np.frombuffer(row.encode('ascii', 'replace'), dtype=np.uint8) == ord('1')
+    return pixels
+
+
+def frame_to_bitmap(frame) -> np.ndarray | None:
+    """Bitmap of either frame representation (PackedOLEDFrame or legacy string rows)."""
+    if isinstance(frame, PackedOLEDFrame): return frame.to_bitmap()
+    return string_rows_to_bitmap(frame)
+
+
+def as_packed_frame(frame) -> PackedOLEDFrame | None:
+    if isinstance(frame, PackedOLEDFrame): return frame
+    pixels = string_rows_to_bitmap(frame)
+    return PackedOLEDFrame.from_bitmap(pixels) if pixels is not None else None
+
+
+def item_frame_count(item_data: dict) -> int:
+    """Number of frames in an image_animation item as read from disk, in either format."""
+    frames = item_data.get(ITEM_FRAMES_PACKED_KEY)
+    if frames is None: frames = item_data.get(ITEM_FRAMES_LOGICAL_KEY)
+    return len(frames) if isinstance(frames, list) else 0
+
+
+def unpack_item_frames(item_data: dict) -> dict:
+    """
+    Turns the frames of an item loaded from JSON (packed base64 or legacy string rows) into
+    PackedOLEDFrames under ITEM_FRAMES_LOGICAL_KEY, in place. Returns item_data for chaining.
+    A frame that can't be decoded becomes a blank frame, so the others keep their index and timing.
+    """
+    if not isinstance(item_data, dict): return item_data
+    version = item_data.get(ITEM_FORMAT_VERSION_KEY, 1)
+    if not isinstance(version, int) or version > ITEM_FORMAT_VERSION:
+        print(f"OLEDFrame WARNING: '{item_data.get('item_name', '?')}' has item format version {version!r}, "
+              f"newer than this build reads ({ITEM_FORMAT_VERSION}); its frames may not load.")
+    encoded = item_data.pop(ITEM_FRAMES_PACKED_KEY, None)
+    if isinstance(encoded, list): frames, decode = encoded, PackedOLEDFrame.from_b64
+    elif isinstance(item_data.get(ITEM_FRAMES_LOGICAL_KEY), list): frames, decode = item_data[ITEM_FRAMES_LOGICAL_KEY], as_packed_frame
+    else: return item_data
+    decoded, bad_indices = [], []
+    for index, frame in enumerate(frames):
+        try: packed = decode(frame)
+        except (ValueError, TypeError): packed = None
+        if packed is None:
+            bad_indices.append(index); packed = PackedOLEDFrame(bytes(FRAME_BYTES))
+        decoded.append(packed)
+    if bad_indices:
+        print(f"OLEDFrame WARNING: {len(bad_indices)} frame(s) of '{item_data.get('item_name', '?')}' could not be decoded "
+              f"and are shown blank: {bad_indices[:10]}{'...' if len(bad_indices) > 10 else ''}")
+    item_data[ITEM_FRAMES_LOGICAL_KEY] = decoded
+    return item_data
+
+
+def pack_item_frames_for_save(item_data: dict) -> dict:
+    """
+    Copy of item_data ready for json.dump, with its frames stored as base64 under ITEM_FRAMES_PACKED_KEY
+    and ITEM_FORMAT_VERSION_KEY set. The string rows are not written as well (that would undo the size
+    saving); the version field is what tells readers the frames moved.
+    """
+    saved = dict(item_data)
+    frames = saved.pop(ITEM_FRAMES_LOGICAL_KEY, None)
+    if frames is not None:
+        packed_frames = [as_packed_frame(frame) for frame in frames]
+        saved[ITEM_FRAMES_PACKED_KEY] = [(f or PackedOLEDFrame(bytes(FRAME_BYTES))).to_b64() for f in packed_frames]
+        saved[ITEM_FORMAT_VERSION_KEY] = ITEM_FORMAT_VERSION
+    return saved
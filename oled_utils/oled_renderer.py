@@ -2,8 +2,10 @@
 import os
 from PIL import Image, ImageDraw, ImageFont
 import sys
-import random
-import math
+import struct
+import threading
+import numpy as np
+from oled_utils.oled_frame import frame_to_bitmap
 
 OLED_WIDTH = 128
 OLED_HEIGHT = 64
@@ -18,6 +20,19 @@ A_BIT_MUTATE = [
     [5,  11, 17, 23, 29, 35, 55], 
     [6,  12, 18, 24, 30, 36, 42]
 ]
+OLED_PAGES = OLED_HEIGHT // 8 # Each page is a band of 8 pixel rows; one byte per column per page
+# _BIT_TARGET[j, b]: packed bit position of bit b of the j-th byte in each 7-byte group
+_BIT_TARGET = np.array(A_BIT_MUTATE, dtype=np.intp).T
+
+def _build_full_screen_gather() -> np.ndarray:
+    """Flat index of the pixel (y * OLED_WIDTH + x) behind each packed bit, 8 per output byte; unused bits point past the end."""
+    gather = np.full((PACKED_BITMAP_SIZE_BYTES, 8), OLED_WIDTH * OLED_HEIGHT, dtype=np.intp)
+    y, x = np.divmod(np.arange(OLED_WIDTH * OLED_HEIGHT), OLED_WIDTH)
+    column = x + OLED_WIDTH * (y // 8)
+    k = np.array(A_BIT_MUTATE)[y % 8, column % 7]
+    gather[(column // 7) * 8 + k // 7, k % 7] = y * OLED_WIDTH + x
+    return gather.reshape(-1)
+_FULL_SCREEN_GATHER = _build_full_screen_gather()
 _FONT_OBJECT: ImageFont.FreeTypeFont | ImageFont.ImageFont | None = None
 CUSTOM_FONT_FILENAME = "TomThumb.ttf"
 _PRIMARY_FONT_OBJECT = None
@@ -110,6 +125,10 @@ def show_temporary_knob_value(self, text: str, use_status_font: bool = False):
     if bitmap:
         self.request_send_bitmap_to_fire.emit(bitmap)
 
+TEXT_WIDTH_CACHE_SIZE = 512
+_TEXT_WIDTH_CACHE: dict[tuple, int] = {} # (font object, text) -> width
+_TEXT_MEASURE_DRAW = ImageDraw.Draw(Image.new('1', (1, 1)))
+
 def get_text_actual_width(text: str, font_to_use: ImageFont.FreeTypeFont | ImageFont.ImageFont | None = None) -> int:
     """Calculates the pixel width of a given text string using the specified font."""
     if font_to_use is None:
@@ -118,13 +137,15 @@ def get_text_actual_width(text: str, font_to_use: ImageFont.FreeTypeFont | Image
     if font_to_use is None or not text:
         return 0
     
+    key = (font_to_use, text)
+    width = _TEXT_WIDTH_CACHE.get(key)
+    if width is not None: return width
     try:
-        # Use textbbox to get accurate width
-        # Need a dummy image to get a draw context for textbbox
-        dummy_image = Image.new('1', (1, 1)) # Minimal size
-        draw_context = ImageDraw.Draw(dummy_image)
-        bbox = draw_context.textbbox((0, 0), text, font=font_to_use)
-        return bbox[2] - bbox[0]  # width = right - left
+        # Use textbbox to get accurate width, on one shared draw context
+        bbox = _TEXT_MEASURE_DRAW.textbbox((0, 0), text, font=font_to_use)
+        if len(_TEXT_WIDTH_CACHE) >= TEXT_WIDTH_CACHE_SIZE: _TEXT_WIDTH_CACHE.pop(next(iter(_TEXT_WIDTH_CACHE)))
+        width = _TEXT_WIDTH_CACHE[key] = bbox[2] - bbox[0]  # width = right - left
+        return width
     except Exception as e:
         print(f"ERROR (oled_renderer.get_text_actual_width): Could not get textbbox: {e}. Estimating width.")
         # Fallback crude estimation if textbbox fails (e.g., font issue)
@@ -158,9 +179,7 @@ def render_text_to_packed_buffer(text: str,
         if center_if_not_scrolling and offset_x == 0 and text_pixel_width < OLED_WIDTH: text_x = (OLED_WIDTH - text_pixel_width) // 2
         else: text_x = -offset_x
     draw.text((text_x, text_y), text, font=actual_font, fill=1)
-    pixels = logical_image.load()
-    def pixel_is_on(x_coord, y_coord): return 0 <= x_coord < OLED_WIDTH and 0 <= y_coord < OLED_HEIGHT and pixels[x_coord, y_coord] != 0
-    return _generate_fire_packed_stream_from_logical_pixels(pixel_is_on, OLED_WIDTH, OLED_HEIGHT)
+    return pack_logical_bitmap_to_7bit_stream(logical_image)
 
 def pack_pil_image_to_7bit_stream(pil_monochrome_image: Image.Image) -> bytearray | None:
     """
@@ -184,13 +203,7 @@ def pack_pil_image_to_7bit_stream(pil_monochrome_image: Image.Image) -> bytearra
         return None
 
     try:
-        pixels = pil_monochrome_image.load()
-        def pixel_is_on(x_coord, y_coord):
-            # For '1' mode, Pillow pixels are 0 (black) or 255 (white).
-            # We consider non-black as 'on'.
-            return pixels[x_coord, y_coord] != 0 
-            
-        return _generate_fire_packed_stream_from_logical_pixels(pixel_is_on, OLED_WIDTH, OLED_HEIGHT)
+        return pack_logical_bitmap_to_7bit_stream(pil_monochrome_image)
     except Exception as e:
         print(f"ERROR (oled_renderer.pack_pil_image_to_7bit_stream): Exception during packing: {e}")
         return None
@@ -202,97 +215,208 @@ def get_bitmap_for_text(text: str, scroll_offset_x: int = 0, target_line_idx: in
 def get_blank_packed_bitmap() -> bytearray:
     return bytearray(PACKED_BITMAP_SIZE_BYTES)
 
-def _generate_fire_packed_stream_from_logical_pixels(pixel_accessor_func, width, height) -> bytearray:
-    packed_7bit_stream = bytearray(PACKED_BITMAP_SIZE_BYTES)
-    for logical_y in range(height):
-        for logical_x in range(width):
-            if pixel_accessor_func(logical_x, logical_y): 
-                fire_global_col_idx = logical_x + width * (logical_y // 8)
-                fire_y_in_page = logical_y % 8
-                k = A_BIT_MUTATE[fire_y_in_page][fire_global_col_idx % 7]
-                packed_group_offset = (fire_global_col_idx // 7) * 8
-                target_byte_offset_in_group = k // 7
-                target_bit_in_packed_byte = k % 7
-                packed_stream_idx = packed_group_offset + target_byte_offset_in_group
-                if 0 <= packed_stream_idx < PACKED_BITMAP_SIZE_BYTES:
-                    packed_7bit_stream[packed_stream_idx] |= (1 << target_bit_in_packed_byte)
-    return packed_7bit_stream
+def logical_bitmap_to_array(bitmap) -> np.ndarray | None:
+    """
+    (OLED_HEIGHT, OLED_WIDTH) bool array of lit pixels from a mode '1' PIL image (read straight from its
+    packed bytes) or anything array-like of that shape (bool / 0-1 / 0-255). None if the shape is wrong.
+    """
+    if isinstance(bitmap, Image.Image):
+        if bitmap.size != (OLED_WIDTH, OLED_HEIGHT): return None
+        if bitmap.mode != '1': return np.asarray(bitmap.convert('L')) != 0
+        rows = np.frombuffer(bitmap.tobytes(), dtype=np.uint8).reshape(OLED_HEIGHT, -1) # MSB-first, row-padded
+        return np.unpackbits(rows, axis=1)[:, :OLED_WIDTH].astype(bool)
+    pixels = np.asarray(bitmap)
+    if pixels.shape != (OLED_HEIGHT, OLED_WIDTH): return None
+    return pixels != 0
+
+def pack_logical_bitmap_to_7bit_stream(bitmap) -> bytearray | None:
+    """
+    Packs a full-screen bitmap (see logical_bitmap_to_array) into the Fire's 1176-byte 7-bit stream.
+    Every OLED producer goes through here (or pack_page_bytes_to_7bit_stream for partial windows).
+    """
+    pixels = logical_bitmap_to_array(bitmap)
+    if pixels is None: return None
+    padded = np.zeros(OLED_WIDTH * OLED_HEIGHT + 1, dtype=bool); padded[:-1] = pixels.reshape(-1)
+    return bytearray(np.packbits(padded[_FULL_SCREEN_GATHER], bitorder='little').tobytes())
+
+def logical_frame_to_bitmap(logical_frame) -> np.ndarray | None:
+    """
+    (OLED_HEIGHT, OLED_WIDTH) bool array from a frames_logical entry: a PackedOLEDFrame or the legacy
+    64 strings of '0'/'1' (malformed rows stay blank). None if the frame is not a full screen.
+    """
+    return frame_to_bitmap(logical_frame)
+
+def bitmap_to_page_bytes(pixels: np.ndarray) -> np.ndarray:
+    """(OLED_HEIGHT, any width) lit-pixel array -> (OLED_PAGES, width) uint8 column bytes, LSB on top."""
+    pixels = np.asarray(pixels) != 0
+    # Rows -> pages of 8, then each column's 8 pixels become one byte
+    return np.packbits(pixels.reshape(OLED_PAGES, 8, -1).transpose(0, 2, 1), axis=2, bitorder='little')[:, :, 0]
+
+def pack_page_bytes_to_7bit_stream(page_bytes) -> bytearray:
+    """
+    Packs column bytes (one byte = 8 vertical pixels of a page, LSB on top) into the Fire's 7-bit stream.
+    Accepts a (pages, columns) array for any OLED window, or a flat sequence of bytes in page-major order.
+    """
+    data = np.asarray(page_bytes, dtype=np.uint8).reshape(-1)
+    num_groups = -(-len(data) // 7)
+    groups = np.zeros((num_groups, 7), dtype=np.uint8); groups.reshape(-1)[:len(data)] = data
+    source_bits = np.unpackbits(groups[:, :, np.newaxis], axis=2, bitorder='little') # (groups, 7 bytes, 8 bits)
+    packed_bits = np.zeros((num_groups, 64), dtype=np.uint8)
+    packed_bits[:, _BIT_TARGET + (_BIT_TARGET // 7)] = source_bits # 7 data bits per output byte, bit 7 stays clear
+    return bytearray(np.packbits(packed_bits.reshape(num_groups, 8, 8), axis=2, bitorder='little').tobytes())
+
+def unpack_7bit_stream_to_page_bytes(packed_stream, num_pages: int = OLED_PAGES, num_columns: int = OLED_WIDTH) -> np.ndarray:
+    """Inverse of pack_page_bytes_to_7bit_stream. Returns a (num_pages, num_columns) uint8 array."""
+    num_bytes = num_pages * num_columns
+    num_groups = -(-num_bytes // 7)
+    packed = np.zeros(num_groups * 8, dtype=np.uint8)
+    src = np.frombuffer(bytes(packed_stream), dtype=np.uint8)[:num_groups * 8]; packed[:len(src)] = src
+    packed_bits = np.unpackbits(packed.reshape(num_groups, 8, 1), axis=2, bitorder='little').reshape(num_groups, 64)
+    source_bits = packed_bits[:, _BIT_TARGET + (_BIT_TARGET // 7)] # (groups, 7 bytes, 8 bits)
+    data = np.packbits(source_bits, axis=2, bitorder='little').reshape(-1)[:num_bytes]
+    return data.reshape(num_pages, num_columns)
+
+STARTUP_ANIMATION_VERSION = 2 # Bump whenever the generator below changes; stale cached assets are then rebuilt
+STARTUP_ANIMATION_SEED = 0xF1E
+STARTUP_ANIMATION_ASSET_FILENAME = "fire_startup_animation.bin"
+# Asset file: magic, generator version (u16), frame count (u16), then the 1176-byte packed frames back to back
+_STARTUP_ANIMATION_ASSET_MAGIC = b"FIREANIM"
+_STARTUP_ANIMATION_ASSET_HEADER = struct.Struct('<HH')
+_STARTUP_ANIMATION_CACHE: dict[tuple[int, int], list[bytearray]] = {}
+_STARTUP_ANIMATION_BUILDS: dict[tuple[int, int], "_StartupAnimationBuild"] = {} # Builds still running
+_STARTUP_ANIMATION_LOCK = threading.Lock()
 
-def generate_fire_startup_animation(width=OLED_WIDTH, height=OLED_HEIGHT) -> list[bytearray]:
-    all_frames_packed = []
+def _fire_startup_animation_bitmaps(width=OLED_WIDTH, height=OLED_HEIGHT):
+    """Yields the (height, width) bool frames of the startup animation: pulse ring, grid build, fizzle/sparkle."""
+    rng = np.random.default_rng(STARTUP_ANIMATION_SEED)
     center_x, center_y = width // 2, height // 2
     num_pulse_frames = 8; max_pulse_radius = min(center_x, center_y) - 2
+    ys, xs = np.ogrid[:height, :width]
+    dist = np.sqrt((xs - center_x) ** 2 + (ys - center_y) ** 2)
     for i in range(num_pulse_frames):
-        logical_pixels = [[False for _ in range(width)] for _ in range(height)]; current_radius = (i + 1) * (max_pulse_radius / num_pulse_frames)
-        for y_p in range(height):
-            for x_p in range(width):
-                dist = math.sqrt((x_p - center_x)**2 + (y_p - center_y)**2)
-                if current_radius - 2 <= dist <= current_radius + 1 : logical_pixels[y_p][x_p] = True
-        def pulse_pixel_on(px,py): return logical_pixels[py][px]
-        all_frames_packed.append(_generate_fire_packed_stream_from_logical_pixels(pulse_pixel_on, width, height))
-    all_frames_packed.append(get_blank_packed_bitmap())
+        current_radius = (i + 1) * (max_pulse_radius / num_pulse_frames)
+        yield (current_radius - 2 <= dist) & (dist <= current_radius + 1)
+    yield np.zeros((height, width), dtype=bool)
     num_grid_expand_frames = 10; num_grid_lines_h, num_grid_lines_v = 3, 5
     for i in range(num_grid_expand_frames):
-        logical_pixels = [[False for _ in range(width)] for _ in range(height)]; progress = (i + 1) / num_grid_expand_frames
-        for x_b in range(width): logical_pixels[0][x_b] = logical_pixels[height-1][x_b] = True
-        for y_b in range(height): logical_pixels[y_b][0] = logical_pixels[y_b][width-1] = True
+        pixels = np.zeros((height, width), dtype=bool); progress = (i + 1) / num_grid_expand_frames
+        pixels[[0, -1], :] = True; pixels[:, [0, -1]] = True
+        current_len_h = int(width * progress); start_x_h = center_x - current_len_h // 2
         for line_idx in range(1, num_grid_lines_h + 1):
-            line_y = int(line_idx * (height / (num_grid_lines_h + 1))); current_len_h = int(width * progress); start_x_h = center_x - current_len_h // 2
-            for x_g in range(start_x_h, start_x_h + current_len_h):
-                if 0 <= x_g < width: logical_pixels[line_y][x_g] = True
+            pixels[int(line_idx * (height / (num_grid_lines_h + 1))), max(0, start_x_h):max(0, start_x_h + current_len_h)] = True
+        current_len_v = int(height * progress); start_y_v = center_y - current_len_v // 2
         for line_idx in range(1, num_grid_lines_v + 1):
-            line_x = int(line_idx * (width / (num_grid_lines_v + 1))); current_len_v = int(height * progress); start_y_v = center_y - current_len_v // 2
-            for y_g in range(start_y_v, start_y_v + current_len_v):
-                if 0 <= y_g < height: logical_pixels[y_g][line_x] = True
-        def grid_pixel_on(px,py): return logical_pixels[py][px]
-        all_frames_packed.append(_generate_fire_packed_stream_from_logical_pixels(grid_pixel_on, width, height))
-    if all_frames_packed:
-        for _ in range(5): all_frames_packed.append(all_frames_packed[-1]) # Hold last grid
-    # Fizzle/Sparkle (simplified for brevity, assuming your original logic is more complex)
-    last_grid_pixels = [[False for _ in range(width)] for _ in range(height)] # Placeholder for last grid
-    if all_frames_packed : # Reconstruct final grid for fizzle base
-        for x_b_f in range(width): last_grid_pixels[0][x_b_f] = last_grid_pixels[height-1][x_b_f] = True
-        for y_b_f in range(height): last_grid_pixels[y_b_f][0] = last_grid_pixels[y_b_f][width-1] = True
-        for line_idx in range(1, num_grid_lines_h + 1):
-            line_y_f = int(line_idx * (height / (num_grid_lines_h + 1)))
-            for x_f in range(width): last_grid_pixels[line_y_f][x_f] = True
-        for line_idx in range(1, num_grid_lines_v + 1):
-            line_x_f = int(line_idx * (width / (num_grid_lines_v + 1)))
-            for y_f in range(height): last_grid_pixels[y_f][line_x_f] = True
-
-    current_fizzle_pixels = [row[:] for row in last_grid_pixels]
+            pixels[max(0, start_y_v):max(0, start_y_v + current_len_v), int(line_idx * (width / (num_grid_lines_v + 1)))] = True
+        yield pixels
+    for _ in range(5): yield pixels # Hold last grid
+    current_fizzle = pixels.copy() # The last grid frame is the full grid
     num_fizzle_frames = 15; num_sparkle_frames = 10; sparkle_density_initial = 0.05
-    for i in range(num_fizzle_frames + num_sparkle_frames):
-        logical_pixels_fizz = [row[:] for row in current_fizzle_pixels]
+    total_frames = num_fizzle_frames + num_sparkle_frames
+    for i in range(total_frames):
         if i < num_fizzle_frames:
-            on_pixels_coords = [(r, c) for r in range(height) for c in range(width) if current_fizzle_pixels[r][c]]
-            fizzle_amount = int(len(on_pixels_coords) * 0.20)
-            for _ in range(fizzle_amount):
-                if not on_pixels_coords: break
-                r_off, c_off = random.choice(on_pixels_coords); current_fizzle_pixels[r_off][c_off] = False
-                logical_pixels_fizz[r_off][c_off] = False; on_pixels_coords.remove((r_off, c_off))
-        current_sparkle_density = sparkle_density_initial * ((num_fizzle_frames + num_sparkle_frames - i) / (num_fizzle_frames + num_sparkle_frames))
+            on_pixels = np.flatnonzero(current_fizzle)
+            current_fizzle.flat[rng.choice(on_pixels, int(on_pixels.size * 0.20), replace=False)] = False
+        frame = current_fizzle.copy()
         if i >= num_fizzle_frames // 3:
-            for r_s in range(height):
-                for c_s in range(width):
-                    if random.random() < current_sparkle_density: logical_pixels_fizz[r_s][c_s] = not logical_pixels_fizz[r_s][c_s]
-        def fizz_pixel_on(px,py): return logical_pixels_fizz[py][px]
-        all_frames_packed.append(_generate_fire_packed_stream_from_logical_pixels(fizz_pixel_on, width, height))
-    all_frames_packed.append(get_blank_packed_bitmap())
-    # print(f"INFO (oled_renderer): Generated {len(all_frames_packed)} frames for new startup animation.")
-    return all_frames_packed
+            frame ^= rng.random((height, width)) < sparkle_density_initial * ((total_frames - i) / total_frames)
+        yield frame
+    yield np.zeros((height, width), dtype=bool)
+
+def _load_startup_animation_asset(path: str) -> list[bytearray] | None:
+    if not path or not os.path.exists(path): return None
+    try:
+        with open(path, 'rb') as f: raw = f.read()
+    except OSError as e:
+        print(f"OLED Renderer: Could not read startup animation cache '{path}': {e}"); return None
+    header_end = len(_STARTUP_ANIMATION_ASSET_MAGIC) + _STARTUP_ANIMATION_ASSET_HEADER.size
+    if not raw.startswith(_STARTUP_ANIMATION_ASSET_MAGIC) or len(raw) < header_end: return None
+    version, frame_count = _STARTUP_ANIMATION_ASSET_HEADER.unpack_from(raw, len(_STARTUP_ANIMATION_ASSET_MAGIC))
+    if version != STARTUP_ANIMATION_VERSION or len(raw) != header_end + frame_count * PACKED_BITMAP_SIZE_BYTES: return None
+    return [bytearray(raw[offset:offset + PACKED_BITMAP_SIZE_BYTES])
+            for offset in range(header_end, len(raw), PACKED_BITMAP_SIZE_BYTES)]
+
+def _save_startup_animation_asset(path: str, frames: list[bytearray]):
+    try:
+        with open(path + ".tmp", 'wb') as f:
+            f.write(_STARTUP_ANIMATION_ASSET_MAGIC)
+            f.write(_STARTUP_ANIMATION_ASSET_HEADER.pack(STARTUP_ANIMATION_VERSION, len(frames)))
+            for frame in frames: f.write(frame)
+        os.replace(path + ".tmp", path)
+    except OSError as e:
+        print(f"OLED Renderer: Could not write startup animation cache '{path}': {e}")
+
+class _StartupAnimationBuild(threading.Thread):
+    """Packs the startup frames on its own thread, then caches them and writes the asset; frames are readable as they appear."""
+    def __init__(self, width: int, height: int, asset_path: str | None):
+        super().__init__(name="FireStartupAnimationBuild", daemon=True)
+        self.key = (width, height)
+        self.asset_path = asset_path
+        self.frames: list[bytearray] = []
+        self.finished = False
+        self._condition = threading.Condition()
+
+    def run(self):
+        complete = False; previous_pixels = None
+        try:
+            for pixels in _fire_startup_animation_bitmaps(*self.key):
+                packed = self.frames[-1] if pixels is previous_pixels else pack_logical_bitmap_to_7bit_stream(pixels) # Held frames repeat
+                if packed is None: break # Not a full-screen size the packer can handle
+                previous_pixels = pixels
+                with self._condition:
+                    self.frames.append(packed); self._condition.notify_all()
+            else: complete = True
+        except Exception as e:
+            print(f"OLED Renderer: Could not generate the startup animation: {e}")
+        with _STARTUP_ANIMATION_LOCK:
+            if complete: _STARTUP_ANIMATION_CACHE[self.key] = self.frames
+            _STARTUP_ANIMATION_BUILDS.pop(self.key, None)
+        with self._condition:
+            self.finished = True; self._condition.notify_all()
+        if complete and self.asset_path: _save_startup_animation_asset(self.asset_path, self.frames)
+
+    def iter_frames(self):
+        """Yields every frame, waiting only when the reader gets ahead of the build."""
+        index = 0
+        while True:
+            with self._condition:
+                while index >= len(self.frames) and not self.finished: self._condition.wait()
+                if index >= len(self.frames): return
+                frame = self.frames[index]
+            index += 1
+            yield frame
+
+def iter_fire_startup_animation(width=OLED_WIDTH, height=OLED_HEIGHT, asset_path: str | None = None):
+    """
+    Iterator over the packed startup animation frames. They come from the in-memory cache, else from the
+    asset at asset_path (if given and built by this generator version), else from a background build that
+    caches them and writes asset_path whether or not the iterator is consumed; playback can start on frame 0
+    while the rest are still being generated.
+    """
+    key = (width, height)
+    with _STARTUP_ANIMATION_LOCK:
+        frames = _STARTUP_ANIMATION_CACHE.get(key)
+        if frames is None and key == (OLED_WIDTH, OLED_HEIGHT) and key not in _STARTUP_ANIMATION_BUILDS:
+            frames = _load_startup_animation_asset(asset_path)
+            if frames is not None: _STARTUP_ANIMATION_CACHE[key] = frames
+        if frames is not None: return iter(frames)
+        build = _STARTUP_ANIMATION_BUILDS.get(key)
+        if build is None:
+            build = _STARTUP_ANIMATION_BUILDS[key] = _StartupAnimationBuild(width, height, asset_path)
+            build.start()
+    return build.iter_frames()
+
+def generate_fire_startup_animation(width=OLED_WIDTH, height=OLED_HEIGHT, asset_path: str | None = None) -> list[bytearray]:
+    return list(iter_fire_startup_animation(width, height, asset_path))
+
+def unpack_7bit_stream_to_logical_bitmap(packed_stream) -> np.ndarray:
+    """Inverse of pack_logical_bitmap_to_7bit_stream: (OLED_HEIGHT, OLED_WIDTH) bool array, True = lit."""
+    pages = unpack_7bit_stream_to_page_bytes(packed_stream)
+    bits = np.unpackbits(pages[:, :, np.newaxis], axis=2, bitorder='little') # (pages, cols, 8 rows)
+    return bits.transpose(0, 2, 1).reshape(OLED_HEIGHT, OLED_WIDTH).astype(bool)
 
 def _unpack_fire_7bit_stream_to_logical_image(packed_stream: bytearray, width: int, height: int) -> Image.Image:
-    logical_image = Image.new('1', (width, height), 0); pixels = logical_image.load()
-    for logical_y in range(height):
-        for logical_x in range(width):
-            fire_global_col_idx = logical_x + width * (logical_y // 8); fire_y_in_page = logical_y % 8
-            k = A_BIT_MUTATE[fire_y_in_page][fire_global_col_idx % 7]
-            packed_group_offset = (fire_global_col_idx // 7) * 8
-            target_byte_offset_in_group = k // 7; target_bit_in_packed_byte = k % 7
-            packed_stream_idx = packed_group_offset + target_byte_offset_in_group
-            if 0 <= packed_stream_idx < len(packed_stream) and (packed_stream[packed_stream_idx] >> target_bit_in_packed_byte) & 1:
-                pixels[logical_x, logical_y] = 1
+    logical_image = Image.fromarray(unpack_7bit_stream_to_logical_bitmap(packed_stream))
+    if (width, height) != (OLED_WIDTH, OLED_HEIGHT): logical_image = logical_image.crop((0, 0, width, height))
     return logical_image
 
 if __name__ == '__main__':
@@ -0,0 +1,70 @@
+# AKAI_Fire_RGB_Controller/tests/test_oled_packing.py
+import os
+import sys
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from oled_utils.oled_renderer import (A_BIT_MUTATE, OLED_HEIGHT, OLED_WIDTH, PACKED_BITMAP_SIZE_BYTES,
+                                      pack_logical_bitmap_to_7bit_stream, unpack_7bit_stream_to_logical_bitmap)
+
+
+def reference_pack(pixels) -> bytearray:
+    """The original per-pixel A_BIT_MUTATE loop the vectorized packer replaced."""
+    packed = bytearray(PACKED_BITMAP_SIZE_BYTES)
+    for y in range(OLED_HEIGHT):
+        for x in range(OLED_WIDTH):
+            if pixels[y][x]:
+                column = x + OLED_WIDTH * (y // 8)
+                k = A_BIT_MUTATE[y % 8][column % 7]
+                index = (column // 7) * 8 + k // 7
+                if 0 <= index < PACKED_BITMAP_SIZE_BYTES:
+                    packed[index] |= 1 << (k % 7)
+    return packed
+
+
+def random_bitmaps(seed: int, count: int = 20):
+    rng = np.random.default_rng(seed)
+    for density in np.linspace(0.0, 1.0, count):
+        yield rng.random((OLED_HEIGHT, OLED_WIDTH)) < density
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_bool_bitmaps_match_reference(seed):
+    for pixels in random_bitmaps(seed):
+        assert pack_logical_bitmap_to_7bit_stream(pixels) == reference_pack(pixels)
+
+
+def test_uint8_bitmaps_match_reference():
+    rng = np.random.default_rng(3)
+    for _ in range(10):
+        pixels = rng.integers(0, 256, (OLED_HEIGHT, OLED_WIDTH), dtype=np.uint8)
+        pixels[rng.random(pixels.shape) < 0.5] = 0
+        assert pack_logical_bitmap_to_7bit_stream(pixels) == reference_pack(pixels != 0)
+
+
+def test_pil_mode_1_images_match_reference():
+    for pixels in random_bitmaps(4, count=10):
+        image = Image.fromarray(pixels.astype(np.uint8) * 255).convert('1')
+        assert pack_logical_bitmap_to_7bit_stream(image) == reference_pack(pixels)
+
+
+def test_packed_stream_layout():
+    packed = pack_logical_bitmap_to_7bit_stream(np.ones((OLED_HEIGHT, OLED_WIDTH), dtype=bool))
+    assert isinstance(packed, bytearray) and len(packed) == PACKED_BITMAP_SIZE_BYTES
+    assert all(byte < 0x80 for byte in packed) # 7-bit SysEx data
+    assert pack_logical_bitmap_to_7bit_stream(np.zeros((OLED_HEIGHT, OLED_WIDTH))) == bytearray(PACKED_BITMAP_SIZE_BYTES)
+
+
+def test_wrong_shape_is_rejected():
+    assert pack_logical_bitmap_to_7bit_stream(np.zeros((OLED_HEIGHT, OLED_WIDTH + 1))) is None
+    assert pack_logical_bitmap_to_7bit_stream(Image.new('1', (OLED_WIDTH, OLED_HEIGHT + 1))) is None
+
+
+@pytest.mark.parametrize("seed", [5, 6])
+def test_round_trip_through_unpacker(seed):
+    for pixels in random_bitmaps(seed):
+        unpacked = unpack_7bit_stream_to_logical_bitmap(pack_logical_bitmap_to_7bit_stream(pixels))
+        assert unpacked.shape == (OLED_HEIGHT, OLED_WIDTH) and unpacked.dtype == bool
+        assert np.array_equal(unpacked, pixels)
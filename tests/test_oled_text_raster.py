@@ -0,0 +1,114 @@
+# AKAI_Fire_RGB_Controller/tests/test_oled_text_raster.py
+import io
+import os
+import sys
+import numpy as np
+import pytest
+from PIL import Image
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyQt6.QtCore import Qt, QBuffer, QIODevice
+from PyQt6.QtGui import QImage, QPainter, QColor, QFont, QFontMetrics, QFontDatabase
+from PyQt6.QtWidgets import QApplication
+from oled_utils.glyph_cache import GlyphCache
+
+OLED_WIDTH, OLED_HEIGHT = 128, 64
+FONTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources", "fonts")
+TEXTS = ["BRI: 87%", "SAMPLING", "VAV! Tj fi gypq", "Hello World 123", "0123456789", "W"]
+
+_app = QApplication.instance() or QApplication([])
+
+
+def _fonts() -> list[QFont]:
+    families = []
+    for name in sorted(os.listdir(FONTS_DIR)) if os.path.isdir(FONTS_DIR) else []:
+        font_id = QFontDatabase.addApplicationFont(os.path.join(FONTS_DIR, name))
+        if font_id >= 0: families.extend(QFontDatabase.applicationFontFamilies(font_id))
+    fonts = []
+    for family, size in [(f, s) for f in families for s in (8, 16)] + [("DejaVu Sans", 14), ("DejaVu Serif", 30), ("Monospace", 9)]:
+        font = QFont(family); font.setPixelSize(size)
+        fonts.append(font)
+    return fonts
+
+
+FONTS = _fonts()
+FONT_IDS = [f"{font.family()}-{font.pixelSize()}" for font in FONTS]
+
+
+def legacy_render(text: str, font: QFont, scrolling: bool = False, offset_x: int = 0) -> np.ndarray:
+    """The original route: Format_Mono QImage -> BMP -> PIL mode '1'."""
+    q_image = QImage(OLED_WIDTH, OLED_HEIGHT, QImage.Format.Format_Mono)
+    q_image.fill(0)
+    painter = QPainter(q_image)
+    painter.setFont(font)
+    painter.setPen(QColor(Qt.GlobalColor.white))
+    fm = QFontMetrics(font)
+    if not scrolling:
+        painter.drawText(q_image.rect(), int(Qt.AlignmentFlag.AlignVCenter), text)
+    else:
+        y_pos = (OLED_HEIGHT - fm.boundingRect(text).height()) // 2 + fm.ascent()
+        painter.drawText(int(offset_x), int(y_pos), text)
+    painter.end()
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    q_image.save(buffer, "BMP")
+    return np.array(Image.open(io.BytesIO(buffer.data())).convert('1'), dtype=bool)
+
+
+@pytest.mark.parametrize("font", FONTS, ids=FONT_IDS)
+def test_glyph_compose_matches_legacy_route(font):
+    cache = GlyphCache(font)
+    composed = 0
+    for text in TEXTS:
+        pixels = cache.compose(text)
+        if pixels is None: continue # Kerned / shaped strings fall back to the full raster
+        composed += 1
+        assert np.array_equal(pixels, legacy_render(text, font)), text
+    assert composed or not any(cache.can_compose(text) for text in TEXTS)
+
+
+def test_glyph_compose_covers_plain_strings():
+    font = QFont("Monospace"); font.setPixelSize(9)
+    assert GlyphCache(font).compose("0123456789") is not None
+
+
+
+@pytest.fixture
+def display_manager():
+    from managers.oled_display_manager import OLEDDisplayManager
+    manager = OLEDDisplayManager(None, [])
+    frames = []
+    manager.request_send_bitmap_to_fire.connect(lambda packed: frames.append(bytes(packed)))
+    yield manager, frames
+    manager.stop_all_activity()
+
+
+def rendered_pixels(manager, frames, text, font, scrolling=False, offset_x=0) -> np.ndarray:
+    from oled_utils.oled_renderer import unpack_7bit_stream_to_logical_bitmap
+    manager._text_is_scrolling = scrolling
+    frames.clear()
+    manager._render_text_frame(text, font, "left", offset_x)
+    assert len(frames) == 1
+    return unpack_7bit_stream_to_logical_bitmap(frames[0])
+
+
+@pytest.mark.parametrize("font", FONTS, ids=FONT_IDS)
+def test_render_text_frame_matches_legacy_route(display_manager, font):
+    manager, frames = display_manager
+    for text in TEXTS: # Glyph composition where it applies, the canvas raster otherwise
+        assert np.array_equal(rendered_pixels(manager, frames, text, font), legacy_render(text, font)), text
+
+
+@pytest.mark.parametrize("font", FONTS, ids=FONT_IDS)
+def test_canvas_raster_matches_legacy_route(display_manager, font, monkeypatch):
+    import managers.oled_display_manager as odm_module
+    class NoGlyphs:
+        def compose(self, text): return None
+    monkeypatch.setattr(odm_module, "get_glyph_cache", lambda font: NoGlyphs())
+    manager, frames = display_manager
+    for text in TEXTS:
+        assert np.array_equal(rendered_pixels(manager, frames, text, font), legacy_render(text, font)), text
+        for offset_x in (0, 5, -17, 100): # Scrolling positions, drawn at a pen position instead of a rect
+            assert np.array_equal(rendered_pixels(manager, frames, text, font, True, offset_x),
+                                  legacy_render(text, font, True, offset_x)), (text, offset_x)
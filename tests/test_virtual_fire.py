@@ -0,0 +1,238 @@
+# AKAI_Fire_RGB_Controller/tests/test_virtual_fire.py
+import json
+import os
+import sys
+import time
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyQt6.QtWidgets import QApplication
+from hardware.akai_fire_controller import AkaiFireController, FIRE_PAD_NOTE_OFFSET
+from hardware.virtual_fire import VirtualFireDevice, MESSAGE_KIND_PAD_SYSEX, MESSAGE_KIND_OLED_SYSEX
+from hardware.output_frame_scheduler import OutputFrameScheduler, CHANNEL_MESSAGES, CHANNEL_PADS, CHANNEL_OLED
+from hardware.link_congestion import (LinkCongestionDetector, CLEAR_WINDOWS_BEFORE_RECOVERY, MIN_RATE_SCALE,
+                                      RATE_DECREASE_FACTOR, RATE_INCREASE_STEP)
+from hardware.midi_capture import MidiCaptureWriter, read_capture, DIRECTION_IN, DIRECTION_OUT
+from oled_utils.oled_frame import PackedOLEDFrame, pack_item_frames_for_save, unpack_item_frames, ITEM_FRAMES_LOGICAL_KEY
+from oled_utils.oled_renderer import pack_logical_bitmap_to_7bit_stream
+
+_app = QApplication.instance() or QApplication([])
+OLED_FULL_SYSEX_BYTES = 4 + 3 + 4 + 1176 + 1
+
+
+@pytest.fixture
+def fire():
+    device = VirtualFireDevice()
+    controller = AkaiFireController(auto_connect=False)
+    controller.connect_backend(device)
+    assert controller.flush_output()
+    device.clear_message_log()
+    yield controller, device
+    controller.disconnect()
+
+
+def random_pads(seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, 256, (4, 16, 3), dtype=np.uint8)
+
+
+def random_bitmap(seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).random((64, 128)) < 0.3
+
+
+def sent_sizes(device, kind: str) -> list[int]:
+    return [size for _, logged_kind, size in device.message_log if logged_kind == kind]
+
+
+# --- Pads (shadow diffing) ---
+def test_pad_frame_reaches_device(fire):
+    controller, device = fire
+    frame = random_pads(0)
+    controller.set_pads_from_array(frame, bypass_global_brightness=True)
+    assert controller.flush_output()
+    assert np.array_equal(device.get_pad_colors_7bit(), frame >> 1)
+
+
+def test_only_changed_pads_are_sent(fire):
+    controller, device = fire
+    frame = random_pads(1)
+    controller.set_pads_from_array(frame, bypass_global_brightness=True); controller.flush_output()
+    device.clear_message_log()
+    controller.set_pads_from_array(frame, bypass_global_brightness=True); controller.flush_output()
+    assert device.message_counts[MESSAGE_KIND_PAD_SYSEX] == 0 # Same frame: nothing to send
+    frame = frame.copy(); frame[0, 0] ^= 0xFE; frame[2, 5] ^= 0xFE; frame[3, 15] ^= 0xFE
+    controller.set_pads_from_array(frame, bypass_global_brightness=True); controller.flush_output()
+    assert sent_sizes(device, MESSAGE_KIND_PAD_SYSEX) == [4 + 3 + 3 * 4 + 1] # Three (idx, r, g, b) entries
+    assert np.array_equal(device.get_pad_colors_7bit(), frame >> 1)
+
+
+def test_invalidated_pad_cache_resends_everything(fire):
+    controller, device = fire
+    frame = random_pads(2)
+    controller.set_pads_from_array(frame, bypass_global_brightness=True); controller.flush_output()
+    device.clear_message_log()
+    controller.invalidate_pad_cache()
+    controller.set_pads_from_array(frame, bypass_global_brightness=True); controller.flush_output()
+    assert sent_sizes(device, MESSAGE_KIND_PAD_SYSEX) == [4 + 3 + 64 * 4 + 1]
+
+
+# --- OLED (changed window, duplicate frames) ---
+def test_oled_frame_reaches_device(fire):
+    controller, device = fire
+    bitmap = random_bitmap(3)
+    controller.oled_send_full_bitmap(pack_logical_bitmap_to_7bit_stream(bitmap)); controller.flush_output()
+    assert np.array_equal(device.get_oled_bitmap(), bitmap)
+
+
+def test_oled_sends_only_the_changed_window(fire):
+    controller, device = fire
+    bitmap = random_bitmap(4)
+    controller.oled_send_full_bitmap(pack_logical_bitmap_to_7bit_stream(bitmap)); controller.flush_output()
+    assert sent_sizes(device, MESSAGE_KIND_OLED_SYSEX) == [OLED_FULL_SYSEX_BYTES] # First frame: whole screen
+    device.clear_message_log()
+    bitmap = bitmap.copy(); bitmap[10:13, 40:51] = ~bitmap[10:13, 40:51] # One page band, 11 columns
+    controller.oled_send_full_bitmap(pack_logical_bitmap_to_7bit_stream(bitmap)); controller.flush_output()
+    sizes = sent_sizes(device, MESSAGE_KIND_OLED_SYSEX)
+    assert len(sizes) == 1 and sizes[0] < 40
+    assert np.array_equal(device.get_oled_bitmap(), bitmap)
+
+
+def test_duplicate_oled_frames_are_skipped(fire):
+    controller, device = fire
+    packed = pack_logical_bitmap_to_7bit_stream(random_bitmap(5))
+    for _ in range(3): controller.oled_send_full_bitmap(packed)
+    controller.flush_output()
+    assert device.message_counts[MESSAGE_KIND_OLED_SYSEX] == 1
+    assert controller.get_oled_frames_skipped() == 2
+
+
+# --- Output scheduler ---
+def test_scheduler_is_unlimited_by_default():
+    assert OutputFrameScheduler().get_settings() == {'pad_max_fps': 0.0, 'oled_max_fps': 0.0, 'max_bytes_per_s': 0.0}
+
+
+def test_scheduler_fps_cap_and_priorities():
+    scheduler = OutputFrameScheduler(pad_max_fps=10, oled_max_fps=0, max_bytes_per_s=0)
+    now = time.monotonic()
+    assert scheduler.next_channel(True, True, True, now) == (CHANNEL_MESSAGES, 0.0)
+    assert scheduler.next_channel(False, True, True, now) == (CHANNEL_PADS, 0.0)
+    scheduler.on_sent(CHANNEL_PADS, 100, now)
+    assert scheduler.next_channel(False, True, True, now) == (CHANNEL_OLED, 0.0) # Pads capped, OLED is not
+    channel, wait_s = scheduler.next_channel(False, True, False, now + 0.02)
+    assert channel is None and wait_s == pytest.approx(0.03) # First frame after idle: catch-up at twice the cap
+    assert scheduler.next_channel(False, True, False, now + 0.051) == (CHANNEL_PADS, 0.0)
+    scheduler.on_sent(CHANNEL_PADS, 100, now + 0.05)
+    channel, wait_s = scheduler.next_channel(False, True, False, now + 0.1)
+    assert channel is None and wait_s == pytest.approx(0.05) # Then a steady 10 fps cadence
+    assert scheduler.next_channel(False, True, False, now + 0.151) == (CHANNEL_PADS, 0.0)
+    assert scheduler.next_channel(False, False, False, now + 0.1) == (None, 0.0)
+
+
+def test_scheduler_token_bucket():
+    scheduler = OutputFrameScheduler(pad_max_fps=0, oled_max_fps=0, max_bytes_per_s=10_000)
+    now = time.monotonic()
+    scheduler.on_sent(CHANNEL_OLED, 1200 + 1000, now) # Burst allowance is 1200 bytes, so 1000 bytes in debt
+    channel, wait_s = scheduler.next_channel(True, False, False, now)
+    assert channel is None and wait_s == pytest.approx(0.1, abs=0.001)
+    assert scheduler.next_channel(True, False, False, now + 0.101)[0] == CHANNEL_MESSAGES
+
+
+def test_pad_fps_cap_coalesces_to_the_newest_frame(fire):
+    controller, device = fire
+    controller.configure_output_scheduler(pad_max_fps=5)
+    try:
+        for seed in range(10): controller.set_pads_from_array(random_pads(10 + seed), bypass_global_brightness=True)
+        assert controller.flush_output(2000)
+    finally:
+        controller.configure_output_scheduler(pad_max_fps=0)
+    assert device.message_counts[MESSAGE_KIND_PAD_SYSEX] <= 2
+    assert np.array_equal(device.get_pad_colors_7bit(), random_pads(19) >> 1)
+
+
+# --- Link congestion (AIMD) ---
+def test_congestion_detector_backs_off_and_recovers():
+    detector = LinkCongestionDetector()
+    assert not detector.update(0.0, 0, now=0.0) # First sample only sets the baseline
+    busy = 0.0
+    for window in range(1, 6): # Send() blocked for 90% of every window
+        busy += 0.9
+        detector.update(busy, 0, now=float(window))
+        assert detector.congested
+        assert detector.rate_scale == pytest.approx(max(MIN_RATE_SCALE, RATE_DECREASE_FACTOR ** window))
+    scale = detector.rate_scale
+    for window in range(6, 6 + CLEAR_WINDOWS_BEFORE_RECOVERY): detector.update(busy, 0, now=float(window))
+    assert not detector.congested and detector.rate_scale == pytest.approx(scale + RATE_INCREASE_STEP)
+
+
+def test_slow_link_is_reported_as_congested():
+    device = VirtualFireDevice(bandwidth_bytes_per_s=31_250) # DIN MIDI speed: ~50 ms per full OLED frame
+    controller = AkaiFireController(auto_connect=False)
+    controller.connect_backend(device)
+    try:
+        controller._check_link_congestion() # Baseline sample
+        for seed in range(6):
+            controller.oled_send_full_bitmap(pack_logical_bitmap_to_7bit_stream(random_bitmap(20 + seed)))
+            time.sleep(0.06)
+        controller._check_link_congestion()
+        assert controller.is_link_congested() and controller.get_output_rate_scale() < 1.0
+    finally:
+        controller.disconnect()
+
+
+# --- Capture ---
+def test_capture_writer_round_trip(tmp_path):
+    path = str(tmp_path / "round_trip.firecap")
+    messages = [(DIRECTION_OUT, bytes([0xB0, 0x1B, 0x10])), (DIRECTION_IN, bytes([0x90, 0x36, 0x64])),
+                (DIRECTION_OUT, bytes([0xF0]) + bytes(range(100)) + bytes([0xF7]))]
+    writer = MidiCaptureWriter(path)
+    for direction, data in messages: writer.record(direction, data)
+    writer.close()
+    records = read_capture(path)
+    assert [(direction, data) for _, direction, data in records] == messages
+    assert records[0][0] == 0.0 and all(a[0] <= b[0] for a, b in zip(records, records[1:]))
+
+
+def test_controller_capture_matches_device_traffic(fire, tmp_path):
+    controller, device = fire
+    path = str(tmp_path / "session.firecap")
+    assert controller.start_capture(path)
+    controller.set_pads_from_array(random_pads(30), bypass_global_brightness=True)
+    controller.oled_send_full_bitmap(pack_logical_bitmap_to_7bit_stream(random_bitmap(31)))
+    device.press_pad(1, 2)
+    controller.flush_output()
+    recorded = controller.stop_capture()
+    records = read_capture(path)
+    assert len(records) == recorded
+    assert [len(data) for _, direction, data in records if direction == DIRECTION_OUT] == [size for _, _, size in device.message_log]
+    assert [data for _, direction, data in records if direction == DIRECTION_IN] == [bytes([0x90, FIRE_PAD_NOTE_OFFSET + 18, 100])]
+
+
+# --- PackedOLEDFrame ---
+def test_packed_frame_round_trips():
+    bitmap = random_bitmap(40)
+    frame = PackedOLEDFrame.from_bitmap(bitmap)
+    assert np.array_equal(frame.to_bitmap(), bitmap)
+    assert PackedOLEDFrame.from_b64(frame.to_b64()) == frame
+    assert PackedOLEDFrame.from_pil_image(frame.to_pil_image()) == frame
+    rows = frame.to_string_rows()
+    assert len(rows) == 64 and rows[7] == "".join('1' if lit else '0' for lit in bitmap[7])
+    assert PackedOLEDFrame.from_string_rows(rows) == frame
+    assert list(frame) == rows and frame[7] == rows[7] and frame[2:4] == rows[2:4]
+
+
+def test_item_frames_survive_save_and_load():
+    frames = [PackedOLEDFrame.from_bitmap(random_bitmap(50 + i)) for i in range(3)]
+    item = {"item_name": "test", "item_type": "image_animation",
+            ITEM_FRAMES_LOGICAL_KEY: [frames[0], frames[1].to_string_rows(), frames[2]]} # Mixed in-memory formats
+    loaded = unpack_item_frames(json.loads(json.dumps(pack_item_frames_for_save(item))))
+    assert loaded[ITEM_FRAMES_LOGICAL_KEY] == frames
+    legacy = unpack_item_frames({"item_name": "legacy", ITEM_FRAMES_LOGICAL_KEY: [frames[0].to_string_rows(), ["bad"]]})
+    assert legacy[ITEM_FRAMES_LOGICAL_KEY] == [frames[0], PackedOLEDFrame(bytes(1024))] # Bad frame: blank, index kept
+
+
+def test_packed_frame_drives_the_device_oled(fire):
+    controller, device = fire
+    frame = PackedOLEDFrame.from_bitmap(random_bitmap(60))
+    controller.oled_send_full_bitmap(pack_logical_bitmap_to_7bit_stream(frame.to_bitmap())); controller.flush_output()
+    assert np.array_equal(device.get_oled_bitmap(), frame.to_bitmap())